@@ -0,0 +1,113 @@
+"""
+Benchmark of the ENTSOE day-ahead spot price reads.
+
+Compares reading a year of prices from the monthly csv files (see
+Entsoe.read_day_ahead_spot_prices_from_file()) with reading them from the Parquet dataset
+created by Entsoe.ingest_day_ahead_spot_prices_file() (see
+Entsoe.read_day_ahead_spot_prices_from_dataset()), on synthetic files with 15-minute prices of
+many bidding zones.
+
+Usage:
+    poetry run python benchmarks/bench_entsoe_dataset.py --zones 60
+"""
+
+# Python built-in packages
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Third-party packages
+import numpy as np
+import pandas as pd
+
+# Internal modules
+from detquantlib.data import Entsoe
+
+YEAR = 2024
+TIMEZONE = "Europe/Amsterdam"
+
+
+def make_synthetic_files(folder_dir: Path, nr_zones: int):
+    """
+    Creates synthetic monthly price data files, in the format of the ENTSOE SFTP server.
+
+    Args:
+        folder_dir: Local directory where the files are created
+        nr_zones: Number of bidding zones
+    """
+    map_codes = [f"Z{i:03d}" for i in range(nr_zones)]
+    rng = np.random.default_rng(0)
+    for month in range(1, 13):
+        start = pd.Timestamp(YEAR, month, 1)
+        dates = pd.date_range(start, start + pd.offsets.MonthBegin(1), freq="15min")[:-1]
+        dates_str = dates.strftime("%Y-%m-%d %H:%M:%S")
+        df = pd.DataFrame(
+            {
+                "DateTime(UTC)": np.tile(dates_str, nr_zones),
+                "ResolutionCode": "PT15M",
+                "AreaCode": np.repeat(map_codes, len(dates)),
+                "MapCode": np.repeat(map_codes, len(dates)),
+                "Price[Currency/MWh]": rng.normal(80, 20, len(dates) * nr_zones).round(2),
+                "Currency": "EUR",
+                "UpdateTime(UTC)": "2024-01-01 00:00:00",
+            }
+        )
+        filename = Entsoe.get_sftp_filename_day_ahead_spot_prices(year=YEAR, month=month)
+        df.to_csv(folder_dir.joinpath(filename), sep="\t", index=False)
+
+
+def read_from_files(folder_dir: Path, countries: list) -> pd.DataFrame:
+    dfs = [
+        Entsoe.read_day_ahead_spot_prices_from_file(countries, TIMEZONE, YEAR, m, str(folder_dir))
+        for m in range(1, 13)
+    ]
+    return pd.concat(dfs, ignore_index=True)
+
+
+def read_from_dataset(dataset_dir: Path, countries: list) -> pd.DataFrame:
+    return Entsoe.read_day_ahead_spot_prices_from_dataset(
+        countries, TIMEZONE, datetime(YEAR, 1, 1), datetime(YEAR + 1, 1, 1), str(dataset_dir)
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--zones", type=int, default=60, help="Number of bidding zones")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        folder_dir = Path(tmp_dir).joinpath("csv")
+        dataset_dir = Path(tmp_dir).joinpath("dataset")
+        folder_dir.mkdir()
+        make_synthetic_files(folder_dir, args.zones)
+
+        start = time.perf_counter()
+        for month in range(1, 13):
+            Entsoe.ingest_day_ahead_spot_prices_file(
+                YEAR, month, str(folder_dir), str(dataset_dir)
+            )
+        elapsed_ingest = time.perf_counter() - start
+
+        print(f"Zones: {args.zones}")
+        print(f"Ingestion of 12 monthly files: {elapsed_ingest:.3f} s")
+        for nr_countries in [1, 5]:
+            countries = [f"Z{i:03d}" for i in range(nr_countries)]
+
+            start = time.perf_counter()
+            read_from_files(folder_dir, countries)
+            elapsed_csv = time.perf_counter() - start
+
+            start = time.perf_counter()
+            read_from_dataset(dataset_dir, countries)
+            elapsed_parquet = time.perf_counter() - start
+
+            print(f"Countries: {nr_countries}")
+            print(f"  Csv files:       {elapsed_csv:8.3f} s")
+            print(f"  Parquet dataset: {elapsed_parquet:8.3f} s")
+            print(f"  Speed-up:        {elapsed_csv / elapsed_parquet:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Benchmark of the DetDatabase fetch backends ("pandas" and "arrow").
+
+Pulls a synthetic futures settlement price table from a local SQLite database with each fetch
+backend, and reports the wall time and the peak resident memory of the process. Each backend
+runs in a separate process, such that peak memory measurements do not interfere.
+
+Usage:
+    poetry run python benchmarks/bench_fetch_backends.py --rows 5000000
+"""
+
+# Python built-in packages
+import argparse
+import multiprocessing
+import os
+import resource
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+# Third-party packages
+from sqlalchemy import create_engine
+
+# Internal modules
+from detquantlib.data.databases.detdatabase import DetDatabase
+
+QUERY = "SELECT * FROM futures"
+
+
+def create_futures_table(db_dir: Path, nr_rows: int):
+    """
+    Creates a SQLite database containing synthetic futures settlement prices.
+
+    Args:
+        db_dir: Directory of the SQLite database file
+        nr_rows: Number of rows
+    """
+    with sqlite3.connect(db_dir) as conn:
+        conn.execute(
+            "CREATE TABLE futures (TradingDate DATE, CommodityName TEXT, Tenor TEXT, "
+            "DeliveryType TEXT, DeliveryStart DATE, DeliveryEnd DATE, Price REAL, "
+            "InsertionTimestamp TIMESTAMP)"
+        )
+        conn.execute(f"""
+            WITH RECURSIVE seq(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM seq WHERE i < {nr_rows - 1})
+            INSERT INTO futures
+            SELECT
+                date('2010-01-01', '+' || (i / 100) || ' days'),
+                'DutchPower',
+                CASE i % 3 WHEN 0 THEN 'Month' WHEN 1 THEN 'Quarter' ELSE 'Year' END,
+                'Base',
+                date('2010-01-01', '+' || (i % 100) || ' months'),
+                date('2010-01-01', '+' || (i % 100 + 1) || ' months'),
+                50.0 + (i % 1000) / 10.0,
+                datetime('2010-01-01 18:00:00', '+' || (i / 100) || ' days')
+            FROM seq
+            """)
+
+
+def run_backend(db_dir: str, fetch_backend: str, queue: multiprocessing.Queue):
+    """
+    Queries the full futures table with a given fetch backend (executed in a child process).
+
+    Args:
+        db_dir: Directory of the SQLite database file
+        fetch_backend: DetDatabase fetch backend
+        queue: Queue used to send the results back to the parent process
+    """
+    for name in ["DET_DB_NAME", "DET_DB_SERVER", "DET_DB_USERNAME", "DET_DB_PASSWORD"]:
+        os.environ.setdefault(name, "benchmark")
+    engine = create_engine(
+        f"sqlite:///{db_dir}", connect_args=dict(detect_types=sqlite3.PARSE_DECLTYPES)
+    )
+    db = DetDatabase(engine=engine, fetch_backend=fetch_backend)
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    df = db.query_db(QUERY)
+    elapsed = time.perf_counter() - start
+    rss_peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # ru_maxrss is expressed in kilobytes on Linux
+    queue.put(
+        dict(
+            rows=df.shape[0],
+            elapsed=elapsed,
+            peak_mb=(rss_peak - rss_before) / 1024,
+            frame_mb=df.memory_usage(deep=True).sum() / 1024**2,
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Number of rows")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_dir = str(Path(tmp_dir).joinpath("futures.db"))
+        create_futures_table(Path(db_dir), args.rows)
+
+        ctx = multiprocessing.get_context("spawn")
+        for fetch_backend in ["pandas", "arrow"]:
+            queue = ctx.Queue()
+            process = ctx.Process(target=run_backend, args=(db_dir, fetch_backend, queue))
+            process.start()
+            res = queue.get()
+            process.join()
+            print(
+                f"{fetch_backend:>6}: {res['rows']:,} rows in {res['elapsed']:7.2f} s, "
+                f"peak memory increase {res['peak_mb']:8.1f} MB, "
+                f"dataframe size {res['frame_mb']:8.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark of the DetDatabase loaders, measuring the end-to-end throughput (query, data transfer
+and post-processing) of each loader against a local SQLite stand-in database (see
+LocalDatabase class).
+
+Each loader fetches the full history of one commodity (or client/profile), from tables seeded
+with a given number of rows. The seeded databases are kept in the folder
+'Cache/Benchmarks/LocalDatabase', such that they are only created once per table size.
+
+Usage:
+    poetry run python benchmarks/bench_loaders.py --rows 10000 1000000 10000000
+"""
+
+# Python built-in packages
+import argparse
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Internal modules
+from detquantlib.data import DetDatabase, LocalDatabase
+
+CACHE_DIR = Path.cwd().joinpath("Cache", "Benchmarks", "LocalDatabase")
+START_DATE = datetime(2000, 1, 1)
+END_DATE = datetime(2262, 1, 1)
+
+LOADERS = dict(
+    entsoe_day_ahead_spot_prices=(
+        "load_entsoe_day_ahead_spot_prices",
+        dict(
+            commodity_name="DutchPower", start_delivery_date=START_DATE, end_delivery_date=END_DATE
+        ),
+    ),
+    entsoe_imbalance_prices=(
+        "load_entsoe_imbalance_prices",
+        dict(
+            commodity_name="DutchPower", start_delivery_date=START_DATE, end_delivery_date=END_DATE
+        ),
+    ),
+    futures_eod_settlement_prices=(
+        "load_futures_eod_settlement_prices",
+        dict(
+            commodity_name="DutchPower",
+            start_trading_date=START_DATE,
+            end_trading_date=END_DATE,
+            tenors=["Month", "Quarter", "Year"],
+            delivery_type="Base",
+            timezone_aware_dates=True,
+        ),
+    ),
+    eex_eod_prices=(
+        "load_eex_eod_prices",
+        dict(product_code="Q0BM", start_trading_date=START_DATE, end_trading_date=END_DATE),
+    ),
+    account_positions=(
+        "load_account_positions",
+        dict(start_trading_date=START_DATE, end_trading_date=END_DATE),
+    ),
+    forecast_customer_volume=(
+        "load_forecast_customer_volume",
+        dict(
+            profile="Portfolio",
+            forecast_date=datetime(2000, 1, 1),
+            start_delivery_date=START_DATE,
+            end_delivery_date=datetime(2000, 1, 3),
+            local_timezone="Europe/Amsterdam",
+        ),
+    ),
+    customer_day_ahead_auction_bids=(
+        "load_customer_day_ahead_auction_bids",
+        dict(
+            client_id=1,
+            start_delivery_date=START_DATE,
+            end_delivery_date=END_DATE,
+            local_timezone="Europe/Amsterdam",
+        ),
+    ),
+)
+
+
+def run_loader(db: DetDatabase, loader: str, rounds: int) -> tuple[int, float]:
+    """
+    Runs a loader multiple times and measures its mean wall time.
+
+    Args:
+        db: Instance of the DetDatabase class
+        loader: Key of the LOADERS dictionary
+        rounds: Number of times the loader is run
+
+    Returns:
+        Number of rows returned by the loader, and mean wall time (in seconds)
+    """
+    method_name, kwargs = LOADERS[loader]
+    method = getattr(db, method_name)
+    elapsed = list()
+    for _ in range(rounds):
+        start = time.perf_counter()
+        df = method(**kwargs)
+        elapsed.append(time.perf_counter() - start)
+    return df.shape[0], sum(elapsed) / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--rows", type=int, nargs="+", default=[10_000], help="Numbers of rows of the tables"
+    )
+    parser.add_argument("--rounds", type=int, default=3, help="Number of runs per loader")
+    args = parser.parse_args()
+
+    for nr_rows in args.rows:
+        db_dir = CACHE_DIR.joinpath(f"det_{nr_rows}.db")
+        seeded = db_dir.is_file()
+        local_db = LocalDatabase(db_dir)
+        if not seeded:
+            local_db.seed(nr_rows=nr_rows)
+        db = local_db.create_det_database()
+
+        print(f"Table size: {nr_rows:,} rows")
+        for loader in LOADERS:
+            rows, elapsed = run_loader(db, loader, args.rounds)
+            print(
+                f"  {loader:<32}: {rows:>12,} rows in {elapsed:8.3f} s "
+                f"({rows / elapsed:>14,.0f} rows/s)"
+            )
+        local_db.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark of DetDatabase.process_day_ahead_spot_prices().
+
+Compares the throughput (rows per second) of the legacy row-by-row implementation with the
+current columnar implementation, on synthetic 15-minute day-ahead spot price data.
+
+Usage:
+    poetry run python benchmarks/bench_process_day_ahead_spot_prices.py --rows 1000000
+"""
+
+# Python built-in packages
+import argparse
+import time
+
+# Third-party packages
+import numpy as np
+import pandas as pd
+from dateutil.relativedelta import relativedelta
+
+# Internal modules
+from detquantlib.data.databases.detdatabase import DetDatabase
+
+TIMEZONE = "Europe/Amsterdam"
+
+
+def make_synthetic_prices(nr_rows: int) -> pd.DataFrame:
+    """
+    Creates synthetic day-ahead spot prices, in the format returned by
+    DetDatabase.load_entsoe_day_ahead_spot_prices() (before processing).
+
+    Args:
+        nr_rows: Number of rows
+
+    Returns:
+        Dataframe containing synthetic day-ahead spot prices
+    """
+    dates_utc = pd.date_range("2015-01-01", periods=nr_rows, freq="15min", tz="UTC")
+    dates_local = dates_utc.tz_convert(TIMEZONE).tz_localize(None)
+    df = pd.DataFrame(
+        {
+            "DateTime(UTC)": dates_utc.tz_localize(None),
+            f"DateTime({TIMEZONE})": dates_local,
+            "ResolutionCode": np.where(np.arange(nr_rows) % 2 == 0, "PT15M", "PT60M"),
+            "MapCode": "NL",
+            "Price(Currency/MWh)": np.random.default_rng(0).normal(80, 20, nr_rows),
+            "Currency": "EUR",
+        }
+    )
+    return df
+
+
+def process_day_ahead_spot_prices_legacy(
+    df_in: pd.DataFrame, commodity_name: str, timezone: str
+) -> pd.DataFrame:
+    """
+    Legacy row-by-row implementation of DetDatabase.process_day_ahead_spot_prices(), kept as a
+    reference for the benchmark.
+
+    Args:
+        df_in: Dataframe containing day-ahead spot prices
+        commodity_name: Commodity name
+        timezone: Timezone of the power country/region
+
+    Returns:
+        Processed dataframe containing day-ahead spot prices
+
+    Raises:
+        ValueError: Raises an error if the resolution code is not supported.
+    """
+    df_in.reset_index(drop=True, inplace=True)
+    df_out = pd.DataFrame()
+    df_out["CommodityName"] = [commodity_name] * df_in.shape[0]
+    col_date = f"DateTime({timezone})"
+    trading_date = [d.normalize() - relativedelta(days=1) for d in df_in[col_date]]
+    df_out["TradingDate"] = trading_date
+    df_out["DeliveryStart"] = df_in[col_date]
+    delivery_end = list()
+    for i in df_in.index:
+        start_date = df_out.loc[i, "DeliveryStart"]
+        offset = df_in.loc[i, "ResolutionCode"]
+        match offset:
+            case "PT60M":
+                offset = 60
+            case "PT15M":
+                offset = 15
+            case _:
+                raise ValueError("Resolution not supported.")
+        end_date = start_date + relativedelta(minutes=offset)
+        delivery_end.append(end_date)
+    df_out["DeliveryEnd"] = delivery_end
+    df_out["Tenor"] = "Spot"
+    df_out["Price"] = df_in["Price(Currency/MWh)"].values
+    return df_out
+
+
+def time_function(func, df: pd.DataFrame) -> tuple[float, pd.DataFrame]:
+    """
+    Times a single call of a processing function.
+
+    Args:
+        func: Processing function
+        df: Input dataframe (a copy is passed to the function)
+
+    Returns:
+        Elapsed time in seconds, and the function's output
+    """
+    df = df.copy()
+    start = time.perf_counter()
+    df_out = func(df, "DutchPower", TIMEZONE)
+    elapsed = time.perf_counter() - start
+    return elapsed, df_out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of rows")
+    args = parser.parse_args()
+
+    df = make_synthetic_prices(args.rows)
+
+    elapsed_legacy, df_legacy = time_function(process_day_ahead_spot_prices_legacy, df)
+    elapsed_new, df_new = time_function(DetDatabase.process_day_ahead_spot_prices, df)
+
+    # The columnar implementation must reproduce the legacy output exactly
+    pd.testing.assert_frame_equal(df_new, df_legacy)
+
+    print(f"Rows: {args.rows:,}")
+    print(f"Legacy:   {elapsed_legacy:8.3f} s  ({args.rows / elapsed_legacy:>14,.0f} rows/s)")
+    print(f"Columnar: {elapsed_new:8.3f} s  ({args.rows / elapsed_new:>14,.0f} rows/s)")
+    print(f"Speed-up: {elapsed_legacy / elapsed_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
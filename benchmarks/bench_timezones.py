@@ -0,0 +1,144 @@
+"""
+Benchmark of the timezone conversion of the DetDatabase loaders.
+
+Compares the legacy per-column conversion loop (datetime conversion, UTC localization,
+timezone conversion and removal of the timezone, for each date column) with the column-batch
+conversion of detquantlib.dates.convert_timezones(), on synthetic 1-minute customer volume
+forecasts. Reports the duration and the peak memory allocated by each implementation (which
+measures the number of intermediate copies of the date columns).
+
+Usage:
+    poetry run python benchmarks/bench_timezones.py --rows 10000000
+"""
+
+# Python built-in packages
+import argparse
+import time
+import tracemalloc
+
+# Third-party packages
+import numpy as np
+import pandas as pd
+
+# Internal modules
+from detquantlib.dates import convert_timezones
+
+TIMEZONE = "Europe/Amsterdam"
+
+
+def make_synthetic_forecasts(nr_rows: int) -> pd.DataFrame:
+    """
+    Creates synthetic customer volume forecasts, in the format returned by the database.
+
+    Args:
+        nr_rows: Number of rows
+
+    Returns:
+        Dataframe containing synthetic customer volume forecasts
+    """
+    dates = pd.date_range("2000-01-01", periods=nr_rows, freq="min")
+    df = pd.DataFrame(
+        {
+            "ForecastDate": dates.floor("D"),
+            "Datetime": dates,
+            "InsertionTimestamp": dates.floor("D") + pd.Timedelta(hours=6),
+            "kWh": np.random.default_rng(0).normal(1000, 100, nr_rows),
+        }
+    )
+    return df
+
+
+def convert_dates_legacy(df: pd.DataFrame, timezone_aware_dates: bool) -> pd.DataFrame:
+    """
+    Legacy per-column timezone conversion of the customer volume forecast loader, kept as a
+    reference for the benchmark.
+
+    Args:
+        df: Raw customer volume forecasts
+        timezone_aware_dates: If true, returns timezone-aware dates
+
+    Returns:
+        Customer volume forecasts with converted dates
+    """
+    for c in ["ForecastDate", "Datetime", "InsertionTimestamp"]:
+        df[c] = pd.DatetimeIndex(df[c])
+        if c == "ForecastDate":
+            df[c] = df[c].dt.tz_localize(TIMEZONE)
+        else:
+            df[c] = df[c].dt.tz_localize("UTC")
+            df[c] = df[c].dt.tz_convert(TIMEZONE)
+        if not timezone_aware_dates:
+            df[c] = df[c].dt.tz_localize(None)
+    return df
+
+
+def convert_dates(df: pd.DataFrame, timezone_aware_dates: bool) -> pd.DataFrame:
+    """
+    Column-batch timezone conversion, as used by the customer volume forecast loader.
+
+    Args:
+        df: Raw customer volume forecasts
+        timezone_aware_dates: If true, returns timezone-aware dates
+
+    Returns:
+        Customer volume forecasts with converted dates
+    """
+    convert_timezones(df, ["ForecastDate"], TIMEZONE, timezone_aware=timezone_aware_dates)
+    convert_timezones(
+        df, ["Datetime", "InsertionTimestamp"], "UTC", TIMEZONE, timezone_aware_dates
+    )
+    return df
+
+
+def profile_function(
+    func, df: pd.DataFrame, timezone_aware_dates: bool
+) -> tuple[float, float, pd.DataFrame]:
+    """
+    Times a single call of a conversion function, and measures its peak memory allocation.
+
+    Args:
+        func: Conversion function
+        df: Input dataframe (a copy is passed to the function)
+        timezone_aware_dates: If true, returns timezone-aware dates
+
+    Returns:
+        Elapsed time in seconds, peak allocated memory in MB, and the function's output
+    """
+    df = df.copy()
+    tracemalloc.start()
+    start = time.perf_counter()
+    df_out = func(df, timezone_aware_dates)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 1e6, df_out
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000_000, help="Number of rows")
+    args = parser.parse_args()
+
+    df = make_synthetic_forecasts(args.rows)
+
+    # Cache the UTC offsets of the timezone, as in a long-running process
+    convert_dates(df.head().copy(), False)
+
+    print(f"Rows: {args.rows:,}")
+    for timezone_aware_dates in [False, True]:
+        elapsed_legacy, peak_legacy, df_legacy = profile_function(
+            convert_dates_legacy, df, timezone_aware_dates
+        )
+        elapsed_new, peak_new, df_new = profile_function(convert_dates, df, timezone_aware_dates)
+
+        # The column-batch conversion must reproduce the legacy output exactly
+        pd.testing.assert_frame_equal(df_new, df_legacy)
+
+        print(f"Timezone-aware dates: {timezone_aware_dates}")
+        print(f"  Legacy:       {elapsed_legacy:8.3f} s  (peak memory {peak_legacy:>9,.0f} MB)")
+        print(f"  Column-batch: {elapsed_new:8.3f} s  (peak memory {peak_new:>9,.0f} MB)")
+        print(f"  Speed-up:     {elapsed_legacy / elapsed_new:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
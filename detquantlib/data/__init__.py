@@ -1,5 +1,24 @@
+from .databases.async_detdatabase import AsyncDetDatabase
 from .databases.detdatabase import DetDatabase
+from .databases.futures_curve_store import FuturesCurveStore
+from .databases.instrumentation import QueryRecorder
+from .databases.local_database import LocalDatabase
+from .databases.query_cache import QueryCache
+from .databases.range_cache import RangeCache
 from .entsoe.entsoe import Entsoe
-from .sftp.sftp import Sftp
+from .sftp.file_cache import SftpFileCache
+from .sftp.sftp import Sftp, SftpPool
 
-__all__ = ["DetDatabase", "Entsoe", "Sftp"]
+__all__ = [
+    "AsyncDetDatabase",
+    "DetDatabase",
+    "Entsoe",
+    "FuturesCurveStore",
+    "LocalDatabase",
+    "QueryCache",
+    "QueryRecorder",
+    "RangeCache",
+    "Sftp",
+    "SftpFileCache",
+    "SftpPool",
+]
@@ -0,0 +1,173 @@
+# Python built-in packages
+import asyncio
+import functools
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+# Internal modules
+from detquantlib.data.databases.detdatabase import DetDatabase
+
+
+class AsyncDetDatabase:
+    """
+    An asyncio variant of the DetDatabase class, to load data from the DET database without
+    blocking the event loop.
+
+    The loader methods of the DetDatabase class (e.g. load_entsoe_day_ahead_spot_prices()) are
+    exposed as coroutines with the same arguments. Calls are executed by the synchronous
+    DetDatabase class on a bounded thread pool, such that the results (including the
+    post-processing) are identical to the ones of the synchronous class.
+
+    Usage example:
+        async with AsyncDetDatabase(max_concurrency=4) as db:
+            df_spot, df_futures = await asyncio.gather(
+                db.load_entsoe_day_ahead_spot_prices(commodity_name="DutchPower", ...),
+                db.load_futures_eod_settlement_prices(commodity_name="DutchPower", ...),
+            )
+    """
+
+    # Names of the DetDatabase methods exposed as coroutines (in addition to the loaders)
+    METHODS = [
+        "query_db",
+        "query_db_date_range",
+        "get_commodity_info",
+        "get_commodities_info",
+        "get_client_info",
+        "refresh_metadata",
+        "add_table",
+        "remove_table",
+    ]
+
+    def __init__(self, db: DetDatabase = None, max_concurrency: int = 4, **kwargs):
+        """
+        Constructor method.
+
+        Args:
+            db: Instance of the DetDatabase class used to execute the calls. If None, the
+                instance is automatically initialized.
+            max_concurrency: Maximum number of calls running at the same time. Should not
+                exceed the size of the engine's connection pool, to avoid overwhelming the
+                database server.
+            **kwargs: Keyword arguments passed to the DetDatabase constructor, if 'db' is None
+        """
+        self.db = db if db is not None else DetDatabase(**kwargs)
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        self._semaphore = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.aclose()
+
+    def __getattr__(self, name: str) -> Callable:
+        """
+        Exposes the loader methods (and some utility methods) of the DetDatabase class as
+        coroutines.
+
+        Args:
+            name: Method name
+
+        Returns:
+            Coroutine function calling the DetDatabase method
+
+        Raises:
+            AttributeError: Raises an error if the method is not exposed by the class
+        """
+        if name not in AsyncDetDatabase.get_method_names():
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        async def method(*args, **kwargs):
+            return await self.run(name, *args, **kwargs)
+
+        method.__name__ = name
+        method.__doc__ = getattr(DetDatabase, name).__doc__
+        return method
+
+    @staticmethod
+    def get_method_names() -> list:
+        """
+        Gets the names of the DetDatabase methods exposed as coroutines, i.e. the (public)
+        loader methods and the methods listed in AsyncDetDatabase.METHODS.
+
+        Returns:
+            List of method names
+        """
+        names = [n for n in dir(DetDatabase) if n.startswith("load_")] + AsyncDetDatabase.METHODS
+        return [n for n in dict.fromkeys(names) if callable(getattr(DetDatabase, n, None))]
+
+    async def run(self, method_name: str, *args, **kwargs):
+        """
+        Runs a DetDatabase method on the thread pool, without blocking the event loop.
+
+        Args:
+            method_name: Name of the DetDatabase method
+            *args: Positional arguments of the method
+            **kwargs: Keyword arguments of the method
+
+        Returns:
+            Result of the method
+
+        Raises:
+            ValueError: Raises an error if the method is not exposed by the class (see
+                get_method_names())
+            ValueError: Raises an error if data streaming is requested (not supported)
+        """
+        # Input validation
+        valid_method_names = AsyncDetDatabase.get_method_names()
+        if method_name not in valid_method_names:
+            raise ValueError(
+                f"Invalid input 'method_name' value '{method_name}'. "
+                f"Supported values: {valid_method_names}."
+            )
+        if kwargs.get("chunksize") is not None:
+            raise ValueError(
+                "Input argument 'chunksize' is not supported by the AsyncDetDatabase class."
+            )
+
+        # Create semaphore within the running event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        method = getattr(self.db, method_name)
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            result = await loop.run_in_executor(
+                self._executor, functools.partial(method, *args, **kwargs)
+            )
+
+        return result
+
+    async def gather(self, calls: list[tuple[str, dict]]) -> list:
+        """
+        Runs multiple DetDatabase method calls concurrently (with at most 'max_concurrency'
+        calls running at the same time).
+
+        Args:
+            calls: List of (method name, keyword arguments) tuples, e.g.
+                [("load_eex_eod_prices", dict(product_code="F1BM", ...))]
+
+        Returns:
+            List of call results, in the same order as the input calls. If a call fails, its
+            result is the raised exception instead of a dataframe.
+        """
+        coroutines = [self.run(method_name, **kwargs) for method_name, kwargs in calls]
+        results = await asyncio.gather(*coroutines, return_exceptions=True)
+        return list(results)
+
+    async def aclose(self):
+        """
+        Shuts down the thread pool, after the running calls have finished. The event loop is
+        not blocked while waiting for the running calls.
+        """
+        await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+    def close(self):
+        """
+        Shuts down the thread pool, after the running calls have finished.
+
+        Note: This method blocks until the running calls have finished. Within an event loop,
+        use aclose() (or the asynchronous context manager) instead.
+        """
+        self._executor.shutdown(wait=True)
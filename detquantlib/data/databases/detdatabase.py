@@ -1,13 +1,29 @@
 # Python built-in packages
+import datetime as dt
+import decimal
 import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from urllib.parse import quote_plus
 from zoneinfo import ZoneInfo
 
 # Third-party packages
 import pandas as pd
+import pyarrow as pa
 from dateutil.relativedelta import *
-from sqlalchemy import Engine, create_engine, text
+from sqlalchemy import Connection, Engine, TextClause, bindparam, create_engine, event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.pool import PoolProxiedConnection
+
+# Internal modules
+from detquantlib.data.databases.instrumentation import QueryRecorder, instrumented
+from detquantlib.data.databases.query_cache import QueryCache
+from detquantlib.data.databases.range_cache import RangeCache
+from detquantlib.dates.timezones import convert_timezone, convert_timezones
+from detquantlib.utils.utils import add_log
 
 
 class DetDatabase:
@@ -15,20 +31,140 @@ class DetDatabase:
     A class to easily interact with the DET database, including fetching and processing data.
     """
 
-    def __init__(self, engine: Engine = None, driver: str = "ODBC Driver 18 for SQL Server"):
+    def __init__(
+        self,
+        engine: Engine = None,
+        driver: str = "ODBC Driver 18 for SQL Server",
+        query_cache: QueryCache = None,
+        range_cache: RangeCache = None,
+        fetch_backend: str = "pandas",
+        cache_metadata: bool = False,
+        metadata_refresh_interval: float = None,
+        pool_size: int = 5,
+        max_overflow: int = 10,
+        pool_recycle: int = 3600,
+        pool_pre_ping: bool = True,
+        fast_executemany: bool = False,
+        max_retries: int = 2,
+        retry_backoff: float = 0.5,
+        downcast: bool = False,
+        recorder: QueryRecorder = None,
+        sql_pushdown: bool = False,
+        partition_frequency: str = None,
+        partition_workers: int = 4,
+    ):
         """
         Constructor method.
 
         Args:
             engine: Instance of SQLAlchemy engine. If None, the instance is automatically
-                initialized.
+                initialized (which requires the DET_DB_* environment variables).
             driver: ODBC driver
+            query_cache: Optional local cache of query results. If provided, repeated queries
+                are served from the cache instead of the database. Only use for data that does
+                not change over time (e.g. historical prices), or set a cache time-to-live.
+            range_cache: Optional in-memory cache of time series data. If provided, the time
+                series loaders only query the date intervals that have not been fetched yet.
+            fetch_backend: Method used to fetch query results. Can take value "pandas" (rows
+                are fetched with pd.read_sql_query()) or "arrow" (rows are fetched directly from
+                the database cursor into Arrow record batches, and date columns are returned as
+                datetime64 instead of Python objects).
+            cache_metadata: If true, the commodity and client tables are loaded once and kept
+                in memory, and commodity/client information lookups are served from memory.
+            metadata_refresh_interval: Only used if 'cache_metadata' is true. Time (in seconds)
+                after which the cached metadata tables are reloaded from the database. If None,
+                the tables are only reloaded when calling refresh_metadata().
+            pool_size: Number of connections kept open in the connection pool. Only used if the
+                engine is automatically initialized.
+            max_overflow: Number of connections that can be opened on top of the pool size
+                under load. Only used if the engine is automatically initialized.
+            pool_recycle: Time (in seconds) after which pooled connections are replaced, to
+                avoid reusing connections closed by the server. Only used if the engine is
+                automatically initialized.
+            pool_pre_ping: If true, pooled connections are tested before use, and stale
+                connections are transparently replaced. Only used if the engine is
+                automatically initialized.
+            fast_executemany: If true, inserts use the pyodbc 'fast_executemany' mode, which
+                sends parameter arrays to the server in bulk. Used by automatically initialized
+                engines, and as default of the add_table() method.
+            max_retries: Maximum number of times a query is retried after a lost connection
+            retry_backoff: Waiting time (in seconds) before the first retry. The waiting time
+                doubles with each subsequent retry.
+            downcast: If true, queried columns are downcast to the types declared in the table
+                schemas (see DetDatabaseDefinitions), e.g. categorical tenors, and float columns
+                (e.g. prices and volumes) are downcast to float32. This reduces memory usage, at
+                the cost of float precision.
+            recorder: Optional query recorder. If provided, the timings of all loader calls
+                (split by query execution, data transfer and post-processing), as well as the
+                number of fetched rows and bytes, are recorded.
+            sql_pushdown: If true, the loaders let the database server sort the queried rows
+                (ORDER BY clause), and skip the client-side sorting. On SQL Server, the ENTSOE
+                loaders also let the server derive the local delivery dates (AT TIME ZONE
+                clause) when timezone-naive dates are requested, and skip the client-side
+                timezone conversions.
+            partition_frequency: If provided, the time series loaders split the requested date
+                interval into partitions with this frequency (expressed as Pandas offset alias,
+                e.g. "MS" for monthly or "W-MON" for weekly partitions). The partitions are
+                queried concurrently, over multiple pooled connections, and concatenated in
+                date order. If None, each date interval is queried with a single query.
+            partition_workers: Maximum number of partitions queried at the same time. Should
+                not exceed the size of the engine's connection pool.
+
+        Raises:
+            ValueError: Raises an error in case of invalid fetch backend
         """
+        # Input validation
+        valid_fetch_backends = ["pandas", "arrow"]
+        if fetch_backend not in valid_fetch_backends:
+            raise ValueError(
+                f"Invalid input 'fetch_backend' value '{fetch_backend}'. "
+                f"Supported values: {valid_fetch_backends}."
+            )
+
         # Only allow object creation if mandatory environment variables exist
-        DetDatabase.check_environment_variables()
+        # Note: The environment variables are only needed to initialize the engine.
+        if engine is None:
+            DetDatabase.check_environment_variables()
 
         self.driver = driver
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        self.fast_executemany = fast_executemany
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.downcast = downcast
+        self.recorder = recorder
+        self.sql_pushdown = sql_pushdown
+        self.partition_frequency = partition_frequency
+        self.partition_workers = partition_workers
         self.engine = engine if engine is not None else self.initialize_engine()
+        self.query_cache = query_cache
+        self.range_cache = range_cache
+        self.fetch_backend = fetch_backend
+        self.cache_metadata = cache_metadata
+        self.metadata_refresh_interval = metadata_refresh_interval
+        self._metadata = dict()
+        self._metadata_lock = threading.RLock()
+        self._connection_stats = dict(
+            acquisitions=0, total_latency=0.0, max_latency=0.0, retries=0
+        )
+        self._connection_stats_lock = threading.Lock()
+        self._transfer_stats = dict(queries=0, rows=0, bytes_fetched=0, bytes_stored=0)
+
+        # Measure query execution times on the database server
+        if self.recorder is not None:
+            event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(self.engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start"] = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        query_start = conn.info.pop("query_start", None)
+        if query_start is not None:
+            self.recorder.add_execute_time(time.perf_counter() - query_start)
 
     @staticmethod
     def check_environment_variables():
@@ -71,19 +207,98 @@ class DetDatabase:
             f"PWD={quote_plus(os.getenv('DET_DB_PASSWORD'))}"
         )
         url = quote_plus(connection_str)
-        engine = create_engine(f"mssql+pyodbc:///?odbc_connect={url}")
+        engine = create_engine(
+            f"mssql+pyodbc:///?odbc_connect={url}",
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_recycle=self.pool_recycle,
+            pool_pre_ping=self.pool_pre_ping,
+            fast_executemany=self.fast_executemany,
+        )
         return engine
 
     def terminate_engine(self):
         """Disconnects the SQLAlchemy engine and releases all underlying resources."""
         self.engine.dispose()
 
-    def query_db(self, query: str) -> pd.DataFrame:
+    def acquire_connection(self, raw: bool = False) -> Connection | PoolProxiedConnection:
+        """
+        Checks out a connection from the engine's connection pool, and records the time spent
+        waiting for it (see get_connection_stats()).
+
+        Args:
+            raw: If true, returns the underlying DBAPI connection instead of an SQLAlchemy
+                connection
+
+        Returns:
+            Database connection. The connection should be closed after use, to return it to the
+            pool.
+        """
+        start = time.perf_counter()
+        conn = self.engine.raw_connection() if raw else self.engine.connect()
+        latency = time.perf_counter() - start
+
+        with self._connection_stats_lock:
+            stats = self._connection_stats
+            stats["acquisitions"] += 1
+            stats["total_latency"] += latency
+            stats["max_latency"] = max(stats["max_latency"], latency)
+
+        return conn
+
+    def get_connection_stats(self) -> dict:
+        """
+        Gets the connection pool usage statistics.
+
+        Returns:
+            A dictionary containing the number of connection acquisitions, the mean and maximum
+            connection acquisition latency (in seconds), the number of query retries after a
+            lost connection, and the status of the connection pool
+        """
+        with self._connection_stats_lock:
+            stats = self._connection_stats
+            n = stats["acquisitions"]
+            connection_stats = dict(
+                acquisitions=n,
+                mean_latency=stats["total_latency"] / n if n > 0 else 0.0,
+                max_latency=stats["max_latency"],
+                retries=stats["retries"],
+                pool_status=self.engine.pool.status(),
+            )
+        return connection_stats
+
+    def is_disconnect(self, e: Exception) -> bool:
+        """
+        Checks if an error was caused by a lost database connection, in which case the query
+        can safely be retried on a new connection.
+
+        Args:
+            e: Raised error
+
+        Returns:
+            True if the error was caused by a lost connection, false otherwise
+        """
+        if isinstance(e, DBAPIError):
+            return e.connection_invalidated
+        dbapi = self.engine.dialect.loaded_dbapi
+        return isinstance(e, dbapi.Error) and self.engine.dialect.is_disconnect(e, None, None)
+
+    @instrumented
+    def query_db(self, query: str, table: str = None, params: dict = None) -> pd.DataFrame:
         """
         Short utility method to make an SQL query to the database.
 
+        If the database connection is lost during the query, the query is retried (up to
+        'max_retries' times) on a new connection.
+
+        If a query cache is set, the query result is first looked up in the cache, and
+        non-empty results fetched from the database are stored in the cache.
+
         Args:
-            query: SQL query
+            query: SQL query, optionally containing bound parameters (e.g. "WHERE Name=:name")
+            table: Name of the queried database table (used to key and invalidate cache entries)
+            params: Values of the bound parameters (e.g. dict(name="DutchPower")). List values
+                are expanded, e.g. "WHERE Name IN :names" with dict(names=["A", "B"]).
 
         Returns:
             Dataframe containing the queried data
@@ -91,15 +306,757 @@ class DetDatabase:
         Raises:
             Exception: Raises an error if the SQL query fails
         """
+        if self.query_cache is not None:
+            df = self.query_cache.get(query, table, params)
+            if df is not None:
+                return df
+
+        # Note: The execution time is measured per thread, since the active record can be
+        # shared with worker threads running other queries (e.g. partitioned queries).
+        record = self.recorder.get_active_record() if self.recorder is not None else None
+        execute_start = self.recorder.get_thread_execute_time() if record is not None else 0.0
+        start = time.perf_counter()
+        attempt = 0
+        while True:
+            try:
+                if self.fetch_backend == "arrow":
+                    df = DetDatabase.arrow_table_to_pandas(
+                        self.query_db_arrow(query, params=params)
+                    )
+                else:
+                    with self.acquire_connection() as conn:
+                        df = pd.read_sql_query(DetDatabase.make_statement(query, params), con=conn)
+                break
+            except Exception as e:
+                # Only retry if the connection was lost. The failed connection is invalidated,
+                # while the other pooled connections remain available.
+                if attempt >= self.max_retries or not self.is_disconnect(e):
+                    raise
+                time.sleep(self.retry_backoff * 2**attempt)
+                attempt += 1
+                with self._connection_stats_lock:
+                    self._connection_stats["retries"] += 1
+
+        if record is not None:
+            # Time spent fetching data (i.e. excluding query execution on the server)
+            execute_time = self.recorder.get_thread_execute_time() - execute_start
+            fetch_time = time.perf_counter() - start - execute_time
+            size = int(df.memory_usage(deep=True).sum())
+            self.recorder.add_query(query, table, fetch_time, df.shape[0], size)
+
+        df = self.process_fetched_data(df, table)
+
+        if self.query_cache is not None and not df.empty:
+            self.query_cache.put(query, df, table, params)
+
+        return df
+
+    def process_fetched_data(self, df: pd.DataFrame, table: str = None) -> pd.DataFrame:
+        """
+        Downcasts freshly fetched data to the schema of the queried table (if enabled), and
+        records the number of fetched rows and their in-memory size (see get_transfer_stats()).
+
+        Args:
+            df: Data fetched from the database
+            table: Name of the queried database table
+
+        Returns:
+            Processed data
+        """
+        bytes_fetched = int(df.memory_usage(deep=True).sum())
+        if self.downcast and table is not None:
+            schema = DetDatabase.get_table_schema(table)
+            if schema is not None:
+                df = DetDatabase.apply_schema(df, schema)
+        bytes_stored = int(df.memory_usage(deep=True).sum())
+
+        with self._connection_stats_lock:
+            stats = self._transfer_stats
+            stats["queries"] += 1
+            stats["rows"] += df.shape[0]
+            stats["bytes_fetched"] += bytes_fetched
+            stats["bytes_stored"] += bytes_stored
+
+        return df
+
+    def concat_fetched_data(self, dfs: list[pd.DataFrame], table: str = None) -> pd.DataFrame:
+        """
+        Concatenates dataframes fetched with separate queries. If downcasting is enabled, the
+        table schema is applied again to the result, since concatenating categorical columns
+        with different categories falls back to object columns.
+
+        Args:
+            dfs: Dataframes fetched from the database
+            table: Name of the queried database table
+
+        Returns:
+            Concatenated dataframe
+        """
+        df = pd.concat(dfs, ignore_index=True)
+        if self.downcast and table is not None:
+            schema = DetDatabase.get_table_schema(table)
+            if schema is not None:
+                df = DetDatabase.apply_schema(df, schema)
+        return df
+
+    def get_transfer_stats(self) -> dict:
+        """
+        Gets the data transfer statistics of the queries made to the database (excluding
+        queries served from the query cache).
+
+        Note: The sizes are the in-memory sizes of the fetched dataframes (as reported by
+        pandas), not the number of bytes transferred from the database server.
+
+        Returns:
+            A dictionary containing the number of queries and fetched rows, the in-memory size
+            of the fetched data (in bytes), and its size after downcasting (in bytes)
+        """
+        with self._connection_stats_lock:
+            transfer_stats = dict(self._transfer_stats)
+        return transfer_stats
+
+    @staticmethod
+    def make_statement(query: str, params: dict = None) -> TextClause:
+        """
+        Converts an SQL query with bound parameters to an SQLAlchemy statement.
+
+        The parameter values are sent to the database separately from the SQL text, such that the
+        database server can reuse the execution plan of a query across different values. List
+        values are bound as expanding parameters (i.e. one parameter per list item).
+
+        Args:
+            query: SQL query, optionally containing bound parameters
+            params: Values of the bound parameters
+
+        Returns:
+            SQLAlchemy statement
+        """
+        stmt = text(query)
+        if params is None or len(params) == 0:
+            return stmt
+        expanding = [
+            bindparam(k, expanding=True) for k, v in params.items() if isinstance(v, (list, tuple))
+        ]
+        stmt = stmt.bindparams(*expanding).bindparams(**params)
+        return stmt
+
+    def query_db_batched(
+        self,
+        query: str,
+        table: str,
+        param_name: str,
+        values: list,
+        params: dict = None,
+        batch_size: int = None,
+    ) -> pd.DataFrame:
+        """
+        Makes an SQL query with a (potentially very long) list parameter, by splitting the list
+        into batches and querying each batch separately.
+
+        SQL Server limits the number of parameters per statement to 2100, such that long lists
+        (e.g. tens of thousands of identifiers) cannot be bound to a single query.
+
+        Args:
+            query: SQL query, containing a list parameter (e.g. "WHERE [id] IN :ids")
+            table: Name of the queried database table
+            param_name: Name of the list parameter (e.g. "ids")
+            values: Values of the list parameter
+            params: Values of the other bound parameters of the query
+            batch_size: Maximum number of list values per query. If None, the largest batch
+                size allowed by the parameter limit is used.
+
+        Returns:
+            Dataframe containing the concatenated data of all batches
+        """
+        params = dict() if params is None else params
+        if batch_size is None:
+            batch_size = DetDatabaseDefinitions.MAX_PARAMETERS - len(params)
+        values = list(dict.fromkeys(values))
+
+        dfs = list()
+        for i in range(0, max(len(values), 1), batch_size):
+            batch_params = {**params, param_name: values[i : i + batch_size]}
+            dfs.append(self.query_db(query, table, batch_params))
+
+        dfs_non_empty = [df for df in dfs if not df.empty]
+        if len(dfs_non_empty) <= 1:
+            return dfs_non_empty[0] if len(dfs_non_empty) == 1 else dfs[0]
+        df = self.concat_fetched_data(dfs_non_empty, table)
+
+        return df
+
+    def query_db_arrow(
+        self, query: str, batch_size: int = 100_000, params: dict = None
+    ) -> pa.Table:
+        """
+        Makes an SQL query to the database, and builds Arrow record batches directly from the
+        rows fetched from the database cursor.
+
+        Column types are derived from the cursor description, such that each column is converted
+        to a typed Arrow array in a single pass.
+
+        Args:
+            query: SQL query
+            batch_size: Number of rows fetched from the cursor per record batch
+            params: Values of the bound parameters of the query
+
+        Returns:
+            Arrow table containing the queried data
+        """
+        # Compile query to the driver's parameter style
+        stmt = DetDatabase.make_statement(query, params)
+        compiled = stmt.compile(
+            dialect=self.engine.dialect, compile_kwargs=dict(render_postcompile=True)
+        )
+        if compiled.positional:
+            compiled_params = [compiled.params[k] for k in compiled.positiontup]
+        else:
+            compiled_params = compiled.params
+
+        conn = self.acquire_connection(raw=True)
         try:
-            df = pd.read_sql_query(query, con=self.engine)
+            cursor = conn.cursor()
+            execute_start = time.perf_counter()
+            cursor.execute(str(compiled), compiled_params)
+            if self.recorder is not None:
+                self.recorder.add_execute_time(time.perf_counter() - execute_start)
+            names = [d[0] for d in cursor.description]
+            type_codes = [d[1] for d in cursor.description]
+
+            batches = list()
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if len(rows) == 0:
+                    break
+                arrays = list()
+                for values, type_code in zip(zip(*rows), type_codes):
+                    arrow_type = DetDatabaseDefinitions.ARROW_TYPES.get(type_code)
+                    array = pa.array(values, type=arrow_type)
+                    if type_code is decimal.Decimal:
+                        # Convert decimals to floats, consistently with pd.read_sql_query()
+                        array = array.cast(pa.float64())
+                    arrays.append(array)
+                batches.append(pa.RecordBatch.from_arrays(arrays, names=names))
+            cursor.close()
         except Exception as e:
-            # If query fails, close connection before raising the error
-            self.terminate_engine()
+            # Discard the connection from the pool if it was lost
+            if self.is_disconnect(e):
+                conn.invalidate(e)
             raise
+        finally:
+            conn.close()
+
+        if len(batches) > 0:
+            table = pa.Table.from_batches(batches)
+        else:
+            fields = list()
+            for name, type_code in zip(names, type_codes):
+                if type_code is decimal.Decimal:
+                    arrow_type = pa.float64()
+                else:
+                    arrow_type = DetDatabaseDefinitions.ARROW_TYPES.get(type_code, pa.null())
+                fields.append((name, arrow_type))
+            table = pa.schema(fields).empty_table()
+
+        return table
+
+    @staticmethod
+    def arrow_table_to_pandas(table: pa.Table) -> pd.DataFrame:
+        """
+        Converts an Arrow table to a dataframe. Timestamp and date columns are converted to
+        datetime64[ns] columns, and string columns are kept as Arrow-backed columns.
+
+        Args:
+            table: Arrow table
+
+        Returns:
+            Dataframe
+        """
+
+        def types_mapper(arrow_type: pa.DataType):
+            if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+                return pd.ArrowDtype(arrow_type)
+            return None
+
+        df = table.to_pandas(
+            date_as_object=False,
+            coerce_temporal_nanoseconds=True,
+            types_mapper=types_mapper,
+        )
+        return df
+
+    def query_db_chunks(
+        self, query: str, chunksize: int, table: str = None, params: dict = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams the result of an SQL query in chunks, using a server-side cursor, such that the
+        full result set never needs to be held in memory.
+
+        Note: Chunked queries bypass the query cache.
+
+        Args:
+            query: SQL query
+            chunksize: Number of rows per chunk
+            table: Name of the queried database table
+            params: Values of the bound parameters of the query
+
+        Yields:
+            Dataframes containing consecutive chunks of the queried data
+        """
+        stmt = DetDatabase.make_statement(query, params)
+        with self.acquire_connection() as conn:
+            conn = conn.execution_options(stream_results=True)
+            for df in pd.read_sql_query(stmt, con=conn, chunksize=chunksize):
+                yield self.process_fetched_data(df, table)
+
+    def iterate_chunks(
+        self,
+        query: str,
+        table: str,
+        chunksize: int,
+        order_by: list,
+        format_chunk: Callable[[pd.DataFrame], pd.DataFrame],
+        empty_error_message: str,
+        params: dict = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streams the result of a loader query in chunks, and applies the loader's post-processing
+        to each chunk.
+
+        The query is ordered on the database server, such that chunks are sorted with respect
+        to each other, and not only internally.
+
+        Args:
+            query: SQL query, excluding the ORDER BY clause
+            table: Name of the queried database table
+            chunksize: Number of rows per chunk
+            order_by: Columns used to order the query result
+            format_chunk: Function applied to each chunk
+            empty_error_message: Message of the error raised if the query returns no data
+            params: Values of the bound parameters of the query
+
+        Yields:
+            Processed dataframes containing consecutive chunks of the queried data
+
+        Raises:
+            ValueError: Raises an error if the query returns no data
+        """
+        query = DetDatabase.add_order_by(query, order_by)
+        nr_rows = 0
+        for df in self.query_db_chunks(query, chunksize, table, params):
+            if df.empty:
+                continue
+            nr_rows += df.shape[0]
+            yield format_chunk(df)
+
+        if nr_rows == 0:
+            raise ValueError(empty_error_message)
+
+    @staticmethod
+    def format_chunks_with_context(
+        chunks: Iterator[pd.DataFrame], format_chunk: Callable[[pd.DataFrame], pd.DataFrame]
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Applies a loader's post-processing to consecutive chunks of sorted data, with the last
+        row of the previous chunk and the first row of the next chunk as context (e.g. to
+        infer the length of delivery periods at the chunk boundaries). The context rows are
+        removed from the processed chunks.
+
+        Args:
+            chunks: Consecutive chunks of raw data
+            format_chunk: Function applied to each chunk (including its context rows), which
+                keeps the number and the order of the rows
+
+        Yields:
+            Processed dataframes containing consecutive chunks of the data
+        """
+
+        def format_with_context(
+            df: pd.DataFrame, df_previous: pd.DataFrame, df_next: pd.DataFrame
+        ) -> pd.DataFrame:
+            df_context = pd.concat(
+                [d for d in [df_previous, df, df_next] if d is not None], ignore_index=True
+            )
+            df_context = format_chunk(df_context)
+            idx_start = 0 if df_previous is None else 1
+            return df_context.iloc[idx_start : idx_start + df.shape[0]].reset_index(drop=True)
+
+        df_previous = None
+        df_current = None
+        for df in chunks:
+            if df_current is not None:
+                yield format_with_context(df_current, df_previous, df.iloc[:1])
+                df_previous = df_current.iloc[-1:]
+            df_current = df
+        if df_current is not None:
+            yield format_with_context(df_current, df_previous, None)
+
+    @staticmethod
+    def add_order_by(query: str, order_by: list) -> str:
+        """
+        Appends an ORDER BY clause to an SQL query.
+
+        Args:
+            query: SQL query, excluding the ORDER BY clause
+            order_by: Columns used to order the query result. If empty, the query is returned
+                unchanged.
+
+        Returns:
+            SQL query including the ORDER BY clause
+        """
+        if len(order_by) == 0:
+            return query
+        return f"{query} ORDER BY [{'], ['.join(order_by)}]"
+
+    @staticmethod
+    def get_sort_columns(sort_columns: list, columns: list) -> list:
+        """
+        Gets the sorting columns of a loader that are included in the queried columns.
+
+        Args:
+            sort_columns: Columns used by the loader to sort the data
+            columns: Queried database table columns
+
+        Returns:
+            Sorting columns included in the queried columns
+        """
+        return [c for c in sort_columns if columns == ["*"] or c in columns]
+
+    def get_local_time_expression(self, column: str, timezone: str, alias: str) -> str | None:
+        """
+        Gets the SQL expression converting a UTC date column to (timezone-naive) local dates on
+        the database server.
+
+        Args:
+            column: Name of the date column, expressed in UTC
+            timezone: Local timezone (IANA name, e.g. "Europe/Amsterdam")
+            alias: Name of the output column
+
+        Returns:
+            SQL expression, or None if the conversion cannot be done by the database server
+            (i.e. SQL pushdown is disabled, the database is not an SQL Server database, or the
+            timezone has no known SQL Server name)
+        """
+        windows_timezone = DetDatabaseDefinitions.WINDOWS_TIMEZONES.get(timezone)
+        if (
+            not self.sql_pushdown
+            or self.engine.dialect.name != "mssql"
+            or windows_timezone is None
+        ):
+            return None
+
+        return (
+            f"CAST(CAST([{column}] AS datetime2) AT TIME ZONE 'UTC' "
+            f"AT TIME ZONE '{windows_timezone}' AS datetime2) AS [{alias}]"
+        )
+
+    @staticmethod
+    def add_date_filter(
+        query: str,
+        date_column: str,
+        start_date: datetime,
+        end_date: datetime,
+        params: dict = None,
+        as_date: bool = False,
+    ) -> tuple[str, dict]:
+        """
+        Appends a date filter to an SQL query, with the dates as bound parameters.
+
+        Args:
+            query: SQL query, including a WHERE clause
+            date_column: Name of the column used to filter dates
+            start_date: Start date (included)
+            end_date: End date (excluded)
+            params: Values of the other bound parameters of the query
+            as_date: If true, dates are bound as dates (without time component). Otherwise,
+                dates are bound as datetimes.
+
+        Returns:
+            SQL query including the date filter, and values of all bound parameters
+        """
+        query = f"{query} " f"AND [{date_column}]>=:start_date " f"AND [{date_column}]<:end_date"
+        start_date = pd.Timestamp(start_date).to_pydatetime()
+        end_date = pd.Timestamp(end_date).to_pydatetime()
+        if as_date:
+            start_date = start_date.date()
+            end_date = end_date.date()
+        params = {**(params or dict()), "start_date": start_date, "end_date": end_date}
+        return query, params
+
+    def query_db_date_range(
+        self,
+        query: str,
+        table: str,
+        date_column: str,
+        start_date: datetime,
+        end_date: datetime,
+        cache_key: tuple = None,
+        params: dict = None,
+        as_date: bool = False,
+        order_by: list = None,
+    ) -> pd.DataFrame:
+        """
+        Queries the rows of a time series table within a date interval.
+
+        If a range cache is set and a cache key is provided, only the sub-intervals that are not
+        cached yet are queried from the database, and the result is spliced with the cached
+        data.
+
+        If a partition frequency is set (see 'partition_frequency' option), the queried date
+        intervals are split into partitions, which are queried concurrently.
+
+        Args:
+            query: SQL query, including a WHERE clause but excluding the date filter. The date
+                filter is appended to the query.
+            table: Name of the queried database table
+            date_column: Name of the column used to filter dates
+            start_date: Start date (included)
+            end_date: End date (excluded)
+            cache_key: Key identifying the queried time series in the range cache. If None,
+                the range cache is not used.
+            params: Values of the bound parameters of the query
+            as_date: If true, dates are bound as dates (without time component). Otherwise,
+                dates are bound as datetimes.
+            order_by: Only used if SQL pushdown is enabled (see 'sql_pushdown' option). Columns
+                used to order the queried data. The rows are ordered by the database server,
+                and only spliced data (range cache or partitions) is sorted client-side, if
+                needed.
+
+        Returns:
+            Dataframe containing the queried data (only sorted if SQL pushdown is enabled and
+            'order_by' is provided)
+        """
+        if not self.sql_pushdown or order_by is None:
+            order_by = list()
+
+        # Get the cached data and the missing intervals from the same state of the range cache,
+        # such that they never overlap
+        if self.range_cache is None or cache_key is None:
+            df_cached, intervals = None, [(start_date, end_date)]
+        else:
+            df_cached, intervals = self.range_cache.lookup(cache_key, start_date, end_date)
+
+        # Split the required date intervals into partitions
+        partitions = [
+            DetDatabase.split_date_range(interval_start, interval_end, self.partition_frequency)
+            for interval_start, interval_end in intervals
+        ]
+
+        # Query database for all partitions, and concatenate the partitions of each interval
+        dfs_partitions = iter(
+            self.query_db_partitions(
+                query=query,
+                table=table,
+                date_column=date_column,
+                partitions=[p for interval_partitions in partitions for p in interval_partitions],
+                params=params,
+                as_date=as_date,
+                order_by=order_by,
+            )
+        )
+        dfs_fetched = list()
+        for interval_partitions in partitions:
+            dfs = [next(dfs_partitions) for _ in interval_partitions]
+            dfs_fetched.append(self.concat_partitions(dfs, table, date_column, order_by))
+
+        if self.range_cache is None or cache_key is None:
+            return dfs_fetched[0]
+
+        # Splice fetched data with cached data
+        for (interval_start, interval_end), df in zip(intervals, dfs_fetched):
+            self.range_cache.add(cache_key, interval_start, interval_end, df, date_column)
+        dfs = [df for df in [df_cached] + dfs_fetched if df is not None]
+        dfs_non_empty = [df for df in dfs if not df.empty]
+        if len(dfs_non_empty) == 0:
+            return dfs[0] if len(dfs) > 0 else pd.DataFrame()
+        df = self.concat_fetched_data(dfs_non_empty, table)
+
+        # Sort spliced data (each query result is already sorted by the database server)
+        is_spliced = len(dfs_non_empty) > 1 or df_cached is not None and not df_cached.empty
+        if len(order_by) > 0 and is_spliced:
+            df.sort_values(by=order_by, kind="stable", inplace=True, ignore_index=True)
+
+        return df
+
+    @staticmethod
+    def split_date_range(
+        start_date: datetime, end_date: datetime, frequency: str = None
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Splits a date interval into consecutive partitions.
+
+        Args:
+            start_date: Start date (included)
+            end_date: End date (excluded)
+            frequency: Partition frequency, expressed as Pandas offset alias (e.g. "MS" for
+                monthly partitions). If None, the interval is not split.
+
+        Returns:
+            List of (start date, end date) tuples, sorted in ascending order
+        """
+        start_date = pd.Timestamp(start_date)
+        end_date = pd.Timestamp(end_date)
+        if frequency is None:
+            return [(start_date, end_date)]
+
+        bounds = pd.date_range(start_date, end_date, freq=frequency)
+        bounds = [start_date] + [b for b in bounds if start_date < b < end_date] + [end_date]
+        partitions = list(zip(bounds[:-1], bounds[1:]))
+
+        return partitions
+
+    def query_db_partitions(
+        self,
+        query: str,
+        table: str,
+        date_column: str,
+        partitions: list[tuple[datetime, datetime]],
+        params: dict = None,
+        as_date: bool = False,
+        order_by: list = None,
+    ) -> list[pd.DataFrame]:
+        """
+        Queries date partitions of a time series table. Multiple partitions are queried
+        concurrently (see 'partition_workers' option), each over its own pooled connection.
+
+        Args:
+            query: SQL query, including a WHERE clause but excluding the date filter
+            table: Name of the queried database table
+            date_column: Name of the column used to filter dates
+            partitions: List of (start date, end date) tuples
+            params: Values of the bound parameters of the query
+            as_date: If true, dates are bound as dates (without time component). Otherwise,
+                dates are bound as datetimes.
+            order_by: Columns used to order the query result of each partition. If None, the
+                query results are not ordered.
+
+        Returns:
+            List of dataframes containing the data of each partition, in the same order as the
+            input partitions
+        """
+
+        def query_partition(partition: tuple[datetime, datetime]) -> pd.DataFrame:
+            partition_query, partition_params = DetDatabase.add_date_filter(
+                query, date_column, partition[0], partition[1], params, as_date
+            )
+            partition_query = DetDatabase.add_order_by(partition_query, order_by or list())
+            return self.query_db(partition_query, table, partition_params)
+
+        if len(partitions) <= 1 or self.partition_workers <= 1:
+            return [query_partition(p) for p in partitions]
+
+        # Add the queries of the worker threads to the record of the calling loader
+        record = self.recorder.get_active_record() if self.recorder is not None else None
+
+        def query_partition_recorded(partition: tuple[datetime, datetime]) -> pd.DataFrame:
+            if record is None:
+                return query_partition(partition)
+            with self.recorder.attach(record):
+                return query_partition(partition)
+
+        max_workers = min(self.partition_workers, len(partitions))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            dfs = list(executor.map(query_partition_recorded, partitions))
+
+        return dfs
+
+    def concat_partitions(
+        self, dfs: list[pd.DataFrame], table: str, date_column: str, order_by: list
+    ) -> pd.DataFrame:
+        """
+        Concatenates the data of consecutive date partitions, such that the result is identical
+        to the result of a single query over the full date interval.
+
+        Args:
+            dfs: Dataframes containing the data of each partition, in date order
+            table: Name of the queried database table
+            date_column: Name of the column used to define partitions
+            order_by: Columns used to order the query result of each partition
+
+        Returns:
+            Dataframe containing the data of all partitions
+        """
+        dfs_non_empty = [df for df in dfs if not df.empty]
+        if len(dfs_non_empty) <= 1:
+            return dfs_non_empty[0] if len(dfs_non_empty) == 1 else dfs[0]
+        df = self.concat_fetched_data(dfs_non_empty, table)
+
+        # Partitions are only ordered with respect to each other by the date column
+        if len(order_by) > 0 and order_by[0] != date_column:
+            df.sort_values(by=order_by, kind="stable", inplace=True, ignore_index=True)
 
         return df
 
+    def load_many(
+        self, calls: list[tuple[str, dict]], max_workers: int = 4, timeout: float = None
+    ) -> list:
+        """
+        Runs independent loader calls concurrently on a bounded thread pool. All calls share
+        the connection pool of the SQLAlchemy engine.
+
+        Usage example:
+            results = db.load_many(
+                [
+                    ("load_futures_eod_settlement_prices", dict(commodity_name="DutchPower", ...)),
+                    ("load_entsoe_day_ahead_spot_prices", dict(commodity_name="DutchPower", ...)),
+                ]
+            )
+
+        Note: Calls that have not started when the timeout deadline is reached are cancelled. Calls that
+        are already running are abandoned, not cancelled: their worker threads (and database
+        queries) keep running in the background until the queries complete, and their results
+        are discarded.
+
+        Args:
+            calls: List of (method name, keyword arguments) tuples, where the method name is the
+                name of a DetDatabase loader method (e.g. "load_eex_eod_prices")
+            max_workers: Maximum number of calls running at the same time. Should not exceed the
+                size of the engine's connection pool, to avoid overwhelming the database server.
+            timeout: Maximum time (in seconds) to wait for the results of all calls (i.e. a
+                single deadline for the whole batch). If None, there is no time limit.
+
+        Returns:
+            List of call results, in the same order as the input calls. If a call fails (or
+            times out), its result is the raised exception instead of a dataframe.
+
+        Raises:
+            ValueError: Raises an error if a method name is not a DetDatabase loader method
+        """
+        # Validate input method names
+        methods = list()
+        for method_name, _ in calls:
+            method = getattr(self, method_name, None)
+            if not method_name.startswith("load_") or not callable(method):
+                loaders = [x for x in dir(self) if x.startswith("load_") and x != "load_many"]
+                raise ValueError(
+                    f"Invalid input method name '{method_name}'. Supported values: {loaders}."
+                )
+            methods.append(method)
+
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(method, **kwargs) for method, (_, kwargs) in zip(methods, calls)
+            ]
+            # Wait for all calls, with a single deadline for the whole batch
+            wait(futures, timeout=timeout)
+            results = list()
+            for (method_name, _), future in zip(calls, futures):
+                if not future.done():
+                    future.cancel()
+                    results.append(
+                        TimeoutError(f"Call to '{method_name}' timed out after {timeout}s.")
+                    )
+                elif future.exception() is not None:
+                    results.append(future.exception())
+                else:
+                    results.append(future.result())
+        finally:
+            # Do not block on calls that timed out
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return results
+
     @staticmethod
     def get_table_name(def_key: str) -> str:
         """
@@ -119,9 +1076,241 @@ class DetDatabase:
             table = definition["default_table_name"]
         return table
 
+    @staticmethod
+    def get_default_columns(def_key: str) -> list:
+        """
+        Gets the columns queried by default from a database table, according to the following
+        logic:
+            1) First, try to get the comma-separated column names from the corresponding
+                environment variable (e.g. DET_DB_COLUMNS_FUTURES_TT="TradingDate,Tenor").
+            2) If the environment variable is not defined, revert to the default columns.
+            3) If the table has no default columns, all columns are queried.
+
+        Args:
+            def_key: Definitions dictionary key corresponding to the desired table
+
+        Returns:
+            List of column names
+        """
+        definition = DetDatabaseDefinitions.DEFINITIONS[def_key]
+        columns_env = os.getenv(definition["columns_env_variable"])
+        if columns_env is not None:
+            columns = [c.strip() for c in columns_env.split(",") if c.strip() != ""]
+        else:
+            columns = definition.get("default_columns")
+        if columns is None or len(columns) == 0:
+            columns = ["*"]
+        return list(columns)
+
+    @staticmethod
+    def get_table_schema(table: str) -> dict | None:
+        """
+        Gets the schema (column types) declared for a database table.
+
+        Args:
+            table: Database table name
+
+        Returns:
+            Dictionary mapping column names to pandas dtypes, or None if no schema is declared
+            for the table
+        """
+        for def_key, definition in DetDatabaseDefinitions.DEFINITIONS.items():
+            if "schema" in definition and DetDatabase.get_table_name(def_key) == table:
+                return definition["schema"]
+        return None
+
+    @staticmethod
+    def apply_schema(df: pd.DataFrame, schema: dict) -> pd.DataFrame:
+        """
+        Downcasts the columns of a dataframe to the types declared in a table schema (e.g.
+        float32 instead of float64, categorical instead of string columns), to reduce the
+        memory footprint of the data. Float columns that are not declared in the schema (e.g.
+        prices and volumes) are downcast to float32. Integer columns with missing values (i.e.
+        fetched as floats) cannot be downcast to integers, and are downcast to float32 instead.
+
+        Args:
+            df: Dataframe
+            schema: Dictionary mapping column names to pandas dtypes. Columns that are not in
+                the dataframe are ignored.
+
+        Returns:
+            Dataframe with downcast columns
+        """
+        dtypes = {c: "float32" for c in df.columns if df[c].dtype == "float64"}
+        dtypes.update({c: t for c, t in schema.items() if c in df.columns})
+        dtypes = {
+            c: "float32" if t == "int32" and df[c].dtype.kind == "f" and df[c].isna().any() else t
+            for c, t in dtypes.items()
+        }
+        dtypes = {c: t for c, t in dtypes.items() if df[c].dtype != t}
+        if len(dtypes) > 0:
+            df = df.astype(dtypes)
+        return df
+
+    @staticmethod
+    def get_entsoe_delivery_interval(
+        timezone: str,
+        start_trading_date: datetime = None,
+        end_trading_date: datetime = None,
+        start_delivery_date: datetime = None,
+        end_delivery_date: datetime = None,
+        delivery_lag_days: int = 0,
+    ) -> tuple[pd.Timestamp, pd.Timestamp]:
+        """
+        Converts a range of trading dates or delivery dates, expressed in the local timezone of
+        a commodity, to a delivery interval expressed in UTC (timezone-naive).
+
+        Args:
+            timezone: Local timezone of the commodity
+            start_trading_date: Start trading date
+            end_trading_date: End trading date (included)
+            start_delivery_date: Delivery start date (included). Only used if
+                'start_trading_date' is None.
+            end_delivery_date: Delivery end date (excluded). Only used if 'end_trading_date' is
+                None.
+            delivery_lag_days: Number of days between the trading date and the delivery date
+
+        Returns:
+            Delivery start date (included) and delivery end date (excluded), in UTC
+        """
+        # Convert trading dates to delivery dates
+        if start_trading_date is not None:
+            start_trading_date = pd.Timestamp(start_trading_date).floor("D")
+            start_delivery_date = start_trading_date + relativedelta(days=delivery_lag_days)
+        if end_trading_date is not None:
+            end_trading_date = pd.Timestamp(end_trading_date).floor("D")
+            end_delivery_date = end_trading_date + relativedelta(days=delivery_lag_days + 1)
+
+        # Convert delivery dates from local timezone to UTC
+        dates_utc = list()
+        for d in [start_delivery_date, end_delivery_date]:
+            d = d.replace(tzinfo=ZoneInfo(timezone))
+            d = pd.Timestamp(d.astimezone(ZoneInfo("UTC"))).tz_localize(None)
+            dates_utc.append(d)
+
+        return dates_utc[0], dates_utc[1]
+
+    def _load_entsoe_prices_multi(
+        self,
+        def_key: str,
+        commodity_names: list,
+        start_trading_date: datetime,
+        end_trading_date: datetime,
+        start_delivery_date: datetime,
+        end_delivery_date: datetime,
+        columns: list,
+        delivery_lag_days: int,
+        format_function: Callable[[pd.DataFrame, str, str], pd.DataFrame],
+        output_format: str,
+    ) -> pd.DataFrame | dict:
+        """
+        Loads entsoe prices of multiple commodities with a single query, and processes the data
+        per commodity.
+
+        Args:
+            def_key: Definitions dictionary key corresponding to the price table
+            commodity_names: Commodity names (as defined in the [META].[Commodity] database
+                table)
+            start_trading_date: Start trading date
+            end_trading_date: End trading date
+            start_delivery_date: Delivery start date
+            end_delivery_date: Delivery end date
+            columns: Requested database table columns
+            delivery_lag_days: Number of days between the trading date and the delivery date
+            format_function: Function post-processing the raw data of one commodity, with
+                arguments (dataframe, commodity name, timezone)
+            output_format: "frame" (one long dataframe) or "dict" (dictionary of dataframes)
+
+        Returns:
+            Dataframe or dictionary of dataframes containing the prices of all commodities
+
+        Raises:
+            ValueError: Raises an error in case of invalid output format
+            ValueError: Raises an error if no price data is found for some of the commodities
+        """
+        valid_output_formats = ["frame", "dict"]
+        if output_format not in valid_output_formats:
+            raise ValueError(
+                f"Invalid input 'output_format' value '{output_format}'. "
+                f"Supported values: {valid_output_formats}."
+            )
+
+        # Always add map code column, needed to split the data per commodity
+        if "MapCode" not in columns and columns != ["*"]:
+            columns = columns + ["MapCode"]
+        if len(columns) == 1:
+            columns_str = str(columns[0])
+        else:
+            columns_str = f"[{'], ['.join(columns)}]"
+
+        # Get information of all commodities with a single query
+        commodities_info = self.get_commodities_info(
+            filter_column="Name",
+            filter_values=commodity_names,
+            info_columns=["Timezone", "EntsoeMapCode"],
+        )
+
+        # Compute the delivery interval of each commodity in UTC
+        intervals = dict()
+        for name in commodity_names:
+            intervals[name] = DetDatabase.get_entsoe_delivery_interval(
+                timezone=commodities_info[name]["Timezone"],
+                start_trading_date=start_trading_date,
+                end_trading_date=end_trading_date,
+                start_delivery_date=start_delivery_date,
+                end_delivery_date=end_delivery_date,
+                delivery_lag_days=delivery_lag_days,
+            )
+
+        # Query the data of all map codes over the union of all delivery intervals
+        map_codes = list(
+            dict.fromkeys(info["EntsoeMapCode"] for info in commodities_info.values())
+        )
+        table = DetDatabase.get_table_name(def_key)
+        query = f"SELECT {columns_str} FROM {table} WHERE MapCode IN :map_codes"
+        query, params = DetDatabase.add_date_filter(
+            query=query,
+            date_column="DateTime(UTC)",
+            start_date=min(i[0] for i in intervals.values()),
+            end_date=max(i[1] for i in intervals.values()),
+            params=dict(map_codes=map_codes),
+        )
+        if self.sql_pushdown:
+            query = DetDatabase.add_order_by(query, ["DateTime(UTC)"])
+        df_all = self.query_db(query, table, params)
+
+        # Split and process data per commodity
+        dfs = dict()
+        names_without_data = list()
+        for name in commodity_names:
+            start_date, end_date = intervals[name]
+            idx = (
+                (df_all["MapCode"] == commodities_info[name]["EntsoeMapCode"])
+                & (df_all["DateTime(UTC)"] >= start_date)
+                & (df_all["DateTime(UTC)"] < end_date)
+            )
+            df = df_all.loc[idx, :].reset_index(drop=True)
+            if df.empty:
+                names_without_data.append(name)
+                continue
+            dfs[name] = format_function(df, name, commodities_info[name]["Timezone"])
+
+        if len(names_without_data) > 0:
+            raise ValueError(
+                f"No price data found for user-defined inputs, for commodities: "
+                f"{', '.join(names_without_data)}."
+            )
+
+        if output_format == "dict":
+            return dfs
+
+        df = pd.concat(dfs.values(), ignore_index=True)
+        return df
+
+    @instrumented
     def load_entsoe_day_ahead_spot_prices(
         self,
-        commodity_name: str,
+        commodity_name: str | list,
         start_trading_date: datetime = None,
         end_trading_date: datetime = None,
         start_delivery_date: datetime = None,
@@ -129,12 +1318,17 @@ class DetDatabase:
         columns: list = None,
         process_data: bool = True,
         timezone_aware_dates: bool = False,
-    ) -> pd.DataFrame:
+        chunksize: int = None,
+        output_format: str = "frame",
+    ) -> pd.DataFrame | dict | Iterator[pd.DataFrame]:
         """
         Loads entsoe day-ahead spot prices from the database.
 
         Args:
-            commodity_name: Commodity name (as defined in the [META].[Commodity] database table)
+            commodity_name: Commodity name (as defined in the [META].[Commodity] database table),
+                or list of commodity names. If a list is provided, the data of all commodities
+                is fetched with a single query, and processed per commodity (each commodity in
+                its own local timezone).
             start_trading_date: Start trading date
             end_trading_date: End trading date
                 Note: The user should provide either 'start_trading_date' and 'end_trading_date',
@@ -146,13 +1340,22 @@ class DetDatabase:
                 Note: The user should provide either 'start_trading_date' and 'end_trading_date',
                 or 'start_delivery_date' and 'end_delivery_date'.
             columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get
-                all columns.
+                all columns. If None, the default columns of the table are queried (see
+                get_default_columns()).
             process_data: Indicates if data should be processed convert to standardized format
             timezone_aware_dates: If true, returns all dates as timezone-aware. Otherwise,
                 returns them as timezone-naive.
+            chunksize: If provided, the data is streamed from the database and returned as an
+                iterator of dataframes with (at most) 'chunksize' rows each, sorted by delivery
+                date. The range cache is not used in that case. Only supported for a single
+                commodity.
+            output_format: Only used if 'commodity_name' is a list. Can take value "frame"
+                (returns one long dataframe, with the commodities in the order of the input list)
+                or "dict" (returns a dictionary of dataframes, with commodity names as keys).
 
         Returns:
-            Dataframe containing day-ahead spot prices
+            Dataframe containing day-ahead spot prices (or a dictionary of dataframes, or an
+            iterator of dataframes if 'chunksize' is provided)
 
         Raises:
             ValueError: Raises an error if input arguments 'columns' and 'process_data' are not
@@ -182,20 +1385,18 @@ class DetDatabase:
                 "Either 'start_trading_date' and 'end_trading_date', or 'start_delivery_date' "
                 "and 'end_delivery_date' should be provided."
             )
+        if isinstance(commodity_name, list) and chunksize is not None:
+            raise ValueError(
+                "Input argument 'chunksize' is only supported for a single commodity name."
+            )
 
         # Set default column values
         if columns is None:
-            columns = [
-                "DateTime(UTC)",
-                "ResolutionCode",
-                "MapCode",
-                "Price(Currency/MWh)",
-                "Currency",
-            ]
+            columns = DetDatabase.get_default_columns("entsoe_day_ahead_spot_price")
 
         # Always add delivery date column
         if "DateTime(UTC)" not in columns and columns != ["*"]:
-            columns.append("DateTime(UTC)")
+            columns = columns + ["DateTime(UTC)"]
 
         # Convert columns from list to string
         if len(columns) == 1:
@@ -203,6 +1404,32 @@ class DetDatabase:
         else:
             columns_str = f"[{'], ['.join(columns)}]"
 
+        # Load multiple commodities at once
+        if isinstance(commodity_name, list):
+
+            def format_commodity_data(df_raw: pd.DataFrame, name: str, tz: str) -> pd.DataFrame:
+                return DetDatabase._format_entsoe_day_ahead_spot_prices(
+                    df_raw,
+                    name,
+                    tz,
+                    process_data,
+                    timezone_aware_dates,
+                    presorted=self.sql_pushdown,
+                )
+
+            return self._load_entsoe_prices_multi(
+                def_key="entsoe_day_ahead_spot_price",
+                commodity_names=commodity_name,
+                start_trading_date=start_trading_date,
+                end_trading_date=end_trading_date,
+                start_delivery_date=start_delivery_date,
+                end_delivery_date=end_delivery_date,
+                columns=columns,
+                delivery_lag_days=1,
+                format_function=format_commodity_data,
+                output_format=output_format,
+            )
+
         # Get commodity information (map code and local timezone)
         # Note: The local timezone is important because ENTSOE provides all prices in the UTC
         # timezone. We first convert the dates from UTC to the local timezone, and then filter
@@ -215,62 +1442,120 @@ class DetDatabase:
         map_code = commodity_info["EntsoeMapCode"]
         timezone = commodity_info["Timezone"]
 
-        # Convert start trading date to start delivery date
-        if start_trading_date is not None:
-            start_trading_date = pd.Timestamp(start_trading_date).floor("D")
-            start_delivery_date = start_trading_date + relativedelta(days=1)
-
-        # Convert start delivery date from local timezone to UTC and string
-        start_delivery_date = start_delivery_date.replace(tzinfo=ZoneInfo(timezone))
-        start_delivery_date = start_delivery_date.astimezone(ZoneInfo("UTC"))
-        start_date_str = start_delivery_date.strftime("%Y-%m-%d %H:%M:%S")
-
-        # Convert end trading date to end delivery date
-        if end_trading_date is not None:
-            end_trading_date = pd.Timestamp(end_trading_date).floor("D")
-            end_delivery_date = end_trading_date + relativedelta(days=2)
+        # Convert trading/delivery dates to a UTC delivery interval
+        # Note: Day-ahead prices are traded one day before delivery.
+        start_delivery_date, end_delivery_date = DetDatabase.get_entsoe_delivery_interval(
+            timezone=timezone,
+            start_trading_date=start_trading_date,
+            end_trading_date=end_trading_date,
+            start_delivery_date=start_delivery_date,
+            end_delivery_date=end_delivery_date,
+            delivery_lag_days=1,
+        )
 
-        # Convert end date to UTC and string
-        end_delivery_date = end_delivery_date.replace(tzinfo=ZoneInfo(timezone))
-        end_delivery_date = end_delivery_date.astimezone(ZoneInfo("UTC"))
-        end_date_str = end_delivery_date.strftime("%Y-%m-%d %H:%M:%S")
+        # Let the database server derive the local delivery dates, if possible
+        if not timezone_aware_dates:
+            local_date_expression = self.get_local_time_expression(
+                "DateTime(UTC)", timezone, f"DateTime({timezone})"
+            )
+            if local_date_expression is not None:
+                columns_str = f"{columns_str}, {local_date_expression}"
 
         # Query db
         table = DetDatabase.get_table_name("entsoe_day_ahead_spot_price")
-        query = (
-            f"SELECT {columns_str} FROM {table} "
-            f"WHERE MapCode='{map_code}' "
-            f"AND [DateTime(UTC)]>='{start_date_str}' "
-            f"AND [DateTime(UTC)]<'{end_date_str}' "
+        query = f"SELECT {columns_str} FROM {table} WHERE MapCode=:map_code"
+        params = dict(map_code=map_code)
+        empty_error_message = "No price data found for user-defined inputs."
+
+        def format_data(df_raw: pd.DataFrame) -> pd.DataFrame:
+            return DetDatabase._format_entsoe_day_ahead_spot_prices(
+                df_raw,
+                commodity_name,
+                timezone,
+                process_data,
+                timezone_aware_dates,
+                presorted=self.sql_pushdown,
+            )
+
+        if chunksize is not None:
+            query, params = DetDatabase.add_date_filter(
+                query, "DateTime(UTC)", start_delivery_date, end_delivery_date, params
+            )
+            return self.iterate_chunks(
+                query,
+                table,
+                chunksize,
+                ["DateTime(UTC)"],
+                format_data,
+                empty_error_message,
+                params,
+            )
+
+        df = self.query_db_date_range(
+            query=query,
+            table=table,
+            date_column="DateTime(UTC)",
+            start_date=start_delivery_date,
+            end_date=end_delivery_date,
+            cache_key=(table, map_code, columns_str),
+            params=params,
+            order_by=["DateTime(UTC)"],
         )
-        df = self.query_db(query)
 
         if df.empty:
-            raise ValueError("No price data found for user-defined inputs.")
+            raise ValueError(empty_error_message)
 
-        # Sort data by delivery date
-        df.sort_values(
-            by=["DateTime(UTC)"], axis=0, ascending=True, inplace=True, ignore_index=True
-        )
+        df = format_data(df)
 
-        # Convert date columns to timezone-aware dates
-        cols_date = ["DateTime(UTC)", "UpdateTime(UTC)", "InsertionTimestamp"]
-        for c in cols_date:
-            if c in df.columns:
-                df[c] = df[c].dt.tz_localize("UTC")
+        return df
+
+    @staticmethod
+    def _format_entsoe_day_ahead_spot_prices(
+        df: pd.DataFrame,
+        commodity_name: str,
+        timezone: str,
+        process_data: bool,
+        timezone_aware_dates: bool,
+        presorted: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Post-processes raw day-ahead spot prices queried from the database.
+
+        Args:
+            df: Raw day-ahead spot prices
+            commodity_name: Commodity name (as defined in the [META].[Commodity] database table)
+            timezone: Timezone of the power country/region
+            process_data: Indicates if data should be processed convert to standardized format
+            timezone_aware_dates: If true, returns all dates as timezone-aware. Otherwise,
+                returns them as timezone-naive.
+            presorted: If true, the data is already sorted by delivery date (by the database
+                server), and is not sorted again.
+
+        Returns:
+            Post-processed day-ahead spot prices
+        """
+        # Sort data by delivery date
+        if not presorted:
+            df.sort_values(
+                by=["DateTime(UTC)"], axis=0, ascending=True, inplace=True, ignore_index=True
+            )
 
         # Add column with delivery date expressed in local timezone
+        # Note: The local delivery dates (timezone-naive) may already have been derived by the
+        # database server (see 'sql_pushdown' option).
         col_local_date = f"DateTime({timezone})"
-        cols_date.append(col_local_date)
+        if col_local_date in df.columns:
+            local_dates = df.pop(col_local_date)
+        else:
+            local_dates = convert_timezone(
+                df["DateTime(UTC)"], "UTC", timezone, timezone_aware_dates
+            )
         loc = df.columns.get_loc("DateTime(UTC)") + 1
-        df.insert(
-            loc=loc, column=col_local_date, value=df["DateTime(UTC)"].dt.tz_convert(timezone)
-        )
+        df.insert(loc=loc, column=col_local_date, value=local_dates)
 
-        if not timezone_aware_dates:
-            for c in cols_date:
-                if c in df.columns:
-                    df[c] = df[c].dt.tz_localize(None)
+        # Convert UTC date columns to timezone-aware dates, if requested
+        cols_date_utc = ["DateTime(UTC)", "UpdateTime(UTC)", "InsertionTimestamp"]
+        convert_timezones(df, cols_date_utc, "UTC", timezone_aware=timezone_aware_dates)
 
         # Process raw data and convert it to standardized format
         if process_data:
@@ -297,36 +1582,30 @@ class DetDatabase:
             ValueError: Raises an error if the resolution code is not supported.
         """
         df_in.reset_index(drop=True, inplace=True)
+        col_date = f"DateTime({timezone})"
+
+        # Map resolution codes to delivery period lengths
+        # Note: Resolution codes are converted to objects first, since mapping a categorical
+        # column (see 'downcast' option) returns a categorical column.
+        resolution_codes = df_in["ResolutionCode"].astype(object)
+        resolution = resolution_codes.map(DetDatabaseDefinitions.RESOLUTION_CODES)
+        if resolution.isna().any():
+            raise ValueError("Resolution not supported.")
 
         # Initialize output dataframe
-        df_out = pd.DataFrame()
+        df_out = pd.DataFrame(index=df_in.index)
 
         # Set commodity name
-        df_out["CommodityName"] = [commodity_name] * df_in.shape[0]
+        df_out["CommodityName"] = commodity_name
 
         # Set trading date
-        col_date = f"DateTime({timezone})"
-        trading_date = [d.normalize() - relativedelta(days=1) for d in df_in[col_date]]
-        df_out["TradingDate"] = trading_date
+        df_out["TradingDate"] = df_in[col_date].dt.normalize() - pd.Timedelta(days=1)
 
         # Set delivery start date
         df_out["DeliveryStart"] = df_in[col_date]
 
         # Set delivery end date
-        delivery_end = list()
-        for i in df_in.index:
-            start_date = df_out.loc[i, "DeliveryStart"]
-            offset = df_in.loc[i, "ResolutionCode"]
-            match offset:
-                case "PT60M":
-                    offset = 60
-                case "PT15M":
-                    offset = 15
-                case _:
-                    raise ValueError("Resolution not supported.")
-            end_date = start_date + relativedelta(minutes=offset)
-            delivery_end.append(end_date)
-        df_out["DeliveryEnd"] = delivery_end
+        df_out["DeliveryEnd"] = df_in[col_date] + resolution
 
         # Set tenor
         df_out["Tenor"] = "Spot"
@@ -336,9 +1615,10 @@ class DetDatabase:
 
         return df_out
 
+    @instrumented
     def load_entsoe_imbalance_prices(
         self,
-        commodity_name: str,
+        commodity_name: str | list,
         start_trading_date: datetime = None,
         end_trading_date: datetime = None,
         start_delivery_date: datetime = None,
@@ -346,12 +1626,18 @@ class DetDatabase:
         columns: list = None,
         process_data: bool = True,
         timezone_aware_dates: bool = False,
-    ) -> pd.DataFrame:
+        resolution: str = None,
+        chunksize: int = None,
+        output_format: str = "frame",
+    ) -> pd.DataFrame | dict | Iterator[pd.DataFrame]:
         """
         Loads entsoe imbalance prices from the database.
 
         Args:
-            commodity_name: Commodity name (as defined in the [META].[Commodity] database table)
+            commodity_name: Commodity name (as defined in the [META].[Commodity] database table),
+                or list of commodity names. If a list is provided, the data of all commodities
+                is fetched with a single query, and processed per commodity (each commodity in
+                its own local timezone).
             start_trading_date: Start trading date
             end_trading_date: End trading date
                 Note: The user should provide either 'start_trading_date' and 'end_trading_date',
@@ -363,13 +1649,25 @@ class DetDatabase:
                 Note: The user should provide either 'start_trading_date' and 'end_trading_date',
                 or 'start_delivery_date' and 'end_delivery_date'.
             columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get
-                all columns.
+                all columns. If None, the default columns of the table are queried (see
+                get_default_columns()).
             process_data: Indicates if data should be processed convert to standardized format
             timezone_aware_dates: If true, returns all dates as timezone-aware. Otherwise,
                 returns them as timezone-naive.
+            resolution: ENTSOE resolution code of the imbalance settlement period (e.g. "PT15M",
+                "PT30M", "PT60M"). Only used when processing data. If None, the resolution is
+                inferred from the delivery dates.
+            chunksize: If provided, the data is streamed from the database and returned as an
+                iterator of dataframes with (at most) 'chunksize' rows each, sorted by delivery
+                date. The range cache is not used in that case. Only supported for a single
+                commodity.
+            output_format: Only used if 'commodity_name' is a list. Can take value "frame"
+                (returns one long dataframe, with the commodities in the order of the input list)
+                or "dict" (returns a dictionary of dataframes, with commodity names as keys).
 
         Returns:
-            Dataframe containing imbalance prices
+            Dataframe containing imbalance prices (or a dictionary of dataframes, or an iterator
+            of dataframes if 'chunksize' is provided)
 
         Raises:
             ValueError: Raises an error if input arguments 'columns' and 'process_data' are not
@@ -399,20 +1697,18 @@ class DetDatabase:
                 "Either 'start_trading_date' and 'end_trading_date', or 'start_delivery_date' "
                 "and 'end_delivery_date' should be provided."
             )
+        if isinstance(commodity_name, list) and chunksize is not None:
+            raise ValueError(
+                "Input argument 'chunksize' is only supported for a single commodity name."
+            )
 
         # Set default column values
         if columns is None:
-            columns = [
-                "DateTime(UTC)",
-                "MapCode",
-                "PositiveImbalancePrice",
-                "NegativeImbalancePrice",
-                "Currency",
-            ]
+            columns = DetDatabase.get_default_columns("entsoe_imbalance_price")
 
         # Always add delivery date column
         if "DateTime(UTC)" not in columns and columns != ["*"]:
-            columns.append("DateTime(UTC)")
+            columns = columns + ["DateTime(UTC)"]
 
         # Convert columns from list to string
         if len(columns) == 1:
@@ -420,6 +1716,33 @@ class DetDatabase:
         else:
             columns_str = f"[{'], ['.join(columns)}]"
 
+        # Load multiple commodities at once
+        if isinstance(commodity_name, list):
+
+            def format_commodity_data(df_raw: pd.DataFrame, name: str, tz: str) -> pd.DataFrame:
+                return DetDatabase._format_entsoe_imbalance_prices(
+                    df_raw,
+                    name,
+                    tz,
+                    process_data,
+                    timezone_aware_dates,
+                    resolution,
+                    presorted=self.sql_pushdown,
+                )
+
+            return self._load_entsoe_prices_multi(
+                def_key="entsoe_imbalance_price",
+                commodity_names=commodity_name,
+                start_trading_date=start_trading_date,
+                end_trading_date=end_trading_date,
+                start_delivery_date=start_delivery_date,
+                end_delivery_date=end_delivery_date,
+                columns=columns,
+                delivery_lag_days=0,
+                format_function=format_commodity_data,
+                output_format=output_format,
+            )
+
         # Get commodity information (map code and local timezone)
         # Note: The local timezone is important because ENTSOE provides all prices in the UTC
         # timezone. We first convert the dates from UTC to the local timezone, and then filter
@@ -432,66 +1755,142 @@ class DetDatabase:
         map_code = commodity_info["EntsoeMapCode"]
         timezone = commodity_info["Timezone"]
 
-        # Convert start trading date to start delivery date
-        if start_trading_date is not None:
-            start_delivery_date = pd.Timestamp(start_trading_date).floor("D")
-
-        # Convert start delivery date from local timezone to UTC and string
-        start_delivery_date = start_delivery_date.replace(tzinfo=ZoneInfo(timezone))
-        start_delivery_date = start_delivery_date.astimezone(ZoneInfo("UTC"))
-        start_date_str = start_delivery_date.strftime("%Y-%m-%d %H:%M:%S")
-
-        # Convert end trading date to end delivery date
-        if end_trading_date is not None:
-            end_delivery_date = pd.Timestamp(end_trading_date).floor("D") + relativedelta(days=1)
+        # Convert trading/delivery dates to a UTC delivery interval
+        # Note: Imbalance prices are settled on the delivery day itself.
+        start_delivery_date, end_delivery_date = DetDatabase.get_entsoe_delivery_interval(
+            timezone=timezone,
+            start_trading_date=start_trading_date,
+            end_trading_date=end_trading_date,
+            start_delivery_date=start_delivery_date,
+            end_delivery_date=end_delivery_date,
+            delivery_lag_days=0,
+        )
 
-        # Convert end date to UTC and string
-        end_delivery_date = end_delivery_date.replace(tzinfo=ZoneInfo(timezone))
-        end_delivery_date = end_delivery_date.astimezone(ZoneInfo("UTC"))
-        end_date_str = end_delivery_date.strftime("%Y-%m-%d %H:%M:%S")
+        # Let the database server derive the local delivery dates, if possible
+        if not timezone_aware_dates:
+            local_date_expression = self.get_local_time_expression(
+                "DateTime(UTC)", timezone, f"DateTime({timezone})"
+            )
+            if local_date_expression is not None:
+                columns_str = f"{columns_str}, {local_date_expression}"
 
         # Query db
         table = DetDatabase.get_table_name("entsoe_imbalance_price")
-        query = (
-            f"SELECT {columns_str} FROM {table} "
-            f"WHERE MapCode='{map_code}' "
-            f"AND [DateTime(UTC)]>='{start_date_str}' "
-            f"AND [DateTime(UTC)]<'{end_date_str}' "
+        query = f"SELECT {columns_str} FROM {table} WHERE MapCode=:map_code"
+        params = dict(map_code=map_code)
+        empty_error_message = "No price data found for user-defined inputs."
+
+        def format_data(df_raw: pd.DataFrame) -> pd.DataFrame:
+            return DetDatabase._format_entsoe_imbalance_prices(
+                df_raw,
+                commodity_name,
+                timezone,
+                process_data,
+                timezone_aware_dates,
+                resolution,
+                presorted=self.sql_pushdown,
+            )
+
+        if chunksize is not None:
+            query, params = DetDatabase.add_date_filter(
+                query, "DateTime(UTC)", start_delivery_date, end_delivery_date, params
+            )
+            if process_data and resolution is None:
+                # Infer the resolution of the first and last rows of each chunk from the
+                # neighbouring chunks
+                chunks = self.iterate_chunks(
+                    query,
+                    table,
+                    chunksize,
+                    ["DateTime(UTC)"],
+                    lambda df_raw: df_raw,
+                    empty_error_message,
+                    params,
+                )
+                return DetDatabase.format_chunks_with_context(chunks, format_data)
+            return self.iterate_chunks(
+                query,
+                table,
+                chunksize,
+                ["DateTime(UTC)"],
+                format_data,
+                empty_error_message,
+                params,
+            )
+
+        df = self.query_db_date_range(
+            query=query,
+            table=table,
+            date_column="DateTime(UTC)",
+            start_date=start_delivery_date,
+            end_date=end_delivery_date,
+            cache_key=(table, map_code, columns_str),
+            params=params,
+            order_by=["DateTime(UTC)"],
         )
-        df = self.query_db(query)
 
         if df.empty:
-            raise ValueError("No price data found for user-defined inputs.")
+            raise ValueError(empty_error_message)
 
-        # Sort data by delivery date
-        df.sort_values(
-            by=["DateTime(UTC)"], axis=0, ascending=True, inplace=True, ignore_index=True
-        )
+        df = format_data(df)
 
-        # Convert date columns to timezone-aware dates
-        cols_date_utc = ["DateTime(UTC)", "UpdateTime(UTC)", "InsertionTimestamp"]
-        for c in cols_date_utc:
-            if c in df.columns:
-                df[c] = df[c].dt.tz_localize("UTC")
+        return df
+
+    @staticmethod
+    def _format_entsoe_imbalance_prices(
+        df: pd.DataFrame,
+        commodity_name: str,
+        timezone: str,
+        process_data: bool,
+        timezone_aware_dates: bool,
+        resolution: str = None,
+        presorted: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Post-processes raw imbalance prices queried from the database.
+
+        Args:
+            df: Raw imbalance prices
+            commodity_name: Commodity name (as defined in the [META].[Commodity] database table)
+            timezone: Timezone of the power country/region
+            process_data: Indicates if data should be processed convert to standardized format
+            timezone_aware_dates: If true, returns all dates as timezone-aware. Otherwise,
+                returns them as timezone-naive.
+            resolution: ENTSOE resolution code of the imbalance settlement period
+            presorted: If true, the data is already sorted by delivery date (by the database
+                server), and is not sorted again.
+
+        Returns:
+            Post-processed imbalance prices
+        """
+        # Sort data by delivery date
+        if not presorted:
+            df.sort_values(
+                by=["DateTime(UTC)"], axis=0, ascending=True, inplace=True, ignore_index=True
+            )
 
         # Add column with delivery date expressed in local timezone
-        df[f"DateTime({timezone})"] = df["DateTime(UTC)"].dt.tz_convert(timezone)
+        # Note: The local delivery dates (timezone-naive) may already have been derived by the
+        # database server (see 'sql_pushdown' option).
+        col_local_date = f"DateTime({timezone})"
+        if col_local_date not in df.columns:
+            df[col_local_date] = convert_timezone(
+                df["DateTime(UTC)"], "UTC", timezone, timezone_aware_dates
+            )
 
-        if not timezone_aware_dates:
-            cols_date_all = cols_date_utc + [f"DateTime({timezone})"]
-            for c in cols_date_all:
-                if c in df.columns:
-                    df[c] = df[c].dt.tz_localize(None)
+        # Convert UTC date columns to timezone-aware dates, if requested
+        cols_date_utc = ["DateTime(UTC)", "UpdateTime(UTC)", "InsertionTimestamp"]
+        convert_timezones(df, cols_date_utc, "UTC", timezone_aware=timezone_aware_dates)
 
         # Process raw data and convert it to standardized format
         if process_data:
-            df = DetDatabase.process_imbalance_prices(df, commodity_name, timezone)
+            df = DetDatabase.process_imbalance_prices(df, commodity_name, timezone, resolution)
 
         return df
 
     @staticmethod
     def process_imbalance_prices(
-        df_in: pd.DataFrame, commodity_name: str, timezone: str
+        df_in: pd.DataFrame, commodity_name: str, timezone: str, resolution: str = None
     ) -> pd.DataFrame:
         """
         Processes imbalance prices and converts from ENTSOE format to standardized format.
@@ -500,27 +1899,49 @@ class DetDatabase:
             df_in: Dataframe containing imbalance prices
             commodity_name: Commodity name (as defined in the [META].[Commodity] database table)
             timezone: Timezone of the power country/region
+            resolution: ENTSOE resolution code of the imbalance settlement period (e.g. "PT15M",
+                "PT30M", "PT60M"). If None, the resolution of each delivery period is taken from
+                the 'ResolutionCode' column if available, and inferred from the delivery dates
+                otherwise (see infer_period_lengths()).
 
         Returns:
             Processed dataframe containing imbalance prices
+
+        Raises:
+            ValueError: Raises an error if the resolution code is not supported.
         """
         df_in.reset_index(drop=True, inplace=True)
+        col_date = f"DateTime({timezone})"
+
+        # Get length of the delivery periods
+        if resolution is not None:
+            if resolution not in DetDatabaseDefinitions.RESOLUTION_CODES:
+                raise ValueError(f"Resolution '{resolution}' not supported.")
+            period_length = DetDatabaseDefinitions.RESOLUTION_CODES[resolution]
+        elif "ResolutionCode" in df_in.columns:
+            resolution_codes = df_in["ResolutionCode"].astype(object)
+            period_length = resolution_codes.map(DetDatabaseDefinitions.RESOLUTION_CODES)
+            if period_length.isna().any():
+                raise ValueError("Resolution not supported.")
+        else:
+            # Infer from UTC dates when available, as they are not affected by DST switches
+            col_infer = "DateTime(UTC)" if "DateTime(UTC)" in df_in.columns else col_date
+            period_length = DetDatabase.infer_period_lengths(df_in[col_infer])
 
         # Initialize output dataframe
-        df_out = pd.DataFrame()
+        df_out = pd.DataFrame(index=df_in.index)
 
         # Set commodity name
-        df_out["CommodityName"] = [commodity_name] * df_in.shape[0]
+        df_out["CommodityName"] = commodity_name
 
         # Set trading date
-        df_out["TradingDate"] = df_in[f"DateTime({timezone})"].dt.floor("D")
+        df_out["TradingDate"] = df_in[col_date].dt.floor("D")
 
         # Set delivery start date
-        df_out["DeliveryStart"] = df_in[f"DateTime({timezone})"]
+        df_out["DeliveryStart"] = df_in[col_date]
 
         # Set delivery end date
-        delivery_end = [d + relativedelta(minutes=15) for d in df_in[f"DateTime({timezone})"]]
-        df_out["DeliveryEnd"] = delivery_end
+        df_out["DeliveryEnd"] = df_in[col_date] + period_length
 
         # Set tenor
         df_out["Tenor"] = "Imbalance"
@@ -531,6 +1952,58 @@ class DetDatabase:
 
         return df_out
 
+    @staticmethod
+    def infer_period_lengths(dates: pd.Series) -> pd.Series:
+        """
+        Infers the length of each delivery period from a series of delivery start dates, such
+        that windows spanning a change of resolution (e.g. from 60 to 15 minutes) get the right
+        delivery end dates.
+
+        The length of a delivery period is the time difference to the next (unique) delivery
+        start date, if this difference is a supported resolution, and is equal to or shorter
+        than the differences of the neighbouring periods. Other differences (e.g. caused by
+        missing data) are ignored, and the delivery periods concerned, as well as the last
+        delivery period, get the length of the previous delivery period (or of the next one, if
+        there is no previous one).
+
+        Args:
+            dates: Delivery start dates
+
+        Returns:
+            Length of each delivery period, with the same index as the input dates
+
+        Raises:
+            ValueError: Raises an error if the resolution cannot be inferred (e.g. if the series
+                contains less than two unique dates)
+        """
+        unique_dates = dates.drop_duplicates().sort_values().reset_index(drop=True)
+
+        # Time difference to the next date
+        gaps = unique_dates.diff().shift(-1)
+        # Note: Gaps caused by missing data are longer than the neighbouring gaps.
+        previous_gaps = gaps.shift(1)
+        next_gaps = gaps.shift(-1)
+        is_valid = gaps.isin(DetDatabaseDefinitions.RESOLUTION_CODES.values()) & (
+            (gaps == previous_gaps)
+            | (gaps == next_gaps)
+            | (
+                ((gaps <= previous_gaps) | previous_gaps.isna())
+                & ((gaps <= next_gaps) | next_gaps.isna())
+            )
+        )
+
+        # Fill unsupported differences and last period with neighbouring period lengths
+        period_lengths = gaps.where(is_valid).ffill().bfill()
+        if period_lengths.isna().any():
+            raise ValueError(
+                "Resolution of the delivery periods cannot be inferred from the delivery dates. "
+                "Input argument 'resolution' should be provided."
+            )
+
+        period_lengths.index = pd.Index(unique_dates)
+        return pd.Series(dates.map(period_lengths).values, index=dates.index)
+
+    @instrumented
     def load_futures_eod_settlement_prices(
         self,
         commodity_name: str,
@@ -540,7 +2013,8 @@ class DetDatabase:
         delivery_type: str,
         columns: list = None,
         timezone_aware_dates: bool = False,
-    ) -> pd.DataFrame:
+        chunksize: int = None,
+    ) -> pd.DataFrame | Iterator[pd.DataFrame]:
         """
         Loads futures end-of-day settlement prices from the database, over a user-defined range
         of trading dates.
@@ -552,19 +2026,24 @@ class DetDatabase:
             tenors: Product tenors (e.g. "Month", "Quarter", "Year")
             delivery_type: Delivery type ("Base", "Peak", "Offpeak")
             columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get
-                all columns.
+                all columns. If None, the default columns of the table are queried (see
+                get_default_columns()).
             timezone_aware_dates: If true, returns all dates as timezone-aware. Otherwise,
                 returns them as timezone-naive.
+            chunksize: If provided, the data is streamed from the database and returned as an
+                iterator of dataframes with (at most) 'chunksize' rows each, sorted by trading
+                date and delivery period. The range cache is not used in that case.
 
         Returns:
-            Dataframe containing futures end-of-day settlement prices
+            Dataframe containing futures end-of-day settlement prices (or an iterator of
+            dataframes, if 'chunksize' is provided)
 
         Raises:
             ValueError: Raises an error if no price data is found for user inputs
         """
         # Set default column values
         if columns is None:
-            columns = ["*"]
+            columns = DetDatabase.get_default_columns("futures_tt")
 
         # Convert columns from list to string
         if len(columns) == 1:
@@ -572,64 +2051,118 @@ class DetDatabase:
         else:
             columns_str = f"[{'], ['.join(columns)}]"
 
-        # Convert tenors from list to string
-        tenors_str = f"({' ,'.join([repr(item) for item in tenors])})"
-
-        # Convert dates from datetime to string
-        start_trading_date_str = start_trading_date.strftime("%Y-%m-%d")
-        end_trading_date_str = end_trading_date.strftime("%Y-%m-%d")
+        # Convert trading dates to a date interval (end date excluded)
+        start_trading_date = pd.Timestamp(start_trading_date).floor("D")
+        end_trading_date = pd.Timestamp(end_trading_date).floor("D") + relativedelta(days=1)
 
         # Query db
+        # Note: The range cache can only be used if the trading date column is queried.
         table = DetDatabase.get_table_name("futures_tt")
         query = (
             f"SELECT {columns_str} FROM {table} "
-            f"WHERE CommodityName='{commodity_name}' "
-            f"AND TradingDate>='{start_trading_date_str}' "
-            f"AND TradingDate<='{end_trading_date_str}' "
-            f"AND Tenor IN {tenors_str} "
-            f"AND DeliveryType='{delivery_type}'"
+            "WHERE CommodityName=:commodity_name "
+            "AND Tenor IN :tenors "
+            "AND DeliveryType=:delivery_type"
+        )
+        params = dict(
+            commodity_name=commodity_name, tenors=list(tenors), delivery_type=delivery_type
+        )
+        empty_error_message = "No price data found for user-defined inputs."
+
+        # Get local timezone
+        if timezone_aware_dates:
+            commodity_info = self.get_commodity_info(
+                filter_column="Name", filter_value=commodity_name, info_columns=["Timezone"]
+            )
+            timezone = commodity_info["Timezone"]
+        else:
+            timezone = None
+
+        def format_data(df_raw: pd.DataFrame) -> pd.DataFrame:
+            return DetDatabase._format_futures_eod_settlement_prices(
+                df_raw, timezone, presorted=self.sql_pushdown
+            )
+
+        if chunksize is not None:
+            query, params = DetDatabase.add_date_filter(
+                query, "TradingDate", start_trading_date, end_trading_date, params, as_date=True
+            )
+            order_by = ["TradingDate", "DeliveryStart", "DeliveryEnd"]
+            return self.iterate_chunks(
+                query, table, chunksize, order_by, format_data, empty_error_message, params
+            )
+
+        if columns == ["*"] or "TradingDate" in columns:
+            cache_key = (table, commodity_name, tuple(tenors), delivery_type, columns_str)
+        else:
+            cache_key = None
+        df = self.query_db_date_range(
+            query=query,
+            table=table,
+            date_column="TradingDate",
+            start_date=start_trading_date,
+            end_date=end_trading_date,
+            cache_key=cache_key,
+            params=params,
+            as_date=True,
+            order_by=DetDatabase.get_sort_columns(
+                ["TradingDate", "DeliveryStart", "DeliveryEnd"], columns
+            ),
         )
-        df = self.query_db(query)
 
-        if df.empty:
-            raise ValueError("No price data found for user-defined inputs.")
+        if df.empty:
+            raise ValueError(empty_error_message)
+
+        df = format_data(df)
+
+        return df
+
+    @staticmethod
+    def _format_futures_eod_settlement_prices(
+        df: pd.DataFrame, timezone: str, presorted: bool = False
+    ) -> pd.DataFrame:
+        """
+        Post-processes raw futures end-of-day settlement prices queried from the database.
+
+        Args:
+            df: Raw futures end-of-day settlement prices
+            timezone: Local timezone of the commodity. If provided, dates are converted to
+                timezone-aware dates. Otherwise, they are kept timezone-naive.
+            presorted: If true, the data is already sorted (by the database server), and is not
+                sorted again.
 
+        Returns:
+            Post-processed futures end-of-day settlement prices
+        """
         # Sort data
         cols_sort = ["TradingDate", "DeliveryStart", "DeliveryEnd"]
         cols_sort = [c for c in cols_sort if c in df.columns]
-        if len(cols_sort) > 0:
+        if len(cols_sort) > 0 and not presorted:
             df.sort_values(by=cols_sort, axis=0, ascending=True, inplace=True, ignore_index=True)
 
-        # Convert dates from datetime.date to pd.Timestamp
+        # Convert dates from datetime.date to pd.Timestamp, and to timezone-aware dates if a
+        # timezone is provided
+        is_timezone_aware = timezone is not None
         cols_date = ["TradingDate", "DeliveryStart", "DeliveryEnd"]
-        for c in cols_date:
-            if c in df.columns:
-                df[c] = pd.DatetimeIndex(df[c])
-
-        if timezone_aware_dates:
-            # Get local timezone
-            commodity_info = self.get_commodity_info(
-                filter_column="Name", filter_value=commodity_name, info_columns=["Timezone"]
-            )
-            timezone = commodity_info["Timezone"]
-
-            # Convert timezone-naive to timezone-aware dates
-            df["InsertionTimestamp"] = df["InsertionTimestamp"].dt.tz_localize("UTC")
-            cols_local_tz = ["TradingDate", "DeliveryStart", "DeliveryEnd"]
-            for c in cols_local_tz:
-                if c in df.columns:
-                    df[c] = df[c].dt.tz_localize(timezone)
+        convert_timezones(df, cols_date, timezone, timezone_aware=is_timezone_aware)
+        if is_timezone_aware:
+            convert_timezones(df, ["InsertionTimestamp"], "UTC", timezone_aware=True)
 
         return df
 
-    def load_commodities(self, columns: list = None, conditions: str = None) -> pd.DataFrame:
+    @instrumented
+    def load_commodities(
+        self, columns: list = None, conditions: str = None, params: dict = None
+    ) -> pd.DataFrame:
         """
         General method to load data from the database's commodity table.
 
         Args:
             columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get
                 all columns.
-            conditions: Optional conditions to add to SQL query. E.g. "WHERE Name='DutchPower'".
+            conditions: Optional conditions to add to SQL query. E.g. "WHERE Name=:name".
+            params: Values of the bound parameters of the conditions. E.g.
+                dict(name="DutchPower").
 
         Returns:
             Table data
@@ -646,11 +2179,12 @@ class DetDatabase:
 
         # Query db
         table = DetDatabase.get_table_name("commodity")
-        query = f"SELECT {columns_str} FROM {table} {conditions}"
-        df = self.query_db(query)
+        query = f"SELECT {columns_str} FROM {table} {conditions or ''}".strip()
+        df = self.query_db(query, table, params)
 
         return df
 
+    @instrumented
     def get_commodity_info(
         self, filter_column: str, filter_value: str, info_columns: list
     ) -> dict:
@@ -669,30 +2203,79 @@ class DetDatabase:
             ValueError: Raises an error if match with input filter value is not unique
             ValueError: Raises an error if the input filter value is not found
         """
+        if self.cache_metadata:
+            info = self.get_metadata_info("commodity", filter_column, [filter_value], info_columns)
+            return info[filter_value]
+
         # Get commodity information for user-defined filtering criteria
-        condition = f"WHERE {filter_column}='{filter_value}'"
-        commodity_info = self.load_commodities(columns=info_columns, conditions=condition)
+        condition = f"WHERE {DetDatabase.get_metadata_filter_condition(filter_column)}"
+        commodity_info = self.load_commodities(
+            columns=list(dict.fromkeys(info_columns + [filter_column])),
+            conditions=condition,
+            params=dict(filter_values=[filter_value]),
+        )
 
-        # Validate response
-        if commodity_info.shape[0] > 1:
-            raise ValueError(f"More than one match found for {filter_column}={filter_value}.")
+        # Validate response and convert dataframe row to dict
+        commodity_info = DetDatabase.find_metadata_info(
+            commodity_info,
+            filter_column,
+            [filter_value],
+            info_columns,
+            get_available_values=lambda: self.load_commodities(columns=[filter_column]),
+        )
 
-        elif commodity_info.shape[0] == 0:
-            available_values = self.load_commodities(columns=[filter_column])
-            available_values_str = ", ".join(f"'{x}'" for x in available_values[filter_column])
-            raise ValueError(
-                f"Value {filter_value} not found in column '{filter_column}'. Available values: "
-                f"{available_values_str}."
-            )
+        return commodity_info[filter_value]
+
+    @instrumented
+    def get_commodities_info(
+        self, filter_column: str, filter_values: list, info_columns: list
+    ) -> dict:
+        """
+        Finds information related to multiple user-defined commodities, with a single query.
+
+        Args:
+            filter_column: Column used to filter data for specific commodities
+            filter_values: Values used to filter data for specific commodities
+            info_columns: Columns containing the requested information
+
+        Returns:
+            A dictionary containing, for each filter value, a dictionary with the requested
+            information
+
+        Raises:
+            ValueError: Raises an error if match with an input filter value is not unique
+            ValueError: Raises an error if an input filter value is not found
+        """
+        if self.cache_metadata:
+            return self.get_metadata_info("commodity", filter_column, filter_values, info_columns)
+
+        # Get commodity information for user-defined filtering criteria
+        condition = f"WHERE {DetDatabase.get_metadata_filter_condition(filter_column)}"
+        commodities_info = self.load_commodities(
+            columns=list(dict.fromkeys(info_columns + [filter_column])),
+            conditions=condition,
+            params=dict(filter_values=list(dict.fromkeys(filter_values))),
+        )
 
-        # Convert dataframe row to dict
-        commodity_info = commodity_info.loc[0, :].to_dict()
+        # Validate response and convert dataframe rows to dicts
+        commodities_info = DetDatabase.find_metadata_info(
+            commodities_info,
+            filter_column,
+            filter_values,
+            info_columns,
+            get_available_values=lambda: self.load_commodities(columns=[filter_column]),
+        )
 
-        return commodity_info
+        return commodities_info
 
+    @instrumented
     def load_account_positions(
-        self, start_trading_date: datetime, end_trading_date: datetime, columns: list = None
-    ) -> pd.DataFrame:
+        self,
+        start_trading_date: datetime,
+        end_trading_date: datetime,
+        columns: list = None,
+        chunksize: int = None,
+    ) -> pd.DataFrame | Iterator[pd.DataFrame]:
         """
         Loads account positions from the database, over a user-defined range of trading dates.
 
@@ -700,17 +2283,22 @@ class DetDatabase:
             start_trading_date: Start trading date.
             end_trading_date: End trading date.
             columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get
-                all columns.
+                all columns. If None, the default columns of the table are queried (see
+                get_default_columns()).
+            chunksize: If provided, the data is streamed from the database and returned as an
+                iterator of dataframes with (at most) 'chunksize' rows each, sorted by insertion
+                timestamp.
 
         Returns:
-            Dataframe containing account positions.
+            Dataframe containing account positions (or an iterator of dataframes, if 'chunksize'
+            is provided).
 
         Raises:
             ValueError: Raises an error if no position data is found for user inputs.
         """
         # Set default column values
         if columns is None:
-            columns = ["*"]
+            columns = DetDatabase.get_default_columns("account_position")
 
         # Convert columns from list to string
         if len(columns) == 1:
@@ -718,37 +2306,75 @@ class DetDatabase:
         else:
             columns_str = f"[{'], ['.join(columns)}]"
 
-        # Convert dates from datetime to string
+        # Convert trading dates to a date interval (end date excluded)
+        start_trading_date = pd.Timestamp(start_trading_date).floor("D")
         end_trading_date = pd.Timestamp(end_trading_date).floor("D") + relativedelta(days=1)
-        start_trading_date_str = start_trading_date.strftime("%Y-%m-%d")
-        end_trading_date_str = end_trading_date.strftime("%Y-%m-%d")
 
         # Query db
         table = DetDatabase.get_table_name("account_position")
         query = (
             f"SELECT {columns_str} FROM {table} "
-            f"WHERE InsertionTimestamp>='{start_trading_date_str}' "
-            f"AND InsertionTimestamp<'{end_trading_date_str}'"
+            "WHERE InsertionTimestamp>=:start_trading_date "
+            "AND InsertionTimestamp<:end_trading_date"
+        )
+        params = dict(
+            start_trading_date=start_trading_date.to_pydatetime().date(),
+            end_trading_date=end_trading_date.to_pydatetime().date(),
         )
-        df = self.query_db(query)
+        empty_error_message = "No account position data found for user-defined inputs."
+
+        if chunksize is not None:
+            return self.iterate_chunks(
+                query,
+                table,
+                chunksize,
+                ["InsertionTimestamp"],
+                DetDatabase._format_account_positions,
+                empty_error_message,
+                params,
+            )
+
+        if self.sql_pushdown:
+            order_by = DetDatabase.get_sort_columns(["InsertionTimestamp"], columns)
+            query = DetDatabase.add_order_by(query, order_by)
+        df = self.query_db(query, table, params)
 
         # Assert data
         if df.empty:
-            raise ValueError("No account position data found for user-defined inputs.")
+            raise ValueError(empty_error_message)
 
+        df = DetDatabase._format_account_positions(df, presorted=self.sql_pushdown)
+
+        return df
+
+    @staticmethod
+    def _format_account_positions(df: pd.DataFrame, presorted: bool = False) -> pd.DataFrame:
+        """
+        Post-processes raw account positions queried from the database.
+
+        Args:
+            df: Raw account positions
+            presorted: If true, the data is already sorted (by the database server), and is not
+                sorted again.
+
+        Returns:
+            Post-processed account positions
+        """
         # Sort data and convert dates from datetime.date to pd.Timestamp
         if "InsertionTimestamp" in df.columns:
-            df.sort_values(
-                by=["InsertionTimestamp"],
-                axis=0,
-                ascending=True,
-                inplace=True,
-                ignore_index=True,
-            )
+            if not presorted:
+                df.sort_values(
+                    by=["InsertionTimestamp"],
+                    axis=0,
+                    ascending=True,
+                    inplace=True,
+                    ignore_index=True,
+                )
             df["InsertionTimestamp"] = pd.DatetimeIndex(df["InsertionTimestamp"])
 
         return df
 
+    @instrumented
     def load_instruments(self, identifiers: list, columns: list = None) -> pd.DataFrame:
         """
         Loads instrument data based on identifier (of account positions) from the database.
@@ -756,7 +2382,8 @@ class DetDatabase:
         Args:
             identifiers: Instrument identifiers (of account positions).
             columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get
-                all columns.
+                all columns. If None, the default columns of the table are queried (see
+                get_default_columns()).
 
         Returns:
             Dataframe containing instrument data.
@@ -766,7 +2393,7 @@ class DetDatabase:
         """
         # Set default column values
         if columns is None:
-            columns = ["*"]
+            columns = DetDatabase.get_default_columns("instrument")
 
         # Convert columns from list to string
         if len(columns) == 1:
@@ -774,13 +2401,11 @@ class DetDatabase:
         else:
             columns_str = f"[{'], ['.join(columns)}]"
 
-        # Convert tenors from list to string
-        identifiers_str = ", ".join(f"'{i}'" for i in identifiers)
-
         # Query db
+        # Note: Long lists of identifiers are split into batches of queries.
         table = DetDatabase.get_table_name("instrument")
-        query = f"SELECT {columns_str} FROM {table} WHERE [id] IN ({identifiers_str})"
-        df = self.query_db(query)
+        query = f"SELECT {columns_str} FROM {table} WHERE [id] IN :identifiers"
+        df = self.query_db_batched(query, table, "identifiers", [str(i) for i in identifiers])
 
         # Assert data
         if df.empty:
@@ -788,13 +2413,15 @@ class DetDatabase:
 
         return df
 
+    @instrumented
     def load_eex_eod_prices(
         self,
         product_code: str,
         start_trading_date: datetime,
         end_trading_date: datetime,
         columns: list = None,
-    ) -> pd.DataFrame:
+        chunksize: int = None,
+    ) -> pd.DataFrame | Iterator[pd.DataFrame]:
         """
         Loads futures end-of-day EEX prices from the database, over a user-defined range of trading
         dates.
@@ -806,46 +2433,90 @@ class DetDatabase:
             start_trading_date: Start trading date.
             end_trading_date: End trading date.
             columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get
-                all columns.
+                all columns. If None, the default columns of the table are queried (see
+                get_default_columns()).
+            chunksize: If provided, the data is streamed from the database and returned as an
+                iterator of dataframes with (at most) 'chunksize' rows each, sorted by trading
+                date and delivery period. Note that duplicates are then only dropped within
+                each chunk.
 
         Returns:
-            Dataframe containing EEX futures end-of-day prices.
+            Dataframe containing EEX futures end-of-day prices (or an iterator of dataframes, if
+            'chunksize' is provided).
 
         Raises:
             ValueError: Raises an error if no price data is found for user inputs.
         """
         # Set default column values
         if columns is None:
-            columns = ["*"]
+            columns = DetDatabase.get_default_columns("futures_eex")
 
         # Convert columns from list to string
-        if len(columns) == 1:
+        if columns == ["*"]:
+            columns_str = "*"
+        elif len(columns) == 1:
             columns_str = f"[{columns[0]}]"
         else:
             columns_str = f"[{'], ['.join(columns)}]"
 
-        # Convert dates from datetime to string
-        start_trading_date_str = start_trading_date.strftime("%Y-%m-%d")
-        end_trading_date_str = end_trading_date.strftime("%Y-%m-%d")
-
         # Query db
         table = DetDatabase.get_table_name("futures_eex")
         query = (
             f"SELECT {columns_str} FROM {table} "
-            f"WHERE Product LIKE '{product_code}' "
-            f"AND TradingDate>='{start_trading_date_str}' "
-            f"AND TradingDate<='{end_trading_date_str}'"
+            "WHERE Product LIKE :product_code "
+            "AND TradingDate>=:start_trading_date "
+            "AND TradingDate<=:end_trading_date"
+        )
+        params = dict(
+            product_code=product_code,
+            start_trading_date=pd.Timestamp(start_trading_date).to_pydatetime().date(),
+            end_trading_date=pd.Timestamp(end_trading_date).to_pydatetime().date(),
         )
-        df = self.query_db(query)
+        empty_error_message = "No price data found for user-defined inputs."
+
+        if chunksize is not None:
+            return self.iterate_chunks(
+                query,
+                table,
+                chunksize,
+                ["TradingDate", "Delivery Start", "Delivery End"],
+                DetDatabase._format_eex_eod_prices,
+                empty_error_message,
+                params,
+            )
+
+        if self.sql_pushdown:
+            order_by = DetDatabase.get_sort_columns(
+                ["TradingDate", "Delivery Start", "Delivery End"], columns
+            )
+            query = DetDatabase.add_order_by(query, order_by)
+        df = self.query_db(query, table, params)
 
         # Assert data
         if df.empty:
-            raise ValueError("No price data found for user-defined inputs.")
+            raise ValueError(empty_error_message)
+
+        df = DetDatabase._format_eex_eod_prices(df, presorted=self.sql_pushdown)
+
+        return df
 
+    @staticmethod
+    def _format_eex_eod_prices(df: pd.DataFrame, presorted: bool = False) -> pd.DataFrame:
+        """
+        Post-processes raw EEX futures end-of-day prices queried from the database.
+
+        Args:
+            df: Raw EEX futures end-of-day prices
+            presorted: If true, the data is already sorted (by the database server), and is not
+                sorted again.
+
+        Returns:
+            Post-processed EEX futures end-of-day prices
+        """
         # Sort data
         cols_sort = ["TradingDate", "Delivery Start", "Delivery End"]
         cols_sort = [c for c in cols_sort if c in df.columns]
-        if len(cols_sort) > 0:
+        if len(cols_sort) > 0 and not presorted:
             df.sort_values(by=cols_sort, axis=0, ascending=True, inplace=True, ignore_index=True)
 
         # Convert dates from datetime.date to pd.Timestamp
@@ -859,6 +2530,7 @@ class DetDatabase:
 
         return df
 
+    @instrumented
     def load_forecast_customer_volume(
         self,
         profile: str,
@@ -868,7 +2540,8 @@ class DetDatabase:
         local_timezone: str,
         timezone_aware_dates: bool = False,
         columns: list = None,
-    ) -> pd.DataFrame:
+        chunksize: int = None,
+    ) -> pd.DataFrame | Iterator[pd.DataFrame]:
         """
         Loads customer volume forecasts from the database.
 
@@ -890,11 +2563,16 @@ class DetDatabase:
             local_timezone: Local timezone (needed to account for DST switches).
             timezone_aware_dates: If true, returns all dates as timezone-aware. Otherwise, returns
                 them as timezone-naive.
-            columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get all
-                columns.
+            columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get
+                all columns. If None, the default columns of the table are queried (see
+                get_default_columns()).
+            chunksize: If provided, the data is streamed from the database and returned as an
+                iterator of dataframes with (at most) 'chunksize' rows each, sorted by delivery
+                date.
 
         Returns:
-            Dataframe containing customer volume forecasts.
+            Dataframe containing customer volume forecasts (or an iterator of dataframes, if
+            'chunksize' is provided).
 
         Raises:
             ValueError: Raises an error if no volume forecast data is found for user inputs.
@@ -908,18 +2586,16 @@ class DetDatabase:
 
         # Convert start delivery date from local timezone to UTC and string
         start_delivery_date = start_delivery_date.replace(tzinfo=ZoneInfo(local_timezone))
-        start_delivery_date = start_delivery_date.astimezone(ZoneInfo("UTC"))
-        start_date_str = start_delivery_date.strftime("%Y-%m-%d %H:%M:%S")
+        start_delivery_date = start_delivery_date.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
 
         # Convert end delivery date form local timezone to UTC and string
         end_delivery_date = pd.Timestamp(end_delivery_date).floor("D") + relativedelta(days=1)
         end_delivery_date = end_delivery_date.replace(tzinfo=ZoneInfo(local_timezone))
-        end_delivery_date = end_delivery_date.astimezone(ZoneInfo("UTC"))
-        end_date_str = end_delivery_date.strftime("%Y-%m-%d %H:%M:%S")
+        end_delivery_date = end_delivery_date.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
 
         # Set default column values
         if columns is None:
-            columns = ["*"]
+            columns = DetDatabase.get_default_columns("client_volume_forecast")
 
         # Convert columns from list to string
         if len(columns) == 1:
@@ -927,28 +2603,79 @@ class DetDatabase:
         else:
             columns_str = f"[{'], ['.join(columns)}]"
 
-        # Convert dates from datetime to string
-        forecast_date_str = forecast_date.strftime("%Y-%m-%d")
-
         # Query db
         table = DetDatabase.get_table_name("client_volume_forecast")
         query = (
             f"SELECT {columns_str} FROM {table} "
-            f"WHERE Profile='{profile}' "
-            f"AND ForecastDate='{forecast_date_str}' "
-            f"AND Datetime>='{start_date_str}' "
-            f"AND Datetime<'{end_date_str}'"
+            "WHERE Profile=:profile "
+            "AND ForecastDate=:forecast_date"
+        )
+        params = dict(
+            profile=profile, forecast_date=pd.Timestamp(forecast_date).to_pydatetime().date()
+        )
+        empty_error_message = "No volume forecast data found for user-defined inputs."
+
+        def format_data(df_raw: pd.DataFrame) -> pd.DataFrame:
+            return DetDatabase._format_forecast_customer_volume(
+                df_raw, local_timezone, timezone_aware_dates, presorted=self.sql_pushdown
+            )
+
+        if chunksize is not None:
+            query, params = DetDatabase.add_date_filter(
+                query, "Datetime", start_delivery_date, end_delivery_date, params
+            )
+            return self.iterate_chunks(
+                query,
+                table,
+                chunksize,
+                ["Profile", "ForecastDate", "Datetime"],
+                format_data,
+                empty_error_message,
+                params,
+            )
+
+        df = self.query_db_date_range(
+            query=query,
+            table=table,
+            date_column="Datetime",
+            start_date=start_delivery_date,
+            end_date=end_delivery_date,
+            params=params,
+            order_by=DetDatabase.get_sort_columns(
+                ["Profile", "ForecastDate", "Datetime"], columns
+            ),
         )
-        df = self.query_db(query)
 
         # Assert data
         if df.empty:
-            raise ValueError("No volume forecast data found for user-defined inputs.")
+            raise ValueError(empty_error_message)
+
+        df = format_data(df)
+
+        return df
+
+    @staticmethod
+    def _format_forecast_customer_volume(
+        df: pd.DataFrame, local_timezone: str, timezone_aware_dates: bool, presorted: bool = False
+    ) -> pd.DataFrame:
+        """
+        Post-processes raw customer volume forecasts queried from the database.
+
+        Args:
+            df: Raw customer volume forecasts
+            local_timezone: Local timezone (needed to account for DST switches).
+            timezone_aware_dates: If true, returns all dates as timezone-aware. Otherwise, returns
+                them as timezone-naive.
+            presorted: If true, the data is already sorted (by the database server), and is not
+                sorted again.
 
+        Returns:
+            Post-processed customer volume forecasts
+        """
         # Sort data
         sort_cols = ["Profile", "ForecastDate", "Datetime"]
         sort_cols = [c for c in sort_cols if c in df.columns]
-        if len(sort_cols) > 0:
+        if len(sort_cols) > 0 and not presorted:
             df.sort_values(
                 by=sort_cols,
                 axis=0,
@@ -957,22 +2684,14 @@ class DetDatabase:
                 ignore_index=True,
             )
 
-        # Localize, convert and set timezone-(un)aware datetimes
-        cols_date = ["ForecastDate", "Datetime", "InsertionTimestamp"]
-        for c in cols_date:
-            if c in df.columns:
-                # Convert from datetime to pandas timestamp
-                df[c] = pd.DatetimeIndex(df[c])
-
-                # Convert to timezone-aware dates
-                if c == "ForecastDate":
-                    df[c] = df[c].dt.tz_localize(local_timezone)
-                else:
-                    df[c] = df[c].dt.tz_localize("UTC")
-                    df[c] = df[c].dt.tz_convert(local_timezone)
-
-                if not timezone_aware_dates:
-                    df[c] = df[c].dt.tz_localize(None)
+        # Convert dates to pandas timestamps in the local timezone, and set timezone-(un)aware
+        # dates
+        convert_timezones(
+            df, ["ForecastDate"], local_timezone, timezone_aware=timezone_aware_dates
+        )
+        convert_timezones(
+            df, ["Datetime", "InsertionTimestamp"], "UTC", local_timezone, timezone_aware_dates
+        )
 
         # Rescale column values
         df["kWh"] = df["kWh"] / 1000
@@ -982,6 +2701,7 @@ class DetDatabase:
 
         return df
 
+    @instrumented
     def load_customer_day_ahead_auction_bids(
         self,
         client_id: str,
@@ -990,7 +2710,8 @@ class DetDatabase:
         local_timezone: str,
         timezone_aware_dates: bool = False,
         columns: list = None,
-    ) -> pd.DataFrame:
+        chunksize: int = None,
+    ) -> pd.DataFrame | Iterator[pd.DataFrame]:
         """
         Loads customer day-ahead auction bids (volumes and limit prices) from the database.
 
@@ -1001,29 +2722,32 @@ class DetDatabase:
             local_timezone: Local timezone (needed to account for DST switches)
             timezone_aware_dates: If true, returns all dates as timezone-aware. Otherwise, returns
                 them as timezone-naive
-            columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get all
-                columns
+            columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get
+                all columns. If None, the default columns of the table are queried (see
+                get_default_columns())
+            chunksize: If provided, the data is streamed from the database and returned as an
+                iterator of dataframes with (at most) 'chunksize' rows each, sorted by insertion
+                timestamp and delivery date
 
         Returns:
-            Dataframe containing customer day-ahead auction bids
+            Dataframe containing customer day-ahead auction bids (or an iterator of dataframes,
+            if 'chunksize' is provided)
 
         Raises:
             ValueError: Raises an error if no data is found for user inputs
         """
         # Convert start delivery date from local timezone to UTC and string
         start_delivery_date = start_delivery_date.replace(tzinfo=ZoneInfo(local_timezone))
-        start_delivery_date = start_delivery_date.astimezone(ZoneInfo("UTC"))
-        start_date_str = start_delivery_date.strftime("%Y-%m-%d %H:%M:%S")
+        start_delivery_date = start_delivery_date.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
 
         # Convert end delivery date form local timezone to UTC and string
         end_delivery_date = pd.Timestamp(end_delivery_date).floor("D") + relativedelta(days=1)
         end_delivery_date = end_delivery_date.replace(tzinfo=ZoneInfo(local_timezone))
-        end_delivery_date = end_delivery_date.astimezone(ZoneInfo("UTC"))
-        end_date_str = end_delivery_date.strftime("%Y-%m-%d %H:%M:%S")
+        end_delivery_date = end_delivery_date.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
 
         # Set default column values
         if columns is None:
-            columns = ["*"]
+            columns = DetDatabase.get_default_columns("client_day_ahead_auction_bids")
 
         # Convert columns from list to string
         if len(columns) == 1:
@@ -1033,22 +2757,71 @@ class DetDatabase:
 
         # Query db
         table = DetDatabase.get_table_name("client_day_ahead_auction_bids")
-        query = (
-            f"SELECT {columns_str} FROM {table} "
-            f"WHERE ClientId='{client_id}' "
-            f"AND DeliveryStart>='{start_date_str}' "
-            f"AND DeliveryStart<'{end_date_str}'"
+        query = f"SELECT {columns_str} FROM {table} WHERE ClientId=:client_id"
+        params = dict(client_id=client_id)
+        empty_error_message = "No data found for user-defined inputs."
+
+        def format_data(df_raw: pd.DataFrame) -> pd.DataFrame:
+            return DetDatabase._format_customer_day_ahead_auction_bids(
+                df_raw, local_timezone, timezone_aware_dates, presorted=self.sql_pushdown
+            )
+
+        if chunksize is not None:
+            query, params = DetDatabase.add_date_filter(
+                query, "DeliveryStart", start_delivery_date, end_delivery_date, params
+            )
+            return self.iterate_chunks(
+                query,
+                table,
+                chunksize,
+                ["ClientId", "InsertionTimestamp", "DeliveryStart"],
+                format_data,
+                empty_error_message,
+                params,
+            )
+
+        df = self.query_db_date_range(
+            query=query,
+            table=table,
+            date_column="DeliveryStart",
+            start_date=start_delivery_date,
+            end_date=end_delivery_date,
+            params=params,
+            order_by=DetDatabase.get_sort_columns(
+                ["ClientId", "InsertionTimestamp", "DeliveryStart"], columns
+            ),
         )
-        df = self.query_db(query)
 
         # Assert data
         if df.empty:
-            raise ValueError("No data found for user-defined inputs.")
+            raise ValueError(empty_error_message)
+
+        df = format_data(df)
+
+        return df
+
+    @staticmethod
+    def _format_customer_day_ahead_auction_bids(
+        df: pd.DataFrame, local_timezone: str, timezone_aware_dates: bool, presorted: bool = False
+    ) -> pd.DataFrame:
+        """
+        Post-processes raw customer day-ahead auction bids queried from the database.
+
+        Args:
+            df: Raw customer day-ahead auction bids
+            local_timezone: Local timezone (needed to account for DST switches)
+            timezone_aware_dates: If true, returns all dates as timezone-aware. Otherwise, returns
+                them as timezone-naive
+            presorted: If true, the data is already sorted (by the database server), and is not
+                sorted again
 
+        Returns:
+            Post-processed customer day-ahead auction bids
+        """
         # Sort data
         sort_cols = ["ClientId", "InsertionTimestamp", "DeliveryStart"]
         sort_cols = [c for c in sort_cols if c in df.columns]
-        if len(sort_cols) > 0:
+        if len(sort_cols) > 0 and not presorted:
             df.sort_values(
                 by=sort_cols,
                 axis=0,
@@ -1057,33 +2830,29 @@ class DetDatabase:
                 ignore_index=True,
             )
 
-        # Localize, convert and set timezone-(un)aware datetimes
-        cols_date = ["DeliveryStart", "DeliveryEnd", "InsertionTimestamp"]
-        for c in cols_date:
-            if c in df.columns:
-                # Convert from datetime to pandas timestamp
-                df[c] = pd.DatetimeIndex(df[c])
-
-                # Convert to timezone-aware dates
-                if c == "InsertionTimestamp":
-                    df[c] = df[c].dt.tz_localize(local_timezone)
-                else:
-                    df[c] = df[c].dt.tz_localize("UTC")
-                    df[c] = df[c].dt.tz_convert(local_timezone)
-
-                if not timezone_aware_dates:
-                    df[c] = df[c].dt.tz_localize(None)
+        # Convert dates to pandas timestamps in the local timezone, and set timezone-(un)aware
+        # dates
+        convert_timezones(
+            df, ["InsertionTimestamp"], local_timezone, timezone_aware=timezone_aware_dates
+        )
+        convert_timezones(
+            df, ["DeliveryStart", "DeliveryEnd"], "UTC", local_timezone, timezone_aware_dates
+        )
 
         return df
 
-    def load_clients(self, columns: list = None, conditions: str = None) -> pd.DataFrame:
+    @instrumented
+    def load_clients(
+        self, columns: list = None, conditions: str = None, params: dict = None
+    ) -> pd.DataFrame:
         """
         General method to load data from the database's client table.
 
         Args:
             columns: Requested database table columns. Set columns=["*"] (i.e. as list) to get
                 all columns.
-            conditions: Optional conditions to add to SQL query. E.g. "WHERE Type='Supplier'".
+            conditions: Optional conditions to add to SQL query. E.g. "WHERE Type=:type".
+            params: Values of the bound parameters of the conditions. E.g. dict(type="Supplier").
 
         Returns:
             Table data
@@ -1100,11 +2869,12 @@ class DetDatabase:
 
         # Query db
         table = DetDatabase.get_table_name("client")
-        query = f"SELECT {columns_str} FROM {table} {conditions}"
-        df = self.query_db(query)
+        query = f"SELECT {columns_str} FROM {table} {conditions or ''}".strip()
+        df = self.query_db(query, table, params)
 
         return df
 
+    @instrumented
     def get_client_info(self, filter_column: str, filter_value: str, info_columns: list) -> dict:
         """
         Finds information related to a specific, user-defined client.
@@ -1121,37 +2891,329 @@ class DetDatabase:
             ValueError: Raises an error if match with input filter value is not unique
             ValueError: Raises an error if the input filter value is not found
         """
+        if self.cache_metadata:
+            info = self.get_metadata_info("client", filter_column, [filter_value], info_columns)
+            return info[filter_value]
+
         # Get client information for user-defined filtering criteria
-        condition = f"WHERE {filter_column}='{filter_value}'"
-        client_info = self.load_clients(columns=info_columns, conditions=condition)
+        condition = f"WHERE {DetDatabase.get_metadata_filter_condition(filter_column)}"
+        client_info = self.load_clients(
+            columns=list(dict.fromkeys(info_columns + [filter_column])),
+            conditions=condition,
+            params=dict(filter_values=[filter_value]),
+        )
 
-        # Validate response
-        if client_info.shape[0] > 1:
-            raise ValueError(f"More than one match found for {filter_column}={filter_value}.")
+        # Validate response and convert dataframe row to dict
+        client_info = DetDatabase.find_metadata_info(
+            client_info,
+            filter_column,
+            [filter_value],
+            info_columns,
+            get_available_values=lambda: self.load_clients(columns=[filter_column]),
+        )
 
-        elif client_info.shape[0] == 0:
-            available_values = self.load_clients(columns=[filter_column])
-            available_values_str = ", ".join(f"'{x}'" for x in available_values[filter_column])
-            raise ValueError(
-                f"Value {filter_value} not found in column '{filter_column}'. Available values: "
-                f"{available_values_str}."
-            )
+        return client_info[filter_value]
+
+    def refresh_metadata(self):
+        """
+        Reloads the cached metadata tables (commodity and/or client tables) from the database.
+        """
+        with self._metadata_lock:
+            def_keys = list(self._metadata.keys())
+            self._metadata = dict()
+            for def_key in def_keys:
+                self.get_metadata_table(def_key)
+
+    def get_metadata_table(self, def_key: str) -> pd.DataFrame:
+        """
+        Gets a cached metadata table. The table is loaded from the database on first use, and
+        reloaded when the metadata refresh interval has elapsed.
+
+        Args:
+            def_key: Definitions dictionary key corresponding to the metadata table ("commodity"
+                or "client")
+
+        Returns:
+            Metadata table
+        """
+        return self.get_metadata_entry(def_key)["data"]
+
+    def get_metadata_entry(self, def_key: str) -> dict:
+        """
+        Gets the cache entry of a metadata table, containing the table ('data') and the in-memory
+        indexes of its filter columns ('indexes').
+
+        Note: Entries are replaced (never modified) when the table is reloaded, such that the
+        table and indexes of an entry always belong together, even if the metadata is refreshed
+        by another thread.
+
+        Args:
+            def_key: Definitions dictionary key corresponding to the metadata table ("commodity"
+                or "client")
+
+        Returns:
+            Cache entry of the metadata table
+        """
+        with self._metadata_lock:
+            entry = self._metadata.get(def_key)
+            if entry is not None and self.metadata_refresh_interval is not None:
+                if time.monotonic() - entry["loaded_at"] > self.metadata_refresh_interval:
+                    entry = None
+
+            if entry is None:
+                if def_key == "commodity":
+                    df = self.load_commodities(columns=["*"])
+                else:
+                    df = self.load_clients(columns=["*"])
+                entry = dict(data=df, indexes=dict(), loaded_at=time.monotonic())
+                self._metadata[def_key] = entry
+
+        return entry
+
+    def get_metadata_info(
+        self, def_key: str, filter_column: str, filter_values: list, info_columns: list
+    ) -> dict:
+        """
+        Finds information related to specific rows of a cached metadata table, using an
+        in-memory index of the filter column.
+
+        Args:
+            def_key: Definitions dictionary key corresponding to the metadata table ("commodity"
+                or "client")
+            filter_column: Column used to filter data
+            filter_values: Values used to filter data
+            info_columns: Columns containing the requested information
+
+        Returns:
+            A dictionary containing, for each filter value, a dictionary with the requested
+            information
+
+        Raises:
+            ValueError: Raises an error if match with an input filter value is not unique
+            ValueError: Raises an error if an input filter value is not found
+        """
+        # Use the table and indexes of the same cache entry
+        entry = self.get_metadata_entry(def_key)
+        df = entry["data"]
+
+        # Get (or build) index mapping filter column values to row positions
+        with self._metadata_lock:
+            indexes = entry["indexes"]
+            if filter_column not in indexes:
+                indexes[filter_column] = DetDatabase.get_metadata_index(df, filter_column)
+            index = indexes[filter_column]
+
+        info = DetDatabase.find_metadata_info(
+            df, filter_column, filter_values, info_columns, index=index
+        )
 
-        # Convert dataframe row to dict
-        client_info = client_info.loc[0, :].to_dict()
+        return info
 
-        return client_info
+    @staticmethod
+    def normalize_metadata_value(value) -> str:
+        """
+        Normalizes a metadata filter value. Like the default (case-insensitive) collation of the
+        database, metadata lookups ignore letter case and trailing spaces.
+
+        Args:
+            value: Filter value
+
+        Returns:
+            Normalized filter value
+        """
+        return str(value).rstrip().lower()
+
+    @staticmethod
+    def get_metadata_filter_condition(filter_column: str) -> str:
+        """
+        Gets the SQL condition filtering a metadata table on a list of values (bound to
+        parameter 'filter_values'). The raw column is filtered, such that the database can use
+        its indexes. Letter case and trailing spaces are ignored by the default collation of the
+        database, consistently with normalize_metadata_value().
+
+        Args:
+            filter_column: Column used to filter data
+
+        Returns:
+            SQL condition
+        """
+        return f"[{filter_column}] IN :filter_values"
+
+    @staticmethod
+    def get_metadata_index(df: pd.DataFrame, filter_column: str) -> dict:
+        """
+        Builds an index mapping normalized filter column values to row positions.
+
+        Args:
+            df: Metadata table
+            filter_column: Column used to filter data
+
+        Returns:
+            Dictionary mapping normalized filter column values to arrays of row positions
+        """
+        return df.groupby(df[filter_column].map(DetDatabase.normalize_metadata_value)).indices
+
+    @staticmethod
+    def find_metadata_info(
+        df: pd.DataFrame,
+        filter_column: str,
+        filter_values: list,
+        info_columns: list,
+        index: dict = None,
+        get_available_values: Callable[[], pd.DataFrame] = None,
+    ) -> dict:
+        """
+        Finds information related to specific rows of a metadata table. Filter values are
+        matched with normalize_metadata_value(), for both cached and queried metadata.
+
+        Args:
+            df: Metadata table (or the rows of the table matching the filter values)
+            filter_column: Column used to filter data
+            filter_values: Values used to filter data
+            info_columns: Columns containing the requested information
+            index: Index of the filter column (see get_metadata_index()). If None, the index is
+                built from the input dataframe.
+            get_available_values: Function returning a dataframe with all values of the filter
+                column, listed in the error message if a filter value is not found. If None, the
+                values of the input dataframe are listed.
+
+        Returns:
+            A dictionary containing, for each filter value, a dictionary with the requested
+            information
 
-    def add_table(self, df: pd.DataFrame, table_name: str, schema: str):
+        Raises:
+            ValueError: Raises an error if match with an input filter value is not unique
+            ValueError: Raises an error if an input filter value is not found
+        """
+        if index is None:
+            index = DetDatabase.get_metadata_index(df, filter_column)
+
+        info = dict()
+        for value in filter_values:
+            positions = index.get(DetDatabase.normalize_metadata_value(value), list())
+            if len(positions) > 1:
+                raise ValueError(f"More than one match found for {filter_column}={value}.")
+            elif len(positions) == 0:
+                available_values = df if get_available_values is None else get_available_values()
+                available_values_str = ", ".join(f"'{x}'" for x in available_values[filter_column])
+                raise ValueError(
+                    f"Value {value} not found in column '{filter_column}'. Available values: "
+                    f"{available_values_str}."
+                )
+            info[value] = df.iloc[positions[0]][info_columns].to_dict()
+
+        return info
+
+    def add_table(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        schema: str,
+        if_exists: str = "fail",
+        chunksize: int = None,
+        method: str = None,
+        dtype: dict = None,
+        fast_executemany: bool = None,
+        verbose: bool = False,
+    ) -> int:
         """
-        Creates a new database table and populates it with the user-input data.
+        Creates a new database table (or appends to/replaces an existing one) and populates it
+        with the user-input data.
+
+        All chunks are inserted within a single transaction, such that a failed insert does not
+        leave a partially populated table behind.
 
         Args:
             df: Data used to populate the database table
             table_name: Table name
             schema: Schema
+            if_exists: Behavior if the table already exists. Can take value "fail" (raise an
+                error), "replace" (drop the table before inserting the data) or "append" (insert
+                the data into the existing table).
+            chunksize: Number of rows inserted per batch. If None, all rows are inserted in a
+                single batch.
+            method: Insert method. Can take value None (rows are sent with executemany(), i.e.
+                as parameter arrays when 'fast_executemany' is enabled) or "multi" (rows are
+                sent as multi-row INSERT statements; the number of rows per statement is capped
+                to respect the SQL Server limit of 2100 parameters per statement).
+            dtype: Optional mapping of column names to SQLAlchemy types, used to define the
+                column types when creating the table. E.g. dict(Price=sqlalchemy.Float()).
+            fast_executemany: If true and if the database driver is pyodbc, parameter arrays are
+                sent to the server in bulk instead of one round trip per row. Only used if
+                method=None. If None, the 'fast_executemany' setting of the class instance is
+                used.
+            verbose: If true, logs the insert progress and throughput after each batch
+
+        Returns:
+            Number of inserted rows
+
+        Raises:
+            ValueError: Raises an error in case of invalid 'if_exists' value
+            ValueError: Raises an error in case of invalid 'method' value
         """
-        df.to_sql(name=table_name, schema=schema, con=self.engine, if_exists="fail", index=False)
+        # Input validation
+        valid_if_exists = ["fail", "replace", "append"]
+        if if_exists not in valid_if_exists:
+            raise ValueError(
+                f"Invalid input 'if_exists' value '{if_exists}'. "
+                f"Supported values: {valid_if_exists}."
+            )
+        valid_methods = [None, "multi"]
+        if method not in valid_methods:
+            raise ValueError(
+                f"Invalid input 'method' value '{method}'. Supported values: {valid_methods}."
+            )
+
+        # Set default values
+        if fast_executemany is None:
+            fast_executemany = self.fast_executemany
+        n_rows = len(df)
+        if chunksize is None:
+            chunksize = max(n_rows, 1)
+        if method == "multi":
+            # Limit rows per statement, such that the number of parameters stays below 2100
+            rows_per_statement = max(2099 // max(len(df.columns), 1), 1)
+        else:
+            rows_per_statement = None
+
+        # Note: The mode is also set if disabled, to override the engine-wide setting.
+        def set_fast_executemany(conn, cursor, statement, parameters, context, executemany):
+            if executemany:
+                cursor.fast_executemany = fast_executemany
+
+        n_inserted = 0
+        start = time.perf_counter()
+        with self.acquire_connection() as conn:
+            use_listener = method is None and conn.dialect.driver == "pyodbc"
+            if use_listener:
+                event.listen(conn, "before_cursor_execute", set_fast_executemany)
+            try:
+                with conn.begin():
+                    for i in range(0, max(n_rows, 1), chunksize):
+                        df_chunk = df.iloc[i : i + chunksize]
+                        df_chunk.to_sql(
+                            name=table_name,
+                            schema=schema,
+                            con=conn,
+                            if_exists=if_exists if i == 0 else "append",
+                            index=False,
+                            chunksize=rows_per_statement,
+                            method=method,
+                            dtype=dtype,
+                        )
+                        n_inserted += len(df_chunk)
+                        if verbose:
+                            elapsed = time.perf_counter() - start
+                            rate = n_inserted / elapsed if elapsed > 0 else float("inf")
+                            add_log(
+                                f"Inserted {n_inserted:,}/{n_rows:,} rows into "
+                                f"[{schema}].[{table_name}] ({rate:,.0f} rows/s)."
+                            )
+            finally:
+                if use_listener:
+                    event.remove(conn, "before_cursor_execute", set_fast_executemany)
+
+        return n_inserted
 
     def remove_table(self, table_name: str, schema: str):
         """
@@ -1161,7 +3223,7 @@ class DetDatabase:
             table_name: Table name
             schema: Schema
         """
-        with self.engine.connect() as conn:
+        with self.acquire_connection() as conn:
             conn.execute(text(f"DROP TABLE IF EXISTS [{schema}].[{table_name}]"))
             conn.commit()
 
@@ -1169,45 +3231,181 @@ class DetDatabase:
 class DetDatabaseDefinitions:
     """A class containing some hard-coded definitions related to the DET database."""
 
+    # Maximum number of bound parameters per query (SQL Server limit is 2100)
+    MAX_PARAMETERS = 2000
+
+    # Note: Tables without schema (i.e. the metadata tables) are never downcast. Tables without
+    # default columns are queried with all columns by default.
     DEFINITIONS = dict(
         commodity=dict(
             env_variable="DET_DB_TABLE_COMMODITY",
+            columns_env_variable="DET_DB_COLUMNS_COMMODITY",
             default_table_name="[META].[Commodity]",
         ),
         entsoe_day_ahead_spot_price=dict(
             env_variable="DET_DB_TABLE_ENTSOE_DA",
+            columns_env_variable="DET_DB_COLUMNS_ENTSOE_DA",
             default_table_name="[ENTSOE].[DayAheadSpotPrice]",
+            default_columns=[
+                "DateTime(UTC)",
+                "ResolutionCode",
+                "MapCode",
+                "Price(Currency/MWh)",
+                "Currency",
+            ],
+            schema={
+                "ResolutionCode": "category",
+                "MapCode": "category",
+                "Price(Currency/MWh)": "float32",
+                "Currency": "category",
+            },
         ),
         entsoe_imbalance_price=dict(
             env_variable="DET_DB_TABLE_ENTSOE_IB",
+            columns_env_variable="DET_DB_COLUMNS_ENTSOE_IB",
             default_table_name="[ENTSOE].[ImbalancePrice]",
+            default_columns=[
+                "DateTime(UTC)",
+                "MapCode",
+                "PositiveImbalancePrice",
+                "NegativeImbalancePrice",
+                "Currency",
+            ],
+            schema={
+                "MapCode": "category",
+                "PositiveImbalancePrice": "float32",
+                "NegativeImbalancePrice": "float32",
+                "Currency": "category",
+            },
         ),
         futures_tt=dict(
             env_variable="DET_DB_TABLE_FUTURES_TT",
+            columns_env_variable="DET_DB_COLUMNS_FUTURES_TT",
             default_table_name="[VW].[EODSettlementPrice]",
+            default_columns=[
+                "TradingDate",
+                "DeliveryStart",
+                "DeliveryEnd",
+                "CommodityName",
+                "Tenor",
+                "DeliveryType",
+                "SettlementPrice",
+                "InsertionTimestamp",
+            ],
+            schema={
+                "CommodityName": "category",
+                "Tenor": "category",
+                "DeliveryType": "category",
+                "SettlementPrice": "float32",
+            },
         ),
         futures_eex=dict(
             env_variable="DET_DB_TABLE_FUTURES_EEX",
+            columns_env_variable="DET_DB_COLUMNS_FUTURES_EEX",
             default_table_name="[EEX].[EODPrice]",
+            default_columns=[
+                "TradingDate",
+                "Product",
+                "Delivery Start",
+                "Delivery End",
+                "Settlement Price",
+            ],
+            schema={
+                "Product": "category",
+                "Settlement Price": "float32",
+            },
         ),
         account_position=dict(
             env_variable="DET_DB_TABLE_ACCOUNT_POSITION",
+            columns_env_variable="DET_DB_COLUMNS_ACCOUNT_POSITION",
             default_table_name="[TT].[AccountPosition]",
+            default_columns=["InsertionTimestamp", "InstrumentId", "Position"],
+            schema={
+                "Position": "int32",
+            },
         ),
         instrument=dict(
             env_variable="DET_DB_TABLE_INSTRUMENT",
+            columns_env_variable="DET_DB_COLUMNS_INSTRUMENT",
             default_table_name="[TT].[Instrument]",
+            default_columns=["id", "Name"],
+            schema=dict(),
         ),
         client_volume_forecast=dict(
             env_variable="DET_DB_TABLE_CLIENT_VOLUME_FORECAST",
+            columns_env_variable="DET_DB_COLUMNS_CLIENT_VOLUME_FORECAST",
             default_table_name="[DISP].[ForecastGold]",
+            default_columns=["Profile", "ForecastDate", "Datetime", "kWh", "InsertionTimestamp"],
+            schema={
+                "Profile": "category",
+                "kWh": "float32",
+            },
         ),
         client_day_ahead_auction_bids=dict(
             env_variable="DET_DB_TABLE_CLIENT_DA_AUCTION_BIDS",
+            columns_env_variable="DET_DB_COLUMNS_CLIENT_DA_AUCTION_BIDS",
             default_table_name="[TRADE].[ClientBid]",
+            default_columns=[
+                "ClientId",
+                "InsertionTimestamp",
+                "DeliveryStart",
+                "DeliveryEnd",
+                "Volume(MWh)",
+                "Price(EUR/MWh)",
+            ],
+            schema={
+                "ClientId": "int32",
+                "Volume(MWh)": "float32",
+                "Price(EUR/MWh)": "float32",
+            },
         ),
         client=dict(
             env_variable="DET_DB_TABLE_CLIENT",
+            columns_env_variable="DET_DB_COLUMNS_CLIENT",
             default_table_name="[META].[Client]",
         ),
     )
+
+    # Arrow types associated with the Python types reported in database cursor descriptions
+    ARROW_TYPES = {
+        dt.datetime: pa.timestamp("ns"),
+        dt.date: pa.date32(),
+        dt.time: pa.time64("ns"),
+        float: pa.float64(),
+        int: pa.int64(),
+        bool: pa.bool_(),
+        str: pa.string(),
+        bytes: pa.binary(),
+    }
+
+    # Length of the delivery period associated with each ENTSOE resolution code
+    RESOLUTION_CODES = dict(
+        PT15M=pd.Timedelta(minutes=15),
+        PT30M=pd.Timedelta(minutes=30),
+        PT60M=pd.Timedelta(minutes=60),
+    )
+
+    # SQL Server (Windows) names of the IANA timezones, used to convert dates to local time on
+    # the database server (see 'sql_pushdown' option of the DetDatabase class)
+    WINDOWS_TIMEZONES = {
+        "UTC": "UTC",
+        "Etc/UTC": "UTC",
+        "Europe/Amsterdam": "W. Europe Standard Time",
+        "Europe/Berlin": "W. Europe Standard Time",
+        "Europe/Vienna": "W. Europe Standard Time",
+        "Europe/Zurich": "W. Europe Standard Time",
+        "Europe/Rome": "W. Europe Standard Time",
+        "Europe/Brussels": "Romance Standard Time",
+        "Europe/Paris": "Romance Standard Time",
+        "Europe/Madrid": "Romance Standard Time",
+        "Europe/Copenhagen": "Romance Standard Time",
+        "Europe/Prague": "Central Europe Standard Time",
+        "Europe/Budapest": "Central Europe Standard Time",
+        "Europe/Warsaw": "Central European Standard Time",
+        "Europe/London": "GMT Standard Time",
+        "Europe/Dublin": "GMT Standard Time",
+        "Europe/Lisbon": "GMT Standard Time",
+        "Europe/Helsinki": "FLE Standard Time",
+        "Europe/Athens": "GTB Standard Time",
+        "Europe/Bucharest": "GTB Standard Time",
+    }
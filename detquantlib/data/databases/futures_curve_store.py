@@ -0,0 +1,227 @@
+# Python built-in packages
+from collections.abc import Iterator
+from datetime import datetime
+
+# Third-party packages
+import numpy as np
+import pandas as pd
+
+# Internal modules
+from detquantlib.data.databases.detdatabase import DetDatabase
+
+
+class FuturesCurveStore:
+    """
+    A point-in-time store of futures settlement curves, indexed by trading date.
+
+    The settlement prices are sorted once by trading date and delivery period, such that the
+    curve of each trading date is a contiguous slice of the data. Looking up the curve of a
+    trading date is then a dictionary lookup and a slice, instead of a boolean mask over the
+    full history.
+
+    Usage example:
+        store = FuturesCurveStore.from_database(
+            db=DetDatabase(),
+            commodity_name="DutchPower",
+            start_trading_date=datetime(2020, 1, 1),
+            end_trading_date=datetime(2024, 12, 31),
+            tenors=["Month", "Quarter", "Year"],
+            delivery_type="Base",
+        )
+        for trading_date, df_curve in store:
+            ...
+    """
+
+    # Columns used to sort the curve of each trading date
+    SORT_COLUMNS = ["DeliveryStart", "DeliveryEnd"]
+
+    def __init__(self, df: pd.DataFrame):
+        """
+        Constructor method.
+
+        Args:
+            df: Futures settlement prices, in the format returned by
+                DetDatabase.load_futures_eod_settlement_prices(). Must contain the
+                'TradingDate' column.
+
+        Raises:
+            ValueError: Raises an error if the input dataframe has no 'TradingDate' column
+        """
+        if "TradingDate" not in df.columns:
+            raise ValueError("Input dataframe should contain the 'TradingDate' column.")
+
+        # Sort data by trading date and delivery period
+        sort_columns = ["TradingDate"] + [c for c in self.SORT_COLUMNS if c in df.columns]
+        df = df.sort_values(by=sort_columns, kind="stable", ignore_index=True)
+        self.data = df
+
+        # Find the (contiguous) rows of each trading date
+        trading_dates = pd.DatetimeIndex(df["TradingDate"])
+        idx_starts = np.flatnonzero(
+            np.concatenate([[True], trading_dates[1:] != trading_dates[:-1]])
+        )
+        idx_ends = np.append(idx_starts[1:], df.shape[0])
+        self.trading_dates = trading_dates[idx_starts]
+        self._slices = {
+            d: slice(start, end) for d, start, end in zip(self.trading_dates, idx_starts, idx_ends)
+        }
+
+        # Keep the columns as arrays, such that curves can be sliced without copies
+        self._arrays = {c: df[c].to_numpy() for c in df.columns}
+
+    @classmethod
+    def from_database(
+        cls,
+        db: DetDatabase,
+        commodity_name: str,
+        start_trading_date: datetime,
+        end_trading_date: datetime,
+        tenors: list,
+        delivery_type: str,
+        **kwargs,
+    ) -> "FuturesCurveStore":
+        """
+        Creates a curve store from futures settlement prices loaded from the database, with a
+        single call to DetDatabase.load_futures_eod_settlement_prices().
+
+        Args:
+            db: Instance of the DetDatabase class
+            commodity_name: Commodity name (as defined in the [META].[Commodity] database table)
+            start_trading_date: Start trading date
+            end_trading_date: End trading date
+            tenors: Product tenors (e.g. "Month", "Quarter", "Year")
+            delivery_type: Delivery type ("Base", "Peak", "Offpeak")
+            **kwargs: Other keyword arguments of DetDatabase.load_futures_eod_settlement_prices()
+                (e.g. 'columns', 'timezone_aware_dates')
+
+        Returns:
+            Curve store containing the loaded settlement prices
+        """
+        df = db.load_futures_eod_settlement_prices(
+            commodity_name=commodity_name,
+            start_trading_date=start_trading_date,
+            end_trading_date=end_trading_date,
+            tenors=tenors,
+            delivery_type=delivery_type,
+            **kwargs,
+        )
+        return cls(df)
+
+    def __len__(self) -> int:
+        return len(self.trading_dates)
+
+    def __contains__(self, trading_date: datetime) -> bool:
+        return self.normalize_trading_date(trading_date) in self._slices
+
+    def __iter__(self) -> Iterator[tuple[pd.Timestamp, pd.DataFrame]]:
+        for trading_date in self.trading_dates:
+            yield trading_date, self.data.iloc[self._slices[trading_date]]
+
+    def normalize_trading_date(self, trading_date: datetime) -> pd.Timestamp:
+        """
+        Converts a requested trading date to the timezone of the trading dates of the store.
+
+        Args:
+            trading_date: Requested trading date. If the trading dates of the store are
+                timezone-aware, timezone-naive dates are interpreted as local dates in the
+                timezone of the store.
+
+        Returns:
+            Requested trading date, in the timezone of the store
+
+        Raises:
+            ValueError: Raises an error if a timezone-aware date is requested from a store with
+                timezone-naive trading dates
+        """
+        trading_date = pd.Timestamp(trading_date)
+        timezone = self.trading_dates.tz
+        if timezone is None:
+            if trading_date.tz is not None:
+                raise ValueError(
+                    f"Trading date {trading_date} should be timezone-naive, like the trading "
+                    f"dates of the store."
+                )
+        elif trading_date.tz is None:
+            trading_date = trading_date.tz_localize(
+                timezone, ambiguous=True, nonexistent="shift_forward"
+            )
+        else:
+            trading_date = trading_date.tz_convert(timezone)
+        return trading_date
+
+    def get_trading_date(self, trading_date: datetime, as_of: bool = False) -> pd.Timestamp:
+        """
+        Gets the trading date of the store matching a requested date.
+
+        Args:
+            trading_date: Requested trading date
+            as_of: If true, returns the last trading date on or before the requested date (e.g.
+                to get the latest curve on weekends and holidays). Otherwise, the requested
+                date must be a trading date of the store.
+
+        Returns:
+            Trading date of the store
+
+        Raises:
+            KeyError: Raises an error if no matching trading date is found
+        """
+        trading_date = self.normalize_trading_date(trading_date)
+        if trading_date in self._slices:
+            return trading_date
+
+        if as_of:
+            idx = self.trading_dates.searchsorted(trading_date, side="right") - 1
+            if idx >= 0:
+                return self.trading_dates[idx]
+
+        raise KeyError(f"No settlement prices found for trading date {trading_date}.")
+
+    def get_curve(self, trading_date: datetime, as_of: bool = False) -> pd.DataFrame:
+        """
+        Gets the settlement curve of a trading date, sorted by delivery period.
+
+        Args:
+            trading_date: Trading date
+            as_of: If true and the requested date is not a trading date, returns the curve of
+                the last trading date before the requested date
+
+        Returns:
+            Dataframe containing the settlement prices of the trading date (slice of the stored
+            data, which should not be modified in place)
+        """
+        trading_date = self.get_trading_date(trading_date, as_of)
+        return self.data.iloc[self._slices[trading_date]]
+
+    def get_arrays(self, trading_date: datetime, as_of: bool = False) -> dict[str, np.ndarray]:
+        """
+        Gets the settlement curve of a trading date as arrays, sorted by delivery period. The
+        arrays are slices (views) of column arrays built once by the constructor.
+
+        Note: For numeric and timezone-naive date columns, the arrays are also views of the
+        stored dataframe. Categorical and timezone-aware date columns are converted to object
+        arrays (e.g. of pd.Timestamp) by the constructor, such that their arrays are copies of
+        the stored dataframe columns.
+
+        Args:
+            trading_date: Trading date
+            as_of: If true and the requested date is not a trading date, returns the curve of
+                the last trading date before the requested date
+
+        Returns:
+            Dictionary with column names as keys and arrays as values
+        """
+        trading_date = self.get_trading_date(trading_date, as_of)
+        idx = self._slices[trading_date]
+        return {c: values[idx] for c, values in self._arrays.items()}
+
+    def iterate_arrays(self) -> Iterator[tuple[pd.Timestamp, dict[str, np.ndarray]]]:
+        """
+        Iterates over the settlement curves of all trading dates, in chronological order.
+
+        Yields:
+            Trading date, and dictionary with column names as keys and arrays as values (see
+            get_arrays())
+        """
+        for trading_date in self.trading_dates:
+            idx = self._slices[trading_date]
+            yield trading_date, {c: values[idx] for c, values in self._arrays.items()}
@@ -0,0 +1,274 @@
+# Python built-in packages
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import datetime
+
+# Third-party packages
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+
+class QueryRecorder:
+    """
+    A class that records timing statistics of DetDatabase calls (e.g. load_*() methods), to
+    identify slow calls and where their time is spent.
+
+    Each top-level call produces one record, containing:
+        - name: Name of the called method
+        - tables: Queried database tables
+        - queries: Executed SQL queries
+        - execute: Time (in seconds) spent executing queries on the database server, until the
+            first results are available
+        - fetch: Time (in seconds) spent transferring the query results to dataframes
+        - processing: Time (in seconds) spent post-processing the data (e.g. sorting, timezone
+            conversions)
+        - total: Total duration (in seconds) of the call
+        - rows: Number of rows fetched from the database
+        - bytes: In-memory size (in bytes) of the data fetched from the database
+        - error: Representation of the raised error, if the call failed
+
+    Calls made within another recorded call (e.g. get_commodity_info() called by a loader) are
+    included in the record of the outer call.
+
+    Note: Streamed loads (see 'chunksize' argument of the loaders) return an iterator, and only
+    the time needed to create the iterator is recorded.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[dict], None] = None,
+        slow_call_threshold: float = None,
+        max_records: int = 10_000,
+    ):
+        """
+        Constructor method.
+
+        Args:
+            callback: Optional function called with each completed record (e.g. to forward
+                records to a monitoring system)
+            slow_call_threshold: If provided, calls lasting longer than this threshold (in
+                seconds) are logged as warnings with the 'logging' module
+            max_records: Maximum number of records kept in memory (oldest records are dropped
+                first)
+        """
+        self.callback = callback
+        self.slow_call_threshold = slow_call_threshold
+        self._records = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def track(self, name: str) -> Iterator[dict]:
+        """
+        Context manager recording a call. Nested calls are added to the record of the outer
+        call.
+
+        Args:
+            name: Name of the called method
+
+        Yields:
+            Record of the (outer) call
+
+        Raises:
+            Exception: Re-raises errors raised by the recorded call, after recording them
+        """
+        if self.get_active_record() is not None:
+            yield self.get_active_record()
+            return
+
+        record = dict(
+            name=name,
+            timestamp=datetime.now(),
+            tables=list(),
+            queries=list(),
+            execute=0.0,
+            fetch=0.0,
+            processing=0.0,
+            total=0.0,
+            rows=0,
+            bytes=0,
+            error=None,
+        )
+        self._local.record = record
+        start = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record["error"] = repr(e)
+            raise
+        finally:
+            self._local.record = None
+            with self._lock:
+                record["total"] = time.perf_counter() - start
+                record["processing"] = max(
+                    record["total"] - record["execute"] - record["fetch"], 0
+                )
+            self._add_record(record)
+
+    @contextmanager
+    def attach(self, record: dict) -> Iterator[None]:
+        """
+        Context manager making a record the active record of the current thread, such that
+        queries executed by worker threads (e.g. partitioned queries) are added to the record
+        of the call that started them.
+
+        Args:
+            record: Record of the calling method
+
+        Yields:
+            None
+        """
+        previous_record = self.get_active_record()
+        self._local.record = record
+        try:
+            yield
+        finally:
+            self._local.record = previous_record
+
+    def get_active_record(self) -> dict | None:
+        """
+        Gets the record of the call currently running in this thread.
+
+        Returns:
+            Active record, or None if no call is being recorded
+        """
+        return getattr(self._local, "record", None)
+
+    def get_thread_execute_time(self) -> float:
+        """
+        Gets the total query execution time measured in the current thread (see
+        add_execute_time()). Unlike the execution time of the active record, which is shared
+        with worker threads (see attach()), it only increases with the queries of this thread.
+
+        Returns:
+            Total execution time, in seconds
+        """
+        return getattr(self._local, "execute_time", 0.0)
+
+    def add_execute_time(self, seconds: float):
+        """
+        Adds query execution time to the active record.
+
+        Args:
+            seconds: Execution time, in seconds
+        """
+        record = self.get_active_record()
+        if record is not None:
+            self._local.execute_time = self.get_thread_execute_time() + seconds
+            with self._lock:
+                record["execute"] += seconds
+
+    def add_query(self, query: str, table: str, fetch_time: float, rows: int, size: int):
+        """
+        Adds a completed query to the active record.
+
+        Args:
+            query: SQL query
+            table: Name of the queried database table
+            fetch_time: Time spent fetching the query results (excluding query execution), in
+                seconds
+            rows: Number of fetched rows
+            size: In-memory size of the fetched data, in bytes
+        """
+        record = self.get_active_record()
+        if record is None:
+            return
+        with self._lock:
+            record["queries"].append(query)
+            if table is not None and table not in record["tables"]:
+                record["tables"].append(table)
+            record["rows"] += rows
+            record["bytes"] += size
+            record["fetch"] += max(fetch_time, 0)
+
+    def get_records(self) -> list[dict]:
+        """
+        Gets the completed records.
+
+        Returns:
+            List of records, from oldest to newest
+        """
+        with self._lock:
+            records = list(self._records)
+        return records
+
+    def get_summary(self) -> pd.DataFrame:
+        """
+        Summarizes the completed records per called method.
+
+        Returns:
+            Dataframe with one row per called method, containing the number of calls and
+            errors, the mean duration of each phase, the maximum total duration (all in
+            seconds), and the total number of fetched rows and bytes
+        """
+        columns = ["execute", "fetch", "processing", "total"]
+        df = pd.DataFrame(self.get_records())
+        if df.empty:
+            return pd.DataFrame(
+                columns=["calls", "errors"] + columns + ["max_total", "rows", "bytes"]
+            )
+
+        df_grouped = df.groupby("name")
+        df_summary = df_grouped[columns].mean()
+        df_summary.insert(0, "calls", df_grouped.size())
+        df_summary.insert(1, "errors", df_grouped["error"].count())
+        df_summary["max_total"] = df_grouped["total"].max()
+        df_summary["rows"] = df_grouped["rows"].sum()
+        df_summary["bytes"] = df_grouped["bytes"].sum()
+        df_summary = df_summary.sort_values("total", ascending=False)
+
+        return df_summary
+
+    def clear(self):
+        """Removes all completed records."""
+        with self._lock:
+            self._records.clear()
+
+    def _add_record(self, record: dict):
+        with self._lock:
+            self._records.append(record)
+
+        if self.slow_call_threshold is not None and record["total"] > self.slow_call_threshold:
+            logger.warning(
+                "Slow call %s (%.3fs: execute %.3fs, fetch %.3fs, processing %.3fs, %d rows) "
+                "on tables %s: %s",
+                record["name"],
+                record["total"],
+                record["execute"],
+                record["fetch"],
+                record["processing"],
+                record["rows"],
+                record["tables"],
+                " | ".join(record["queries"]),
+            )
+
+        if self.callback is not None:
+            self.callback(record)
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Decorator recording the calls of a DetDatabase method, if the instance has a query
+    recorder.
+
+    Args:
+        method: DetDatabase method
+
+    Returns:
+        Decorated method
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.recorder is None:
+            return method(self, *args, **kwargs)
+        with self.recorder.track(method.__name__):
+            return method(self, *args, **kwargs)
+
+    return wrapper
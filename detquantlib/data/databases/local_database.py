@@ -0,0 +1,428 @@
+# Python built-in packages
+import re
+import sqlite3
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+# Third-party packages
+import numpy as np
+import pandas as pd
+from sqlalchemy import Engine, create_engine, event
+
+# Internal modules
+from detquantlib.data.databases.detdatabase import DetDatabase, DetDatabaseDefinitions
+
+
+class LocalDatabase:
+    """
+    A local SQLite stand-in for the DET database, seeded with synthetic tables matching the
+    definitions of the DetDatabaseDefinitions class.
+
+    It allows running the DetDatabase class (e.g. in tests and benchmarks) without access to the
+    production SQL Server and without the DET_DB_* environment variables. Each database schema
+    (e.g. [ENTSOE]) is stored as a separate SQLite file attached to every connection, such that
+    the default table names (e.g. [ENTSOE].[DayAheadSpotPrice]) are used unchanged.
+
+    Usage example:
+        local_db = LocalDatabase("Cache/LocalDatabase/det.db")
+        local_db.seed(nr_rows=100_000)
+        db = local_db.create_det_database()
+        df = db.load_entsoe_day_ahead_spot_prices(commodity_name="DutchPower", ...)
+    """
+
+    # Date columns of the synthetic tables, returned as datetime objects (see create_engine())
+    DATE_COLUMNS = {
+        "DateTime(UTC)",
+        "TradingDate",
+        "DeliveryStart",
+        "DeliveryEnd",
+        "Delivery Start",
+        "Delivery End",
+        "InsertionTimestamp",
+        "ForecastDate",
+        "Datetime",
+    }
+
+    # Synthetic commodities: name, timezone, ENTSOE map code, EEX product code
+    COMMODITIES = [
+        ("DutchPower", "Europe/Amsterdam", "NL", "Q0B"),
+        ("GermanPower", "Europe/Berlin", "DE_LU", "DEB"),
+        ("GreatBritainPower", "Europe/London", "GB", "UKB"),
+    ]
+
+    def __init__(self, db_dir: str | Path, start_date: datetime = datetime(2000, 1, 1)):
+        """
+        Constructor method.
+
+        Args:
+            db_dir: Directory of the main SQLite database file. The files of the attached
+                schemas are stored in the same folder.
+            start_date: First date of the synthetic time series
+        """
+        # Note: The synthetic data is designed such that time series of 10 million rows end
+        # before the maximum pandas timestamp (year 2262) when starting in 2000.
+        self.db_dir = Path(db_dir)
+        self.start_date = pd.Timestamp(start_date)
+        self.db_dir.parent.mkdir(parents=True, exist_ok=True)
+        self.engine = self.create_engine()
+
+    def get_schemas(self) -> list[str]:
+        """
+        Gets the schemas of the default DET database table names.
+
+        Returns:
+            List of schema names
+        """
+        schemas = list()
+        for definition in DetDatabaseDefinitions.DEFINITIONS.values():
+            match = re.match(r"\[(\w+)\]\.", definition["default_table_name"])
+            if match is not None and match.group(1) not in schemas:
+                schemas.append(match.group(1))
+        return schemas
+
+    def create_engine(self) -> Engine:
+        """
+        Creates an SQLAlchemy engine connected to the local database, with all schemas attached.
+
+        Note: Date columns are returned as datetime objects, like with the SQL Server ODBC driver.
+        They are parsed by a row factory of the engine's own connections, rather than by a
+        global SQLite converter, such that other SQLite connections of the process are not
+        affected.
+
+        Returns:
+            Instance of SQLAlchemy engine
+        """
+        engine = create_engine(
+            f"sqlite:///{self.db_dir}", connect_args=dict(check_same_thread=False)
+        )
+        schemas = self.get_schemas()
+
+        @event.listens_for(engine, "connect")
+        def attach_schemas(dbapi_connection, connection_record):
+            for schema in schemas:
+                schema_dir = self.db_dir.with_name(f"{self.db_dir.stem}_{schema}.db")
+                dbapi_connection.execute(f"ATTACH DATABASE '{schema_dir}' AS [{schema}]")
+            dbapi_connection.row_factory = LocalDatabase.make_row_factory()
+
+        return engine
+
+    @staticmethod
+    def make_row_factory() -> Callable[[sqlite3.Cursor, tuple], tuple]:
+        """
+        Creates an SQLite row factory parsing the values of the date columns (see DATE_COLUMNS)
+        from ISO format strings into datetime objects.
+
+        Returns:
+            Row factory
+        """
+        # Positions of the date columns, per cursor description
+        positions_cache = dict()
+
+        def row_factory(cursor: sqlite3.Cursor, row: tuple) -> tuple:
+            description = cursor.description
+            positions = positions_cache.get(description)
+            if positions is None:
+                positions = [
+                    i for i, d in enumerate(description) if d[0] in LocalDatabase.DATE_COLUMNS
+                ]
+                positions_cache[description] = positions
+            if len(positions) == 0:
+                return row
+
+            row = list(row)
+            for i in positions:
+                if isinstance(row[i], str):
+                    row[i] = datetime.fromisoformat(row[i])
+            return tuple(row)
+
+        return row_factory
+
+    def create_det_database(self, **kwargs) -> DetDatabase:
+        """
+        Creates an instance of the DetDatabase class connected to the local database.
+
+        Args:
+            **kwargs: Keyword arguments passed to the DetDatabase constructor
+
+        Returns:
+            Instance of the DetDatabase class
+        """
+        return DetDatabase(engine=self.engine, **kwargs)
+
+    def seed(self, nr_rows: int = 10_000, seed: int = 0):
+        """
+        Populates the local database with synthetic data. Existing tables are replaced.
+
+        Args:
+            nr_rows: Approximate number of rows of each time series table
+            seed: Seed of the random number generator
+        """
+        rng = np.random.default_rng(seed)
+        tables = dict(
+            commodity=self.make_commodities(),
+            client=self.make_clients(),
+            entsoe_day_ahead_spot_price=self.make_entsoe_day_ahead_spot_prices(nr_rows, rng),
+            entsoe_imbalance_price=self.make_entsoe_imbalance_prices(nr_rows, rng),
+            futures_tt=self.make_futures_eod_settlement_prices(nr_rows, rng),
+            futures_eex=self.make_eex_eod_prices(nr_rows, rng),
+            account_position=self.make_account_positions(nr_rows, rng),
+            instrument=self.make_instruments(nr_rows),
+            client_volume_forecast=self.make_forecast_customer_volume(nr_rows, rng),
+            client_day_ahead_auction_bids=self.make_customer_day_ahead_auction_bids(nr_rows, rng),
+        )
+
+        with self.engine.begin() as conn:
+            for def_key, df in tables.items():
+                table = DetDatabaseDefinitions.DEFINITIONS[def_key]["default_table_name"]
+                schema, name = re.match(r"\[(\w+)\]\.\[(\w+)\]", table).groups()
+                df.to_sql(name, conn, schema=schema, if_exists="replace", index=False)
+
+    def make_commodities(self) -> pd.DataFrame:
+        """
+        Creates the synthetic commodity table.
+
+        Returns:
+            Commodity table
+        """
+        df = pd.DataFrame(
+            LocalDatabase.COMMODITIES, columns=["Name", "Timezone", "EntsoeMapCode", "EexCode"]
+        )
+        df.insert(0, "Id", range(1, df.shape[0] + 1))
+        return df
+
+    def make_clients(self) -> pd.DataFrame:
+        """
+        Creates the synthetic client table.
+
+        Returns:
+            Client table
+        """
+        df = pd.DataFrame({"ClientId": [1, 2], "Name": ["ClientA", "ClientB"], "Type": "Supplier"})
+        return df
+
+    def make_entsoe_day_ahead_spot_prices(
+        self, nr_rows: int, rng: np.random.Generator
+    ) -> pd.DataFrame:
+        """
+        Creates the synthetic (quarter-hourly) ENTSOE day-ahead spot price table.
+
+        Args:
+            nr_rows: Approximate number of rows
+            rng: Random number generator
+
+        Returns:
+            ENTSOE day-ahead spot price table
+        """
+        map_codes = [c[2] for c in LocalDatabase.COMMODITIES]
+        dates = pd.date_range(
+            self.start_date, periods=max(nr_rows // len(map_codes), 1), freq="15min"
+        )
+        df = pd.DataFrame(
+            {
+                "DateTime(UTC)": np.tile(dates, len(map_codes)),
+                "ResolutionCode": "PT15M",
+                "MapCode": np.repeat(map_codes, len(dates)),
+                "Price(Currency/MWh)": rng.normal(80, 20, len(dates) * len(map_codes)).round(2),
+                "Currency": "EUR",
+            }
+        )
+        return df
+
+    def make_entsoe_imbalance_prices(self, nr_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+        """
+        Creates the synthetic (quarter-hourly) ENTSOE imbalance price table.
+
+        Args:
+            nr_rows: Approximate number of rows
+            rng: Random number generator
+
+        Returns:
+            ENTSOE imbalance price table
+        """
+        map_codes = [c[2] for c in LocalDatabase.COMMODITIES]
+        dates = pd.date_range(
+            self.start_date, periods=max(nr_rows // len(map_codes), 1), freq="15min"
+        )
+        nr_rows = len(dates) * len(map_codes)
+        df = pd.DataFrame(
+            {
+                "DateTime(UTC)": np.tile(dates, len(map_codes)),
+                "MapCode": np.repeat(map_codes, len(dates)),
+                "PositiveImbalancePrice": rng.normal(80, 50, nr_rows).round(2),
+                "NegativeImbalancePrice": rng.normal(70, 50, nr_rows).round(2),
+                "Currency": "EUR",
+            }
+        )
+        return df
+
+    def make_futures_eod_settlement_prices(
+        self, nr_rows: int, rng: np.random.Generator
+    ) -> pd.DataFrame:
+        """
+        Creates the synthetic futures end-of-day settlement price table. Each trading date
+        contains the 12 front months, 4 front quarters and 2 front years of each commodity, for
+        both base and peak delivery.
+
+        Args:
+            nr_rows: Approximate number of rows
+            rng: Random number generator
+
+        Returns:
+            Futures end-of-day settlement price table
+        """
+        products = [("Month", 1, m) for m in range(1, 13)]
+        products += [("Quarter", 3, q) for q in range(1, 5)]
+        products += [("Year", 12, y) for y in range(1, 3)]
+        names = [c[0] for c in LocalDatabase.COMMODITIES]
+        delivery_types = ["Base", "Peak"]
+        nr_days = max(nr_rows // (len(products) * len(names) * len(delivery_types)), 1)
+        trading_dates = pd.date_range(self.start_date, periods=nr_days, freq="D")
+
+        dfs = list()
+        for tenor, months, offset in products:
+            delivery_start = (trading_dates + pd.offsets.MonthBegin(1)).to_period("M")
+            delivery_start = (delivery_start + (offset - 1) * months).to_timestamp()
+            delivery_end = (delivery_start.to_period("M") + months).to_timestamp()
+            dfs.append(
+                pd.DataFrame(
+                    {
+                        "TradingDate": trading_dates.date,
+                        "Tenor": tenor,
+                        "DeliveryStart": delivery_start.date,
+                        "DeliveryEnd": delivery_end.date,
+                    }
+                )
+            )
+        df = pd.concat(dfs, ignore_index=True)
+        df = pd.concat([df.assign(CommodityName=n) for n in names], ignore_index=True)
+        df = pd.concat([df.assign(DeliveryType=t) for t in delivery_types], ignore_index=True)
+        df["SettlementPrice"] = rng.normal(80, 20, df.shape[0]).round(2)
+        df["InsertionTimestamp"] = pd.DatetimeIndex(df["TradingDate"]) + pd.Timedelta(hours=18)
+        return df
+
+    def make_eex_eod_prices(self, nr_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+        """
+        Creates the synthetic EEX futures end-of-day price table.
+
+        Args:
+            nr_rows: Approximate number of rows
+            rng: Random number generator
+
+        Returns:
+            EEX futures end-of-day price table
+        """
+        df = self.make_futures_eod_settlement_prices(nr_rows, rng)
+        eex_codes = {c[0]: c[3] for c in LocalDatabase.COMMODITIES}
+        tenor_codes = dict(Month="M", Quarter="Q", Year="Y")
+        product_codes = df["CommodityName"].map(eex_codes)
+        product_codes = product_codes.where(
+            df["DeliveryType"] == "Base", product_codes.str.replace("B", "P")
+        )
+        df = pd.DataFrame(
+            {
+                "TradingDate": df["TradingDate"],
+                "Product": product_codes + df["Tenor"].map(tenor_codes),
+                "Delivery Start": df["DeliveryStart"],
+                "Delivery End": df["DeliveryEnd"],
+                "Settlement Price": df["SettlementPrice"],
+            }
+        )
+        return df
+
+    def make_account_positions(self, nr_rows: int, rng: np.random.Generator) -> pd.DataFrame:
+        """
+        Creates the synthetic account position table.
+
+        Args:
+            nr_rows: Approximate number of rows
+            rng: Random number generator
+
+        Returns:
+            Account position table
+        """
+        nr_instruments = 1000
+        nr_days = max(nr_rows // nr_instruments, 1)
+        dates = pd.date_range(self.start_date + pd.Timedelta(hours=18), periods=nr_days, freq="D")
+        df = pd.DataFrame(
+            {
+                "InsertionTimestamp": np.repeat(dates, nr_instruments),
+                "InstrumentId": np.tile(np.arange(nr_instruments).astype(str), nr_days),
+                "Position": rng.integers(-50, 50, nr_days * nr_instruments),
+            }
+        )
+        return df
+
+    def make_instruments(self, nr_rows: int) -> pd.DataFrame:
+        """
+        Creates the synthetic instrument table.
+
+        Args:
+            nr_rows: Number of rows
+
+        Returns:
+            Instrument table
+        """
+        df = pd.DataFrame({"id": np.arange(nr_rows).astype(str)})
+        df["Name"] = "Instrument " + df["id"]
+        return df
+
+    def make_forecast_customer_volume(
+        self, nr_rows: int, rng: np.random.Generator
+    ) -> pd.DataFrame:
+        """
+        Creates the synthetic customer volume forecast table. Each forecast date contains a
+        (quarter-hourly) forecast of the next two days.
+
+        Args:
+            nr_rows: Approximate number of rows
+            rng: Random number generator
+
+        Returns:
+            Customer volume forecast table
+        """
+        periods = 2 * 96
+        nr_days = max(nr_rows // periods, 1)
+        forecast_dates = pd.date_range(self.start_date, periods=nr_days, freq="D")
+        offsets = pd.timedelta_range(pd.Timedelta(days=1), periods=periods, freq="15min")
+        df = pd.DataFrame(
+            {
+                "Profile": "Portfolio",
+                "ForecastDate": np.repeat(forecast_dates.date, periods),
+                "Datetime": np.repeat(forecast_dates, periods) + np.tile(offsets, nr_days),
+                "kWh": rng.uniform(0, 5000, nr_days * periods).round(1),
+                "InsertionTimestamp": np.repeat(forecast_dates + pd.Timedelta(hours=9), periods),
+            }
+        )
+        return df
+
+    def make_customer_day_ahead_auction_bids(
+        self, nr_rows: int, rng: np.random.Generator
+    ) -> pd.DataFrame:
+        """
+        Creates the synthetic customer day-ahead auction bid table, containing quarter-hourly
+        bids of 10 clients.
+
+        Args:
+            nr_rows: Approximate number of rows
+            rng: Random number generator
+
+        Returns:
+            Customer day-ahead auction bid table
+        """
+        nr_clients = 10
+        dates = pd.date_range(self.start_date, periods=max(nr_rows // nr_clients, 1), freq="15min")
+        nr_rows = len(dates) * nr_clients
+        df = pd.DataFrame(
+            {
+                "ClientId": np.repeat(np.arange(1, nr_clients + 1), len(dates)),
+                "InsertionTimestamp": np.tile(
+                    dates.floor("D") - pd.Timedelta(hours=12), nr_clients
+                ),
+                "DeliveryStart": np.tile(dates, nr_clients),
+                "DeliveryEnd": np.tile(dates + pd.Timedelta(minutes=15), nr_clients),
+                "Volume(MWh)": rng.uniform(0, 10, nr_rows).round(3),
+                "Price(EUR/MWh)": rng.normal(80, 20, nr_rows).round(2),
+            }
+        )
+        return df
@@ -0,0 +1,255 @@
+# Python built-in packages
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+
+# Third-party packages
+import pandas as pd
+import pyarrow as pa
+
+
+class QueryCache:
+    """
+    A class that stores the results of database queries as local Parquet files, such that
+    repeated queries of (immutable) historical data do not need to round-trip to the database
+    server.
+
+    Cache entries are keyed on the normalized SQL query text, the values of its bound parameters
+    and the queried table name. Entries
+    can expire after a time-to-live (TTL), and the least recently used entries are evicted when
+    the total cache size exceeds a user-defined maximum.
+    """
+
+    def __init__(self, cache_dir: str | Path = None, ttl: float = None, max_size: int = None):
+        """
+        Constructor method.
+
+        Args:
+            cache_dir: Directory of the folder containing the cache files. If None, the
+                directory is read from the environment variable 'DET_DB_CACHE_DIR', or defaults
+                to the folder 'Cache/DetDatabase' in the current working directory.
+            ttl: Time-to-live of cache entries, in seconds. If None, entries never expire.
+            max_size: Maximum total size of the cache files, in bytes. If None, the cache size
+                is unlimited.
+        """
+        if cache_dir is None:
+            cache_dir = os.getenv("DET_DB_CACHE_DIR")
+        if cache_dir is None:
+            cache_dir = Path.cwd().joinpath("Cache", "DetDatabase")
+
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.RLock()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index = self._read_index()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """
+        Normalizes an SQL query, such that queries that only differ by whitespace share the same
+        cache entry.
+
+        Args:
+            query: SQL query
+
+        Returns:
+            Normalized SQL query
+        """
+        return re.sub(r"\s+", " ", query).strip()
+
+    @staticmethod
+    def make_key(query: str, table: str = None, params: dict = None) -> str:
+        """
+        Computes the cache key of a query.
+
+        Args:
+            query: SQL query
+            table: Name of the queried database table
+            params: Values of the bound parameters of the query
+
+        Returns:
+            Cache key
+        """
+        params_str = json.dumps(params, sort_keys=True, default=str) if params else ""
+        key_str = f"{table}\n{QueryCache.normalize_query(query)}\n{params_str}"
+        return hashlib.sha256(key_str.encode("utf-8")).hexdigest()
+
+    def get(self, query: str, table: str = None, params: dict = None) -> pd.DataFrame | None:
+        """
+        Gets the cached result of a query.
+
+        Args:
+            query: SQL query
+            table: Name of the queried database table
+            params: Values of the bound parameters of the query
+
+        Returns:
+            Dataframe containing the cached query result, or None if the query is not cached (or
+            if the cache entry expired)
+        """
+        key = QueryCache.make_key(query, table, params)
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is not None and self._is_expired(entry):
+                self._remove_entry(key)
+                entry = None
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+        # Read the cache file outside the lock, such that concurrent hits are not serialized
+        try:
+            df = pd.read_parquet(self._get_file_dir(key))
+        except (OSError, pa.ArrowException):
+            # Cache file is missing or corrupted: drop the entry and treat it as a miss
+            with self._lock:
+                if self._index.get(key) is entry:
+                    self._remove_entry(key)
+                self.misses += 1
+            return None
+
+        # Note: Access times are only updated in memory, and persisted with the next change of
+        # the index (see put() and invalidate()), to keep disk writes off the cache hit path.
+        with self._lock:
+            entry["last_access"] = time.time()
+            self.hits += 1
+
+        return df
+
+    def put(self, query: str, df: pd.DataFrame, table: str = None, params: dict = None):
+        """
+        Stores the result of a query in the cache.
+
+        Note: Dataframes that cannot be converted to Parquet (e.g. columns with mixed object
+        types) are not cached.
+
+        Args:
+            query: SQL query
+            df: Dataframe containing the query result
+            table: Name of the queried database table
+            params: Values of the bound parameters of the query
+        """
+        key = QueryCache.make_key(query, table, params)
+        file_dir = self._get_file_dir(key)
+        with self._lock:
+            # Write to a temporary file first, such that concurrent reads (see get()) never see
+            # a partially written file
+            tmp_dir = file_dir.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                df.to_parquet(tmp_dir, index=False)
+                os.replace(tmp_dir, file_dir)
+            except (ValueError, TypeError, pa.ArrowException):
+                tmp_dir.unlink(missing_ok=True)
+                return
+
+            now = time.time()
+            self._index[key] = dict(
+                table=table,
+                query=QueryCache.normalize_query(query),
+                created=now,
+                last_access=now,
+                size=file_dir.stat().st_size,
+            )
+            self._evict()
+            self._write_index()
+
+    def invalidate(self, query: str = None, table: str = None, params: dict = None):
+        """
+        Removes entries from the cache.
+
+        Args:
+            query: SQL query. If provided, only the entry of this query is removed (the 'table'
+                argument should then be the same as the one used to store the entry).
+            table: Name of a database table. If provided without a query, all entries of this
+                table are removed. If both 'query' and 'table' are None, the whole cache is
+                cleared.
+            params: Values of the bound parameters of the query. Only used if a query is
+                provided.
+        """
+        with self._lock:
+            if query is not None:
+                keys = [QueryCache.make_key(query, table, params)]
+            elif table is not None:
+                keys = [k for k, v in self._index.items() if v["table"] == table]
+            else:
+                keys = list(self._index.keys())
+
+            for key in keys:
+                self._remove_entry(key)
+            self._write_index()
+
+    def clear(self):
+        """Removes all entries from the cache."""
+        self.invalidate()
+
+    def get_stats(self) -> dict:
+        """
+        Gets the cache usage statistics.
+
+        Returns:
+            A dictionary containing the number of hits and misses, the number of entries, and
+            the total size of the cache files (in bytes)
+        """
+        with self._lock:
+            stats = dict(
+                hits=self.hits,
+                misses=self.misses,
+                entries=len(self._index),
+                size=sum(v["size"] for v in self._index.values()),
+            )
+        return stats
+
+    def _get_file_dir(self, key: str) -> Path:
+        return self.cache_dir.joinpath(f"{key}.parquet")
+
+    def _get_index_dir(self) -> Path:
+        return self.cache_dir.joinpath("index.json")
+
+    def _read_index(self) -> dict:
+        index_dir = self._get_index_dir()
+        if not index_dir.is_file():
+            return dict()
+        try:
+            with open(index_dir, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return dict()
+
+    def _write_index(self):
+        # Write to a temporary file first, to never leave a partially written index behind
+        index_dir = self._get_index_dir()
+        tmp_dir = index_dir.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_dir, "w") as f:
+            json.dump(self._index, f)
+        os.replace(tmp_dir, index_dir)
+
+    def _is_expired(self, entry: dict) -> bool:
+        return self.ttl is not None and time.time() - entry["created"] > self.ttl
+
+    def _remove_entry(self, key: str):
+        self._index.pop(key, None)
+        self._get_file_dir(key).unlink(missing_ok=True)
+
+    def _evict(self):
+        # Remove expired entries
+        for key in [k for k, v in self._index.items() if self._is_expired(v)]:
+            self._remove_entry(key)
+
+        # Remove least recently used entries until the cache size is below the maximum
+        if self.max_size is None:
+            return
+        total_size = sum(v["size"] for v in self._index.values())
+        for key in sorted(self._index, key=lambda k: self._index[k]["last_access"]):
+            if total_size <= self.max_size:
+                break
+            total_size -= self._index[key]["size"]
+            self._remove_entry(key)
@@ -0,0 +1,241 @@
+# Python built-in packages
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+# Third-party packages
+import numpy as np
+import pandas as pd
+
+
+class RangeCache:
+    """
+    An in-memory cache of time series query results, indexed by the date intervals that have
+    already been fetched from the database.
+
+    Each cache entry is identified by a key (e.g. table name and commodity), and stores the
+    union of the fetched data together with the list of (disjoint) date intervals it covers.
+    New requests only need to query the sub-intervals that are not covered yet. The least
+    recently used entries are evicted when the total size of the cached data exceeds a
+    user-defined maximum.
+    """
+
+    def __init__(self, settlement_lag: pd.Timedelta = pd.Timedelta(days=1), max_size: int = None):
+        """
+        Constructor method.
+
+        Args:
+            settlement_lag: Data with dates later than (now - settlement_lag) may still be
+                incomplete in the database. Intervals beyond that point are never marked as
+                covered, such that they are fetched again by subsequent requests.
+            max_size: Maximum total (in-memory) size of the cached data, in bytes. If None, the
+                cache size is unlimited.
+        """
+        self.settlement_lag = settlement_lag
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get_missing_intervals(
+        self, key: tuple, start_date: datetime, end_date: datetime
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Finds the sub-intervals of a date interval that are not covered by the cache.
+
+        Args:
+            key: Cache entry key
+            start_date: Start date (included)
+            end_date: End date (excluded)
+
+        Returns:
+            List of (start date, end date) tuples, sorted in ascending order
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            covered = entry["intervals"] if entry is not None else list()
+
+        return RangeCache.subtract_intervals(covered, start_date, end_date)
+
+    def get(self, key: tuple, start_date: datetime, end_date: datetime) -> pd.DataFrame | None:
+        """
+        Gets the cached data within a date interval.
+
+        Args:
+            key: Cache entry key
+            start_date: Start date (included)
+            end_date: End date (excluded)
+
+        Returns:
+            Dataframe containing the cached data, or None if the key is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            df = entry["data"]
+            dates = pd.DatetimeIndex(df[entry["date_column"]])
+            idx = (dates >= pd.Timestamp(start_date)) & (dates < pd.Timestamp(end_date))
+            df = df.loc[idx, :].reset_index(drop=True)
+
+        return df
+
+    def lookup(
+        self, key: tuple, start_date: datetime, end_date: datetime
+    ) -> tuple[pd.DataFrame | None, list[tuple[pd.Timestamp, pd.Timestamp]]]:
+        """
+        Gets the cached data within a date interval, together with the sub-intervals that are
+        not covered by the cache. Both are read from the same state of the cache, such that the
+        cached data never overlaps the missing intervals (even if other threads add data
+        concurrently).
+
+        Args:
+            key: Cache entry key
+            start_date: Start date (included)
+            end_date: End date (excluded)
+
+        Returns:
+            Tuple with the cached data (or None if the key is not cached), and the list of
+            missing (start date, end date) tuples
+        """
+        with self._lock:
+            return (
+                self.get(key, start_date, end_date),
+                self.get_missing_intervals(key, start_date, end_date),
+            )
+
+    def add(
+        self,
+        key: tuple,
+        start_date: datetime,
+        end_date: datetime,
+        df: pd.DataFrame,
+        date_column: str,
+    ):
+        """
+        Adds the data fetched for a date interval to the cache. Only the rows of the
+        sub-intervals that are not covered yet are added, such that adding the same interval
+        multiple times (e.g. by concurrent requests) does not duplicate cached rows.
+
+        Args:
+            key: Cache entry key
+            start_date: Start date (included)
+            end_date: End date (excluded)
+            df: Data fetched for the date interval
+            date_column: Name of the column containing the dates used to define intervals
+        """
+        start_date = pd.Timestamp(start_date)
+        end_date = pd.Timestamp(end_date)
+
+        # Only mark the interval as covered up to the settlement horizon
+        settled_date = pd.Timestamp.now(tz="UTC").tz_localize(None) - self.settlement_lag
+        end_date = min(end_date, settled_date)
+        if end_date <= start_date:
+            return
+        dates = pd.DatetimeIndex(df[date_column])
+
+        with self._lock:
+            entry = self._entries.get(key)
+            covered = entry["intervals"] if entry is not None else list()
+
+            # Only keep the rows of the sub-intervals that are not covered yet
+            missing = RangeCache.subtract_intervals(covered, start_date, end_date)
+            if len(missing) == 0:
+                return
+            idx = np.zeros(len(df), dtype=bool)
+            for missing_start, missing_end in missing:
+                idx |= (dates >= missing_start) & (dates < missing_end)
+            df = df.loc[idx, :]
+
+            if entry is None:
+                entry = dict(intervals=list(), data=df, date_column=date_column)
+                self._entries[key] = entry
+            elif not df.empty:
+                if entry["data"].empty:
+                    entry["data"] = df
+                else:
+                    entry["data"] = pd.concat([entry["data"], df], ignore_index=True)
+            entry["data"] = entry["data"].reset_index(drop=True)
+            entry["size"] = int(entry["data"].memory_usage(index=True).sum())
+            entry["intervals"] = RangeCache.merge_intervals(entry["intervals"] + missing)
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def invalidate(self, key: tuple = None):
+        """
+        Removes entries from the cache.
+
+        Args:
+            key: Cache entry key. If None, all entries are removed.
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def _evict(self):
+        # Remove least recently used entries until the cache size is below the maximum
+        if self.max_size is None:
+            return
+        total_size = sum(v["size"] for v in self._entries.values())
+        for key in list(self._entries):
+            if total_size <= self.max_size:
+                break
+            total_size -= self._entries.pop(key)["size"]
+
+    @staticmethod
+    def subtract_intervals(
+        intervals: list[tuple[pd.Timestamp, pd.Timestamp]],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Finds the sub-intervals of a date interval that are not covered by a list of date
+        intervals.
+
+        Args:
+            intervals: List of disjoint (start date, end date) tuples, sorted in ascending order
+            start_date: Start date (included)
+            end_date: End date (excluded)
+
+        Returns:
+            List of (start date, end date) tuples, sorted in ascending order
+        """
+        start_date = pd.Timestamp(start_date)
+        end_date = pd.Timestamp(end_date)
+        missing = list()
+        current = start_date
+        for covered_start, covered_end in intervals:
+            if covered_end <= current:
+                continue
+            if covered_start >= end_date:
+                break
+            if covered_start > current:
+                missing.append((current, covered_start))
+            current = max(current, covered_end)
+        if current < end_date:
+            missing.append((current, end_date))
+
+        return missing
+
+    @staticmethod
+    def merge_intervals(
+        intervals: list[tuple[pd.Timestamp, pd.Timestamp]],
+    ) -> list[tuple[pd.Timestamp, pd.Timestamp]]:
+        """
+        Merges overlapping and adjacent date intervals.
+
+        Args:
+            intervals: List of (start date, end date) tuples
+
+        Returns:
+            List of disjoint (start date, end date) tuples, sorted in ascending order
+        """
+        merged = list()
+        for start_date, end_date in sorted(intervals):
+            if len(merged) > 0 and start_date <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end_date))
+            else:
+                merged.append((start_date, end_date))
+        return merged
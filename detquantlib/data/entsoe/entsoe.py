@@ -1,12 +1,28 @@
 # Python built-in packages
+import logging
+import multiprocessing
+import os
 import shutil
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
 
 # Third-party packages
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+import pyarrow.dataset as ds
 
 # Internal modules
-from detquantlib.data.sftp.sftp import Sftp
+from detquantlib.data.sftp.file_cache import SftpFileCache
+from detquantlib.data.sftp.sftp import Sftp, SftpPool
+from detquantlib.dates.timezones import utc_to_local
+
+logger = logging.getLogger(__name__)
 
 
 class Entsoe:
@@ -15,8 +31,30 @@ class Entsoe:
     server.
     """
 
-    def __init__(self, sftp: Sftp = None):
+    # Maximum number of rows per row group of Parquet datasets (see
+    # ingest_day_ahead_spot_prices_file())
+    PARQUET_ROW_GROUP_SIZE = 16_384
+
+    def __init__(self, sftp: Sftp = None, file_cache: SftpFileCache = None):
+        """
+        Constructor method.
+
+        Args:
+            sftp: Instance of the Sftp class, connecting to the ENTSOE SFTP server
+            file_cache: Optional local cache of downloaded files. If provided, files that did
+                not change on the SFTP server since their last download are served from the
+                cache instead of being downloaded again.
+        """
         self.sftp = sftp
+        self.file_cache = file_cache
+
+    def __enter__(self):
+        # Keep the SFTP session open until exit, such that it is reused by all downloads
+        self.sftp.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.sftp.__exit__(exc_type, exc_value, traceback)
 
     @staticmethod
     def get_sftp_folder_dir_day_ahead_spot_prices():
@@ -46,70 +84,228 @@ class Entsoe:
         Downloads the file containing the day-ahead spot prices of a given delivery month from
         the ENTSOE SFTP server to a local directory.
 
+        Note: If the SFTP session is already open (e.g. when the Entsoe class is used as a
+        context manager), the session is reused. Otherwise, a session is opened for this
+        download only.
+
         Args:
             year: Delivery year
             month: Delivery month
             local_folder_dir: Local directory where file will be copied
         """
+        with self.sftp:
+            self.download_day_ahead_spot_prices_file(self.sftp, year, month, local_folder_dir)
+
+    def download_day_ahead_spot_prices_file(
+        self, sftp: Sftp, year: int, month: int, local_folder_dir: str
+    ):
+        """
+        Downloads the file containing the day-ahead spot prices of a given delivery month with
+        a given SFTP session, or gets it from the file cache if it did not change on the server.
+
+        Args:
+            sftp: Instance of the Sftp class
+            year: Delivery year
+            month: Delivery month
+            local_folder_dir: Local directory where file will be copied
+        """
         filename = Entsoe.get_sftp_filename_day_ahead_spot_prices(year=year, month=month)
         remote_folder_dir = Entsoe.get_sftp_folder_dir_day_ahead_spot_prices()
         remote_dir = f"/{remote_folder_dir}/{filename}"
         local_dir = f"{local_folder_dir}/{filename}"
 
-        self.sftp.open_session()
-        self.sftp.get_file(remote_dir, local_dir)
-        self.sftp.close_session()
+        if self.file_cache is not None:
+            self.file_cache.get_file(sftp, remote_dir, local_dir)
+        else:
+            sftp.get_file(remote_dir, local_dir)
+
+    def import_day_ahead_spot_prices_files_from_sftp(
+        self, periods: list[tuple[int, int]], local_folder_dir: str
+    ):
+        """
+        Downloads the files containing the day-ahead spot prices of multiple delivery months
+        from the ENTSOE SFTP server to a local directory, over a single SFTP session.
+
+        Args:
+            periods: List of (delivery year, delivery month) tuples
+            local_folder_dir: Local directory where files will be copied
+        """
+        with self.sftp:
+            for year, month in periods:
+                self.import_day_ahead_spot_prices_file_from_sftp(
+                    year=year, month=month, local_folder_dir=local_folder_dir
+                )
 
     @staticmethod
     def read_day_ahead_spot_prices_from_file(
-        country: str,
-        timezone: str,
+        country: str | list,
+        timezone: str | list,
         year: int,
         month: int,
         local_folder_dir: str,
-    ) -> pd.DataFrame:
+        output_format: str = "frame",
+    ) -> pd.DataFrame | dict:
         """
         Reads and processes the content of the file containing day-ahead spot prices for a given
         delivery month.
 
+        The file contains the prices of all European bidding zones. If multiple countries are
+        requested, the file is parsed only once, and the dates of all countries sharing the
+        same timezone are converted in a single pass.
+
         Args:
-            country: Country/area of requested day-ahead spot prices
-            timezone: Timezone of requested day-ahead spot prices
+            country: Country/area of requested day-ahead spot prices, or list of countries/areas
+            timezone: Timezone of requested day-ahead spot prices. If 'country' is a list, can
+                be a single timezone (used for all countries) or a list of timezones (one per
+                country).
             year: Delivery year
             month: Delivery month
             local_folder_dir: Local directory of folder containing the price data file
+            output_format: Only used if 'country' is a list. Can take value "frame" (returns one
+                long dataframe, with the countries in the order of the input list) or "dict"
+                (returns a dictionary of dataframes, with countries as keys).
 
         Returns:
-            Dataframe containing day-ahead spot prices
+            Dataframe containing day-ahead spot prices (or a dictionary of dataframes)
         """
+        country_timezones = Entsoe.get_country_timezones(country, timezone)
+        countries = list(country_timezones.keys())
+
         # Read data from csv
         filename = Entsoe.get_sftp_filename_day_ahead_spot_prices(year=year, month=month)
         file_dir = f"{local_folder_dir}/{filename}"
-        df = pd.read_csv(file_dir, sep="\t")
+        columns = Entsoe.get_day_ahead_spot_prices_columns()
+        df = pd.read_csv(file_dir, sep="\t", usecols=columns, dtype={"MapCode": "category"})
 
         # Filter columns
-        columns = ["DateTime(UTC)", "ResolutionCode", "MapCode", "Price[Currency/MWh]", "Currency"]
         df = df[columns]
 
-        # Filter rows for relevant country
-        idx = df["MapCode"] == country
+        # Filter rows for relevant countries
+        df["MapCode"] = df["MapCode"].cat.set_categories(countries)
+        idx = df["MapCode"].notna()
         df = df.loc[idx, :]
-        df.reset_index(drop=True, inplace=True)
 
-        # Convert dates from strings to datetime
-        df["DateTime(UTC)"] = pd.to_datetime(
-            df["DateTime(UTC)"], format="%Y-%m-%d %H:%M:%S", utc=True
-        )
+        # Convert dates from strings to (timezone-naive) datetime
+        df["DateTime(UTC)"] = pd.to_datetime(df["DateTime(UTC)"], format="%Y-%m-%d %H:%M:%S")
+
+        # Sort rows in the order of the input list, and by delivery date. Dates are sorted in
+        # UTC, since local dates are not monotonic in the repeated hour of DST changes.
+        df = df.sort_values(by=["MapCode", "DateTime(UTC)"], kind="stable", ignore_index=True)
 
         # Convert from UTC timezone to local timezone
-        df["DateTime(UTC)"] = df["DateTime(UTC)"].dt.tz_convert(timezone)
-        df["DateTime(UTC)"] = df["DateTime(UTC)"].dt.tz_localize(None)
+        df = Entsoe.convert_country_timezones(df, country_timezones)
+
+        return Entsoe.format_countries(df, country, output_format)
+
+    @staticmethod
+    def convert_country_timezones(
+        df: pd.DataFrame, country_timezones: dict[str, str]
+    ) -> pd.DataFrame:
+        """
+        Converts the (UTC) delivery dates of day-ahead spot prices to the local timezone of each
+        country, with one vectorized pass per distinct timezone.
+
+        Args:
+            df: Day-ahead spot prices, with UTC dates and categorical 'MapCode' column (with the
+                countries of 'country_timezones' as categories, in the same order)
+            country_timezones: Dictionary with countries as keys and timezones as values
+
+        Returns:
+            Day-ahead spot prices with local dates
+        """
+        countries = list(country_timezones.keys())
+        dates = df["DateTime(UTC)"].to_numpy()
+        local_dates = dates.copy()
+        codes = df["MapCode"].cat.codes.to_numpy()
+        for tz in dict.fromkeys(country_timezones.values()):
+            tz_codes = [i for i, c in enumerate(countries) if country_timezones[c] == tz]
+            idx = np.isin(codes, tz_codes)
+            local_dates[idx] = utc_to_local(dates[idx], tz)
+        df["DateTime(UTC)"] = local_dates
 
         return df
 
+    @staticmethod
+    def get_country_timezones(country: str | list, timezone: str | list) -> dict[str, str]:
+        """
+        Matches requested countries with their timezones.
+
+        Args:
+            country: Country/area, or list of countries/areas
+            timezone: Timezone, or list of timezones (one per country)
+
+        Returns:
+            Dictionary with countries as keys and timezones as values
+
+        Raises:
+            ValueError: Raises an error if the number of timezones does not match the number of
+                countries
+        """
+        countries = [country] if isinstance(country, str) else list(country)
+        timezones = [timezone] * len(countries) if isinstance(timezone, str) else list(timezone)
+        if len(timezones) != len(countries):
+            raise ValueError(
+                f"Input argument 'timezone' should be a single timezone or a list of "
+                f"{len(countries)} timezones (one per country)."
+            )
+        return dict(zip(countries, timezones))
+
+    @staticmethod
+    def format_countries(
+        df: pd.DataFrame, country: str | list, output_format: str = "frame"
+    ) -> pd.DataFrame | dict:
+        """
+        Formats processed day-ahead spot prices of one or multiple countries, sorted by country
+        (in the order of the requested countries), into the requested output format.
+
+        Args:
+            df: Processed day-ahead spot prices, with categorical 'MapCode' column
+            country: Country/area, or list of countries/areas
+            output_format: Only used if 'country' is a list. Can take value "frame" (returns one
+                long dataframe) or "dict" (returns a dictionary of dataframes, with countries as
+                keys).
+
+        Returns:
+            Dataframe containing day-ahead spot prices (or a dictionary of dataframes)
+
+        Raises:
+            ValueError: Raises an error in case of invalid output format
+        """
+        valid_output_formats = ["frame", "dict"]
+        if output_format not in valid_output_formats:
+            raise ValueError(
+                f"Invalid input 'output_format' value '{output_format}'. "
+                f"Supported values: {valid_output_formats}."
+            )
+
+        if isinstance(country, str):
+            # Single country: return map codes as strings
+            df["MapCode"] = df["MapCode"].astype(object)
+            return df
+
+        if output_format == "frame":
+            return df
+
+        # Split data per country (rows of each country are contiguous)
+        counts = df["MapCode"].value_counts(sort=False)
+        idx_ends = np.cumsum(counts.to_numpy())
+        dfs = dict()
+        for c, idx_start, idx_end in zip(counts.index, idx_ends - counts.to_numpy(), idx_ends):
+            df_country = df.iloc[idx_start:idx_end].reset_index(drop=True)
+            df_country["MapCode"] = df_country["MapCode"].astype(object)
+            dfs[c] = df_country
+
+        return dfs
+
     def get_day_ahead_spot_prices_from_sftp(
-        self, country: str, timezone: str, year: int, month: int, keep_local_file: bool = False
-    ) -> pd.DataFrame:
+        self,
+        country: str | list,
+        timezone: str | list,
+        year: int,
+        month: int,
+        keep_local_file: bool = False,
+        output_format: str = "frame",
+    ) -> pd.DataFrame | dict:
         """
         Main method to fetch and process day-ahead spot price data from the ENSTOE SFTP server.
 
@@ -121,16 +317,621 @@ class Entsoe:
             indicates that the file should be kept.
 
         Args:
-            country: Country/area of requested day-ahead spot prices
-            timezone: Timezone of requested day-ahead spot prices
+            country: Country/area of requested day-ahead spot prices, or list of countries/areas
+                (parsed from the same file in a single pass)
+            timezone: Timezone of requested day-ahead spot prices, or list of timezones (one per
+                country)
             year: Delivery year
             month: Delivery month
             keep_local_file: Indicates whether the downloaded data file should be kept or not
+            output_format: Only used if 'country' is a list. Can take value "frame" (returns one
+                long dataframe) or "dict" (returns a dictionary of dataframes, with countries as
+                keys).
 
         Returns:
-            Dataframe containing day-ahead spot prices
+            Dataframe containing day-ahead spot prices (or a dictionary of dataframes)
         """
-        # Define local directory where price data file will be stored
+        filename = Entsoe.get_sftp_filename_day_ahead_spot_prices(year=year, month=month)
+        with Entsoe.local_data_folder([filename], keep_local_file) as entsoe_data_folder_dir:
+            # Import price data file from ENTSOE SFTP to local directory
+            self.import_day_ahead_spot_prices_file_from_sftp(
+                year=year, month=month, local_folder_dir=entsoe_data_folder_dir
+            )
+
+            # Read price data file
+            df = self.read_day_ahead_spot_prices_from_file(
+                country=country,
+                timezone=timezone,
+                year=year,
+                month=month,
+                local_folder_dir=entsoe_data_folder_dir,
+                output_format=output_format,
+            )
+
+        return df
+
+    def get_day_ahead_spot_prices_range_from_sftp(
+        self,
+        country: str | list,
+        timezone: str | list,
+        start_date: datetime,
+        end_date: datetime,
+        download_workers: int = 4,
+        parse_workers: int = None,
+        keep_local_files: bool = False,
+        errors: str = "raise",
+        output_format: str = "frame",
+    ) -> pd.DataFrame | dict:
+        """
+        Fetches and processes day-ahead spot price data of a delivery period spanning multiple
+        months from the ENTSOE SFTP server.
+
+        The monthly price data files are downloaded concurrently over multiple SFTP sessions,
+        and each file is parsed in a process pool as soon as it is downloaded (see
+        fetch_day_ahead_spot_prices_files()).
+
+        Args:
+            country: Country/area of requested day-ahead spot prices, or list of countries/areas
+                (each file is parsed once for all countries)
+            timezone: Timezone of requested day-ahead spot prices, or list of timezones (one per
+                country)
+            start_date: Delivery start date (in local time if timezone-naive, otherwise
+                converted to the local time of each country). The start datetime is included in
+                the filtering (i.e. delivery dates >= start_date).
+            end_date: Delivery end date (in local time if timezone-naive, otherwise converted to
+                the local time of each country). The end datetime is excluded from the
+                filtering (i.e. delivery dates < end_date).
+            download_workers: Maximum number of concurrent downloads (i.e. of open SFTP
+                sessions)
+            parse_workers: Maximum number of processes parsing files. If None, uses the number
+                of CPUs. If 1, files are parsed in the calling process.
+            keep_local_files: Indicates whether the downloaded data files should be kept or not
+            errors: Can take value "raise" (raises an error if any file fails to download or
+                parse) or "ignore" (logs a warning for each failed file, and returns the data of
+                the other files)
+            output_format: Only used if 'country' is a list. Can take value "frame" (returns one
+                long dataframe, with the countries in the order of the input list) or "dict"
+                (returns a dictionary of dataframes, with countries as keys).
+
+        Returns:
+            Dataframe containing day-ahead spot prices, sorted by delivery date (or a dictionary
+            of dataframes)
+
+        Raises:
+            ValueError: Raises an error in case of invalid 'errors' or 'output_format' values
+            RuntimeError: Raises an error if any file fails to download or parse (only if
+                errors="raise")
+        """
+        # Input validation
+        valid_errors = ["raise", "ignore"]
+        if errors not in valid_errors:
+            raise ValueError(
+                f"Invalid input 'errors' value '{errors}'. Supported values: {valid_errors}."
+            )
+        valid_output_formats = ["frame", "dict"]
+        if output_format not in valid_output_formats:
+            raise ValueError(
+                f"Invalid input 'output_format' value '{output_format}'. "
+                f"Supported values: {valid_output_formats}."
+            )
+
+        # Get the file months covering the delivery period, in the timezones of all countries
+        country_timezones = Entsoe.get_country_timezones(country, timezone)
+        periods = sorted(
+            set(
+                p
+                for tz in set(country_timezones.values())
+                for p in Entsoe.get_delivery_months(start_date, end_date, tz)
+            )
+        )
+        filenames = [
+            Entsoe.get_sftp_filename_day_ahead_spot_prices(year=year, month=month)
+            for year, month in periods
+        ]
+
+        with Entsoe.local_data_folder(filenames, keep_local_files) as entsoe_data_folder_dir:
+            results, failures = self.fetch_day_ahead_spot_prices_files(
+                country=country,
+                timezone=timezone,
+                periods=periods,
+                local_folder_dir=entsoe_data_folder_dir,
+                download_workers=download_workers,
+                parse_workers=parse_workers,
+            )
+
+        # Report failed files
+        Entsoe.report_failures(failures, errors)
+
+        # Concatenate monthly data in delivery order, and filter the requested delivery period
+        dfs = [results[p] for p in periods if p in results]
+        if len(dfs) == 0:
+            columns = Entsoe.get_day_ahead_spot_prices_columns()
+            df = pd.DataFrame(columns=columns)
+            df["MapCode"] = pd.Categorical([], categories=list(country_timezones.keys()))
+            return Entsoe.format_countries(df, country, output_format)
+        df = pd.concat(dfs, ignore_index=True)
+        df = Entsoe.filter_delivery_period(df, country_timezones, start_date, end_date)
+
+        # Group rows by country. The stable sort keeps the delivery (UTC) order of the monthly
+        # data, which sorting on local dates would break in the repeated hour of DST changes.
+        df = df.sort_values(by="MapCode", kind="stable", ignore_index=True)
+
+        return Entsoe.format_countries(df, country, output_format)
+
+    def fetch_day_ahead_spot_prices_files(
+        self,
+        country: str | list,
+        timezone: str | list,
+        periods: list[tuple[int, int]],
+        local_folder_dir: str,
+        download_workers: int = 4,
+        parse_workers: int = None,
+    ) -> tuple[dict[tuple[int, int], pd.DataFrame], dict[tuple[int, int], Exception]]:
+        """
+        Downloads and parses the day-ahead spot price files of multiple delivery months.
+
+        The files are downloaded concurrently by a thread pool, with each thread using a
+        session of an SFTP pool (see SftpPool), such that the authentication handshakes are
+        not repeated for each file. Downloaded files are parsed in a process pool while the
+        remaining files are being downloaded. The parsing processes are started with the
+        "spawn" method, since processes forked while download threads are running (e.g.
+        holding paramiko locks) can deadlock.
+
+        Args:
+            country: Country/area of requested day-ahead spot prices, or list of countries/areas
+            timezone: Timezone of requested day-ahead spot prices, or list of timezones (one per
+                country)
+            periods: List of (delivery year, delivery month) tuples
+            local_folder_dir: Local directory where files will be copied
+            download_workers: Maximum number of concurrent downloads (i.e. of open SFTP
+                sessions)
+            parse_workers: Maximum number of processes parsing files. If None, uses the number
+                of CPUs. The number of processes never exceeds the number of files. If 1, files
+                are parsed in the calling process.
+
+        Returns:
+            Dictionary with (year, month) tuples as keys and dataframes containing the
+            day-ahead spot prices of successfully processed months as values, and dictionary
+            with (year, month) tuples as keys and raised errors of failed months as values.
+            If 'country' is a list, the dataframes contain all countries (see
+            read_day_ahead_spot_prices_from_file(), with output_format="frame").
+        """
+        results = dict()
+        failures = dict()
+        if len(periods) == 0:
+            return results, failures
+
+        # Set default number of workers
+        download_workers = max(1, min(download_workers, len(periods)))
+        if parse_workers is None:
+            parse_workers = os.cpu_count() or 1
+        parse_workers = max(1, min(parse_workers, len(periods)))
+
+        def download(pool: SftpPool, year: int, month: int):
+            with pool.session() as sftp:
+                self.download_day_ahead_spot_prices_file(sftp, year, month, local_folder_dir)
+
+        def parse(year: int, month: int) -> pd.DataFrame:
+            return Entsoe.read_day_ahead_spot_prices_from_file(
+                country, timezone, year, month, local_folder_dir
+            )
+
+        pool = SftpPool.from_sftp(self.sftp, max_size=download_workers)
+        if parse_workers > 1:
+            parse_executor = ProcessPoolExecutor(
+                parse_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            parse_executor = None
+        try:
+            with pool, ThreadPoolExecutor(max_workers=download_workers) as download_executor:
+                downloads = {download_executor.submit(download, pool, *p): p for p in periods}
+
+                # Parse each file as soon as it is downloaded
+                parses = dict()
+                for future in as_completed(downloads):
+                    period = downloads[future]
+                    if future.exception() is not None:
+                        failures[period] = future.exception()
+                    elif parse_executor is not None:
+                        parses[period] = parse_executor.submit(
+                            Entsoe.read_day_ahead_spot_prices_from_file,
+                            country,
+                            timezone,
+                            *period,
+                            local_folder_dir,
+                        )
+                    else:
+                        try:
+                            results[period] = parse(*period)
+                        except Exception as e:
+                            failures[period] = e
+
+            for period, future in parses.items():
+                if future.exception() is not None:
+                    failures[period] = future.exception()
+                else:
+                    results[period] = future.result()
+        finally:
+            if parse_executor is not None:
+                parse_executor.shutdown()
+
+        # Sort failures in delivery order
+        failures = {p: failures[p] for p in periods if p in failures}
+
+        return results, failures
+
+    @staticmethod
+    def report_failures(failures: dict[tuple[int, int], Exception], errors: str = "raise"):
+        """
+        Reports the files that failed to be fetched or processed.
+
+        Args:
+            failures: Dictionary with (year, month) tuples as keys and raised errors as values
+            errors: Can take value "raise" (raises an error listing all failed files) or
+                "ignore" (logs a warning for each failed file)
+
+        Raises:
+            RuntimeError: Raises an error if any file failed (only if errors="raise")
+        """
+        if len(failures) == 0:
+            return
+
+        messages = [
+            f"{Entsoe.get_sftp_filename_day_ahead_spot_prices(year=year, month=month)} "
+            f"({type(error).__name__}: {error})"
+            for (year, month), error in failures.items()
+        ]
+        if errors == "raise":
+            raise RuntimeError(
+                f"Failed to fetch {len(failures)} ENTSOE file(s): {', '.join(messages)}."
+            ) from next(iter(failures.values()))
+        for message in messages:
+            logger.warning(f"Failed to fetch ENTSOE file {message}.")
+
+    @staticmethod
+    def get_delivery_months(
+        start_date: datetime, end_date: datetime, timezone: str
+    ) -> list[tuple[int, int]]:
+        """
+        Gets the months of the price data files covering a delivery period. The price data files
+        are split by UTC month, such that the first local hours of a month can be in the file of
+        the previous month.
+
+        Args:
+            start_date: Delivery start date (in local time if timezone-naive, included)
+            end_date: Delivery end date (in local time if timezone-naive, excluded)
+            timezone: Local timezone
+
+        Returns:
+            List of (delivery year, delivery month) tuples, in chronological order
+        """
+        start_date, end_date = Entsoe.get_utc_delivery_interval(start_date, end_date, timezone)
+        if end_date <= start_date:
+            return list()
+
+        months = pd.period_range(start_date, end_date - pd.Timedelta(1, "ns"), freq="M")
+        return [(m.year, m.month) for m in months]
+
+    @staticmethod
+    def get_utc_delivery_interval(
+        start_date: datetime, end_date: datetime, timezone: str
+    ) -> tuple[pd.Timestamp, pd.Timestamp]:
+        """
+        Converts a local delivery period to UTC.
+
+        Args:
+            start_date: Delivery start date (in local time if timezone-naive, included)
+            end_date: Delivery end date (in local time if timezone-naive, excluded)
+            timezone: Local timezone
+
+        Returns:
+            Timezone-naive UTC start and end dates
+        """
+        dates = list()
+        for date in [start_date, end_date]:
+            date = pd.Timestamp(date)
+            if date.tz is None:
+                date = date.tz_localize(timezone, ambiguous=True, nonexistent="shift_forward")
+            dates.append(date.tz_convert("UTC").tz_localize(None))
+        return dates[0], dates[1]
+
+    @staticmethod
+    def get_local_delivery_date(date: datetime, timezone: str) -> pd.Timestamp:
+        """
+        Converts a delivery date to a timezone-naive date in local time. Timezone-naive dates are
+        assumed to be in local time already.
+
+        Args:
+            date: Delivery date
+            timezone: Local timezone
+
+        Returns:
+            Timezone-naive local date
+        """
+        date = pd.Timestamp(date)
+        if date.tz is not None:
+            date = date.tz_convert(timezone).tz_localize(None)
+        return date
+
+    @staticmethod
+    def filter_delivery_period(
+        df: pd.DataFrame,
+        country_timezones: dict[str, str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> pd.DataFrame:
+        """
+        Filters day-ahead spot prices with local delivery dates on a delivery period.
+        Timezone-aware start and end dates are converted to the local timezone of each country.
+
+        Args:
+            df: Day-ahead spot prices, with local dates
+            country_timezones: Dictionary with countries as keys and timezones as values
+            start_date: Delivery start date (in local time if timezone-naive, included)
+            end_date: Delivery end date (in local time if timezone-naive, excluded)
+
+        Returns:
+            Filtered day-ahead spot prices
+        """
+        dates = df["DateTime(UTC)"]
+        idx = pd.Series(False, index=df.index)
+        for tz in dict.fromkeys(country_timezones.values()):
+            tz_countries = [c for c in country_timezones if country_timezones[c] == tz]
+            tz_start_date = Entsoe.get_local_delivery_date(start_date, tz)
+            tz_end_date = Entsoe.get_local_delivery_date(end_date, tz)
+            idx |= (
+                df["MapCode"].isin(tz_countries) & (dates >= tz_start_date) & (dates < tz_end_date)
+            )
+
+        return df.loc[idx, :]
+
+    def ingest_day_ahead_spot_prices_from_sftp(
+        self,
+        periods: list[tuple[int, int]],
+        dataset_dir: str,
+        partition_by_map_code: bool = False,
+        download_workers: int = 4,
+        errors: str = "raise",
+    ):
+        """
+        Downloads the day-ahead spot price files of multiple delivery months from the ENTSOE
+        SFTP server, and converts them to a local Parquet dataset (see
+        ingest_day_ahead_spot_prices_file()). The files are downloaded and converted
+        concurrently, with each thread using a session of an SFTP pool.
+
+        The dataset can then be read with read_day_ahead_spot_prices_from_dataset(), without
+        downloading or parsing the csv files again.
+
+        Args:
+            periods: List of (delivery year, delivery month) tuples
+            dataset_dir: Local directory of the Parquet dataset
+            partition_by_map_code: If true, the dataset is also partitioned by map code
+            download_workers: Maximum number of concurrent downloads (i.e. of open SFTP
+                sessions)
+            errors: Can take value "raise" (raises an error if any file fails to download or
+                convert) or "ignore" (logs a warning for each failed file)
+
+        Raises:
+            ValueError: Raises an error in case of invalid 'errors' value
+        """
+        # Input validation
+        valid_errors = ["raise", "ignore"]
+        if errors not in valid_errors:
+            raise ValueError(
+                f"Invalid input 'errors' value '{errors}'. Supported values: {valid_errors}."
+            )
+        if len(periods) == 0:
+            return
+
+        filenames = [
+            Entsoe.get_sftp_filename_day_ahead_spot_prices(year=year, month=month)
+            for year, month in periods
+        ]
+        download_workers = max(1, min(download_workers, len(periods)))
+
+        with Entsoe.local_data_folder(filenames) as entsoe_data_folder_dir:
+            pool = SftpPool.from_sftp(self.sftp, max_size=download_workers)
+
+            def ingest(year: int, month: int):
+                with pool.session() as sftp:
+                    self.download_day_ahead_spot_prices_file(
+                        sftp, year, month, entsoe_data_folder_dir
+                    )
+                Entsoe.ingest_day_ahead_spot_prices_file(
+                    year, month, entsoe_data_folder_dir, dataset_dir, partition_by_map_code
+                )
+
+            with pool, ThreadPoolExecutor(max_workers=download_workers) as executor:
+                futures = {executor.submit(ingest, *p): p for p in periods}
+
+        # Report failed files, in delivery order
+        failures = {futures[f]: f.exception() for f in futures if f.exception() is not None}
+        failures = {p: failures[p] for p in periods if p in failures}
+        Entsoe.report_failures(failures, errors)
+
+    @staticmethod
+    def ingest_day_ahead_spot_prices_file(
+        year: int,
+        month: int,
+        local_folder_dir: str,
+        dataset_dir: str,
+        partition_by_map_code: bool = False,
+    ):
+        """
+        Converts the file containing day-ahead spot prices for a given delivery month to a
+        Parquet dataset, partitioned by year and month (and optionally by map code).
+
+        The columns are stored with their types (e.g. dates as timestamps), and the rows are
+        sorted by map code and date, such that reads filtering on map codes and dates only load
+        the needed row groups (see read_day_ahead_spot_prices_from_dataset()). Ingesting a month
+        again (e.g. after a revision of the file) replaces all the data of that month.
+
+        Args:
+            year: Delivery year
+            month: Delivery month
+            local_folder_dir: Local directory of folder containing the price data file
+            dataset_dir: Local directory of the Parquet dataset
+            partition_by_map_code: If true, the dataset is also partitioned by map code
+        """
+        # Read data from csv, with typed columns
+        filename = Entsoe.get_sftp_filename_day_ahead_spot_prices(year=year, month=month)
+        file_dir = f"{local_folder_dir}/{filename}"
+        columns = Entsoe.get_day_ahead_spot_prices_columns()
+        table = pa_csv.read_csv(
+            file_dir,
+            parse_options=pa_csv.ParseOptions(delimiter="\t"),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=columns,
+                column_types=Entsoe.get_day_ahead_spot_prices_schema(),
+                timestamp_parsers=["%Y-%m-%d %H:%M:%S"],
+            ),
+        )
+
+        # Sort rows by map code and date, and add partition columns
+        table = table.sort_by([("MapCode", "ascending"), ("DateTime(UTC)", "ascending")])
+        table = table.append_column("year", pa.array([year] * table.num_rows, pa.int16()))
+        table = table.append_column("month", pa.array([month] * table.num_rows, pa.int8()))
+
+        partition_columns = ["year", "month"]
+        if partition_by_map_code:
+            partition_columns.append("MapCode")
+        partitioning = ds.partitioning(
+            pa.schema([table.schema.field(c) for c in partition_columns]), flavor="hive"
+        )
+
+        # Delete the existing data of the month, including the map code partitions that are no
+        # longer in the file
+        month_folder_dir = Path(dataset_dir, f"year={year}", f"month={month}")
+        if month_folder_dir.exists():
+            shutil.rmtree(month_folder_dir)
+
+        ds.write_dataset(
+            table,
+            dataset_dir,
+            format="parquet",
+            partitioning=partitioning,
+            basename_template="part-{i}.parquet",
+            existing_data_behavior="delete_matching",
+            min_rows_per_group=Entsoe.PARQUET_ROW_GROUP_SIZE,
+            max_rows_per_group=Entsoe.PARQUET_ROW_GROUP_SIZE,
+        )
+
+    @staticmethod
+    def read_day_ahead_spot_prices_from_dataset(
+        country: str | list,
+        timezone: str | list,
+        start_date: datetime,
+        end_date: datetime,
+        dataset_dir: str,
+        output_format: str = "frame",
+    ) -> pd.DataFrame | dict:
+        """
+        Reads day-ahead spot prices from a Parquet dataset created by
+        ingest_day_ahead_spot_prices_file(). The map code and date filters are pushed down to
+        the dataset scan, such that only the needed partitions, row groups and columns are
+        loaded.
+
+        Args:
+            country: Country/area of requested day-ahead spot prices, or list of countries/areas
+            timezone: Timezone of requested day-ahead spot prices, or list of timezones (one per
+                country)
+            start_date: Delivery start date (in local time if timezone-naive, otherwise
+                converted to the local time of each country). The start datetime is included in
+                the filtering (i.e. delivery dates >= start_date).
+            end_date: Delivery end date (in local time if timezone-naive, otherwise converted to
+                the local time of each country). The end datetime is excluded from the
+                filtering (i.e. delivery dates < end_date).
+            dataset_dir: Local directory of the Parquet dataset
+            output_format: Only used if 'country' is a list. Can take value "frame" (returns one
+                long dataframe, with the countries in the order of the input list) or "dict"
+                (returns a dictionary of dataframes, with countries as keys).
+
+        Returns:
+            Dataframe containing day-ahead spot prices, sorted by delivery date (or a dictionary
+            of dataframes)
+        """
+        country_timezones = Entsoe.get_country_timezones(country, timezone)
+        countries = list(country_timezones.keys())
+
+        # Get the UTC delivery interval and file months covering all timezones
+        intervals = [
+            Entsoe.get_utc_delivery_interval(start_date, end_date, tz)
+            for tz in set(country_timezones.values())
+        ]
+        periods = sorted(
+            set(
+                p
+                for tz in set(country_timezones.values())
+                for p in Entsoe.get_delivery_months(start_date, end_date, tz)
+            )
+        )
+
+        # Build filter expression on partitions, map codes and dates
+        date_type = pa.timestamp("ns")
+        period_filter = pc.scalar(False)
+        for year, month in periods:
+            period_filter = period_filter | (
+                (pc.field("year") == year) & (pc.field("month") == month)
+            )
+        expression = (
+            period_filter
+            & pc.field("MapCode").isin(countries)
+            & (pc.field("DateTime(UTC)") >= pa.scalar(min(i[0] for i in intervals), date_type))
+            & (pc.field("DateTime(UTC)") < pa.scalar(max(i[1] for i in intervals), date_type))
+        )
+
+        # Read data
+        dataset = ds.dataset(dataset_dir, format="parquet", partitioning="hive")
+        columns = Entsoe.get_day_ahead_spot_prices_columns()
+        df = dataset.to_table(columns=columns, filter=expression).to_pandas()
+        df["DateTime(UTC)"] = df["DateTime(UTC)"].astype("datetime64[ns]")
+        df["MapCode"] = pd.Categorical(df["MapCode"], categories=countries)
+
+        # Sort rows in the order of the input list, and by delivery date. Dates are sorted in
+        # UTC, since local dates are not monotonic in the repeated hour of DST changes.
+        df = df.sort_values(by=["MapCode", "DateTime(UTC)"], kind="stable", ignore_index=True)
+
+        # Convert from UTC timezone to local timezone, and filter the requested delivery period
+        df = Entsoe.convert_country_timezones(df, country_timezones)
+        df = Entsoe.filter_delivery_period(df, country_timezones, start_date, end_date)
+        df = df.reset_index(drop=True)
+
+        return Entsoe.format_countries(df, country, output_format)
+
+    @staticmethod
+    def get_day_ahead_spot_prices_schema() -> dict:
+        # Column types of day-ahead spot prices
+        return {
+            "DateTime(UTC)": pa.timestamp("ns"),
+            "ResolutionCode": pa.string(),
+            "MapCode": pa.string(),
+            "Price[Currency/MWh]": pa.float64(),
+            "Currency": pa.string(),
+        }
+
+    @staticmethod
+    def get_day_ahead_spot_prices_columns() -> list:
+        # Columns of processed day-ahead spot prices
+        return ["DateTime(UTC)", "ResolutionCode", "MapCode", "Price[Currency/MWh]", "Currency"]
+
+    @staticmethod
+    @contextmanager
+    def local_data_folder(filenames: list, keep_local_files: bool = False) -> Iterator[str]:
+        """
+        Context manager providing the local directory where ENTSOE data files are stored
+        ("Inputs/EntsoeData" in the current working directory). On exit, the data files are
+        deleted, as well as the folders that did not exist before, unless the user indicates
+        that the files should be kept.
+
+        Args:
+            filenames: Names of the data files stored in the local directory
+            keep_local_files: Indicates whether the data files should be kept or not
+
+        Yields:
+            Local directory of the ENTSOE data folder
+        """
+        # Define local directory where price data files will be stored
         input_folder_dir = Path.cwd().joinpath("Inputs")
         entsoe_data_folder_dir = input_folder_dir.joinpath("EntsoeData")
 
@@ -140,35 +941,21 @@ class Entsoe:
 
         # Create local directory if it doesn't exist
         entsoe_data_folder_dir.mkdir(parents=True, exist_ok=True)
-        entsoe_data_folder_dir = str(entsoe_data_folder_dir)
 
-        # Import price data file from ENTSOE SFTP to local directory
-        self.import_day_ahead_spot_prices_file_from_sftp(
-            year=year, month=month, local_folder_dir=entsoe_data_folder_dir
-        )
-
-        # Read price data file
-        df = self.read_day_ahead_spot_prices_from_file(
-            country=country,
-            timezone=timezone,
-            year=year,
-            month=month,
-            local_folder_dir=entsoe_data_folder_dir,
-        )
-
-        # Delete price data file
-        if not keep_local_file:
-            if input_folder_exists and entsoe_data_folder_exists:
-                # Local directory already existed. Only delete the price data file.
-                filename = Entsoe.get_sftp_filename_day_ahead_spot_prices(year=year, month=month)
-                file_dir = Path(entsoe_data_folder_dir).joinpath(filename)
-                file_dir.unlink()
-            elif input_folder_exists:
-                # Only the Inputs folder already existed. Delete the EntsoeData folder and its
-                # content.
-                shutil.rmtree(entsoe_data_folder_dir)
-            else:
-                # The entire temporary local directory did not exist. Delete the entire directory.
-                shutil.rmtree(input_folder_dir)
-
-        return df
+        try:
+            yield str(entsoe_data_folder_dir)
+        finally:
+            # Delete price data files
+            if not keep_local_files:
+                if input_folder_exists and entsoe_data_folder_exists:
+                    # Local directory already existed. Only delete the price data files.
+                    for filename in filenames:
+                        entsoe_data_folder_dir.joinpath(filename).unlink(missing_ok=True)
+                elif input_folder_exists:
+                    # Only the Inputs folder already existed. Delete the EntsoeData folder and
+                    # its content.
+                    shutil.rmtree(entsoe_data_folder_dir)
+                else:
+                    # The entire temporary local directory did not exist. Delete the entire
+                    # directory.
+                    shutil.rmtree(input_folder_dir)
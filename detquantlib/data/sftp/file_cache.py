@@ -0,0 +1,189 @@
+# Python built-in packages
+import hashlib
+import os
+import shutil
+import threading
+import uuid
+from pathlib import Path, PurePosixPath
+
+# Internal modules
+from detquantlib.data.sftp.sftp import Sftp
+
+
+class SftpFileCache:
+    """
+    A local cache of files downloaded from an SFTP server.
+
+    Cached files are keyed by their remote path, size and modification time, which are checked
+    with a (cheap) 'stat' request before each download. Files that did not change on the server
+    are served from the cache, and only new or revised files are downloaded. Outdated versions
+    of a revised file are deleted from the cache.
+
+    The total size of the cache is capped. When the cap is exceeded, the least recently used
+    files are evicted first.
+
+    Cache layout:
+        <cache_dir>/<hash of remote path>/<hash of remote size and mtime>/<filename>
+    """
+
+    def __init__(self, cache_dir: str = None, max_size: int = 5 * 1024**3):
+        """
+        Constructor method.
+
+        Args:
+            cache_dir: Local cache directory. If None, uses "~/.cache/detquantlib/sftp".
+            max_size: Maximum total size (in bytes) of the cached files
+        """
+        if cache_dir is None:
+            cache_dir = Path.home().joinpath(".cache", "detquantlib", "sftp")
+        self.cache_dir = Path(cache_dir)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+
+    def get_file(self, sftp: Sftp, remote_dir: str, local_dir: str = None) -> Path:
+        """
+        Gets a file from the cache, downloading it from the SFTP server only if it is not
+        cached or if it changed on the server.
+
+        Args:
+            sftp: Instance of the Sftp class, used to check and download the remote file
+            remote_dir: SFTP server file directory
+            local_dir: If provided, the cached file is also made available at this local file
+                directory (as a hard link if possible, as a copy otherwise)
+
+        Returns:
+            Directory of the cached file
+        """
+        with sftp:
+            attributes = sftp.stat(remote_dir)
+            path_key, version_key = SftpFileCache.get_keys(
+                remote_dir, attributes.st_size, attributes.st_mtime
+            )
+            entry_dir = self.cache_dir.joinpath(path_key, version_key)
+            file_dir = entry_dir.joinpath(PurePosixPath(remote_dir).name)
+
+            # Note: Cached files are only read, moved and deleted under the lock, such that
+            # files are not evicted (e.g. by another thread) between the checks and the link.
+            with self._lock:
+                is_cached = file_dir.exists()
+                if is_cached:
+                    # Mark file as recently used
+                    os.utime(file_dir)
+                    if local_dir is not None:
+                        SftpFileCache.link_file(file_dir, Path(local_dir))
+
+            if not is_cached:
+                # Download to a temporary file, such that incomplete downloads are never served
+                tmp_folder_dir = self.cache_dir.joinpath(".tmp")
+                tmp_folder_dir.mkdir(parents=True, exist_ok=True)
+                tmp_dir = tmp_folder_dir.joinpath(f"{uuid.uuid4().hex}.tmp")
+                try:
+                    sftp.get_file(remote_dir, str(tmp_dir))
+                    with self._lock:
+                        entry_dir.mkdir(parents=True, exist_ok=True)
+                        os.replace(tmp_dir, file_dir)
+                        self.delete_outdated_versions(path_key, version_key)
+                        self.evict(keep=file_dir)
+                        if local_dir is not None:
+                            SftpFileCache.link_file(file_dir, Path(local_dir))
+                finally:
+                    tmp_dir.unlink(missing_ok=True)
+
+        return file_dir
+
+    @staticmethod
+    def get_keys(remote_dir: str, size: int, mtime: int) -> tuple[str, str]:
+        """
+        Computes the cache keys of a remote file.
+
+        Args:
+            remote_dir: SFTP server file directory
+            size: Remote file size (in bytes)
+            mtime: Remote file modification time (as Unix timestamp)
+
+        Returns:
+            Key of the remote path, and key of the remote file version
+        """
+        # Normalize remote path (e.g. "//folder/file.csv" and "/folder/file.csv")
+        remote_dir = "/" + "/".join(p for p in remote_dir.split("/") if p != "")
+        path_key = hashlib.sha256(remote_dir.encode()).hexdigest()[:32]
+        version_key = hashlib.sha256(f"{size}|{mtime}".encode()).hexdigest()[:32]
+        return path_key, version_key
+
+    def get_files(self) -> list[Path]:
+        """
+        Lists the cached files.
+
+        Returns:
+            Directories of all cached files
+        """
+        return [f for f in self.cache_dir.glob("*/*/*") if not f.name.startswith(".")]
+
+    def get_size(self) -> int:
+        """
+        Computes the total size of the cached files.
+
+        Returns:
+            Total size (in bytes)
+        """
+        return sum(f.stat().st_size for f in self.get_files())
+
+    def delete_outdated_versions(self, path_key: str, version_key: str):
+        """
+        Deletes the cached versions of a remote file, except the current version.
+
+        Args:
+            path_key: Key of the remote path
+            version_key: Key of the current version of the remote file
+        """
+        for entry_dir in self.cache_dir.joinpath(path_key).iterdir():
+            if entry_dir.name != version_key:
+                shutil.rmtree(entry_dir, ignore_errors=True)
+
+    def evict(self, keep: Path = None):
+        """
+        Evicts the least recently used files until the total size of the cache is below the
+        size cap.
+
+        Args:
+            keep: Directory of a cached file that should never be evicted (e.g. the file that
+                was just downloaded)
+        """
+        files = list()
+        for f in self.get_files():
+            try:
+                stat = f.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, f))
+
+        total_size = sum(size for _, size, _ in files)
+        for _, size, f in sorted(files, key=lambda x: x[0]):
+            if total_size <= self.max_size:
+                break
+            if keep is not None and f == keep:
+                continue
+            shutil.rmtree(f.parent, ignore_errors=True)
+            total_size -= size
+
+    def clear(self):
+        """Deletes all cached files."""
+        with self._lock:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    @staticmethod
+    def link_file(file_dir: Path, local_dir: Path):
+        """
+        Makes a cached file available at a local file directory, as a hard link (no copy) if
+        possible, or as a copy otherwise (e.g. if the directories are on different devices).
+
+        Args:
+            file_dir: Directory of the cached file
+            local_dir: Local file directory
+        """
+        if local_dir.exists() or local_dir.is_symlink():
+            local_dir.unlink()
+        try:
+            os.link(file_dir, local_dir)
+        except OSError:
+            shutil.copyfile(file_dir, local_dir)
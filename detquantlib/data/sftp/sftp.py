@@ -1,8 +1,26 @@
+# Python built-in packages
+import queue
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+# Third-party packages
 import paramiko
 
 
 class Sftp:
-    """A class that handles imports and exports of data from and to an SFTP server."""
+    """
+    A class that handles imports and exports of data from and to an SFTP server.
+
+    The SFTP session can be kept open across many file transfers, by using the class as a
+    context manager:
+        with Sftp(hostname=..., port=..., username=..., password=...) as sftp:
+            for remote_dir, local_dir in files:
+                sftp.get_file(remote_dir, local_dir)
+
+    Lost connections are automatically re-established before retrying the failed transfer.
+    """
 
     def __init__(
         self,
@@ -14,6 +32,10 @@ class Sftp:
         authentication_type: str = "password",
         sftp_session: paramiko.SFTPClient = None,
         transport: paramiko.Transport = None,
+        private_key_passphrase: str = None,
+        keepalive_interval: int = 30,
+        max_retries: int = 2,
+        retry_backoff: float = 1.0,
     ):
         """
         Constructor method.
@@ -29,6 +51,14 @@ class Sftp:
             authentication_type: Can take value "password" or "private_key"
             sftp_session: SFTP session object
             transport: Transport object
+            private_key_passphrase: Passphrase of the private key, if the key file is encrypted
+                (only used if authentication_type="private_key")
+            keepalive_interval: Interval (in seconds) between keepalive packets sent to the
+                server, to prevent idle sessions from being closed. Set to 0 to disable.
+            max_retries: Maximum number of times a file transfer is retried after a lost
+                connection
+            retry_backoff: Waiting time (in seconds) before the first retry. The waiting time
+                doubles with each subsequent retry.
 
         Raises:
             ValueError: Raises an error in case of invalid authentication type
@@ -49,24 +79,84 @@ class Sftp:
         self.authentication_type = authentication_type
         self.sftp_session = sftp_session
         self.transport = transport
+        self.private_key_passphrase = private_key_passphrase
+        self.keepalive_interval = keepalive_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self._nesting = 0
+        self._owns_session = False
+
+    def __enter__(self):
+        # Only open (and later close) the session if it is not already open, such that
+        # sessions opened by the caller (e.g. pooled sessions) are left open
+        if self._nesting == 0:
+            self._owns_session = not self.is_active()
+            if self._owns_session:
+                self.open_session()
+        self._nesting += 1
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._nesting -= 1
+        if self._nesting == 0 and self._owns_session:
+            self.close_session()
 
     def open_session(self):
-        """Opens an SFTP session."""
+        """
+        Opens an SFTP session, authenticated with a password or a private key (see
+        'authentication_type' argument).
+        """
         # Establish an SSH client and connect to the server
+        self.transport = paramiko.Transport((self.hostname, self.port))
         try:
-            self.transport = paramiko.Transport((self.hostname, self.port))
-            self.transport.connect(username=self.username, password=self.password)
+            if self.authentication_type == "private_key":
+                private_key = paramiko.PKey.from_path(
+                    self.private_key_dir, passphrase=self.private_key_passphrase
+                )
+                self.transport.connect(username=self.username, pkey=private_key)
+            else:
+                self.transport.connect(username=self.username, password=self.password)
+            if self.keepalive_interval > 0:
+                self.transport.set_keepalive(self.keepalive_interval)
 
             # Open an SFTP session
             self.sftp_session = paramiko.SFTPClient.from_transport(self.transport)
 
-        except Exception as e:
-            print(f"Error: {e}")
+        except Exception:
+            self.transport.close()
+            self.transport = None
+            raise
 
     def close_session(self):
         """Closes an SFTP session and transport."""
-        self.sftp_session.close()
-        self.transport.close()
+        if self.sftp_session is not None:
+            self.sftp_session.close()
+            self.sftp_session = None
+        if self.transport is not None:
+            self.transport.close()
+            self.transport = None
+
+    def is_active(self) -> bool:
+        """
+        Checks if the SFTP session is open and its transport is still connected.
+
+        Returns:
+            True if the session can be used for file transfers, false otherwise
+        """
+        if self.sftp_session is None:
+            return False
+        # Note: Sessions provided without transport (see constructor) are assumed to be usable.
+        return self.transport is None or self.transport.is_active()
+
+    def reconnect(self):
+        """Closes the current SFTP session (if any) and opens a new one."""
+        try:
+            self.close_session()
+        except Exception:
+            # The connection is already broken
+            self.sftp_session = None
+            self.transport = None
+        self.open_session()
 
     def get_file(self, remote_dir: str, local_dir: str):
         """
@@ -76,7 +166,7 @@ class Sftp:
             remote_dir: SFTP server file directory
             local_dir: Local file directory
         """
-        self.sftp_session.get(remote_dir, local_dir)
+        self._run_with_retries(lambda: self.sftp_session.get(remote_dir, local_dir))
 
     def put_file(self, local_dir: str, remote_dir: str):
         """
@@ -86,4 +176,150 @@ class Sftp:
             local_dir: Local file directory
             remote_dir: SFTP server file directory
         """
-        self.sftp_session.put(local_dir, remote_dir)
+        self._run_with_retries(lambda: self.sftp_session.put(local_dir, remote_dir))
+
+    def stat(self, remote_dir: str) -> paramiko.SFTPAttributes:
+        """
+        Gets the attributes of a file on an SFTP server (e.g. size and modification time),
+        without downloading it.
+
+        Args:
+            remote_dir: SFTP server file directory
+
+        Returns:
+            File attributes, including 'st_size' (in bytes) and 'st_mtime' (as Unix timestamp)
+        """
+        return self._run_with_retries(lambda: self.sftp_session.stat(remote_dir))
+
+    def _run_with_retries(self, transfer):
+        if not self.is_active():
+            self.reconnect()
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                return transfer()
+            except (EOFError, OSError, paramiko.SSHException):
+                # Only retry if the error was caused by a lost connection
+                if attempt >= self.max_retries or self.is_active():
+                    raise
+            time.sleep(self.retry_backoff * 2**attempt)
+            self.reconnect()
+
+
+class SftpPool:
+    """
+    A pool of long-lived, authenticated SFTP sessions, shared by multiple threads (e.g. to
+    download multiple files concurrently).
+
+    Usage example:
+        with SftpPool(max_size=4, hostname=..., port=..., username=..., password=...) as pool:
+            with pool.session() as sftp:
+                sftp.get_file(remote_dir, local_dir)
+    """
+
+    def __init__(self, max_size: int = 4, **kwargs):
+        """
+        Constructor method.
+
+        Args:
+            max_size: Maximum number of open SFTP sessions. Threads requesting a session when
+                all sessions are in use wait until a session is released.
+            **kwargs: Keyword arguments passed to the Sftp constructor (e.g. 'hostname',
+                'port', 'username', 'password')
+        """
+        self.max_size = max_size
+        self.sftp_kwargs = kwargs
+        self._idle = queue.LifoQueue()
+        self._semaphore = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self._sessions = list()
+        self._closed = False
+
+    @classmethod
+    def from_sftp(cls, sftp: Sftp, max_size: int = 4) -> "SftpPool":
+        """
+        Creates a pool of sessions with the same server and authentication settings as an
+        existing Sftp instance.
+
+        Args:
+            sftp: Instance of the Sftp class
+            max_size: Maximum number of open SFTP sessions
+
+        Returns:
+            Pool of SFTP sessions
+        """
+        return cls(
+            max_size=max_size,
+            hostname=sftp.hostname,
+            port=sftp.port,
+            username=sftp.username,
+            password=sftp.password,
+            private_key_dir=sftp.private_key_dir,
+            authentication_type=sftp.authentication_type,
+            private_key_passphrase=sftp.private_key_passphrase,
+            keepalive_interval=sftp.keepalive_interval,
+            max_retries=sftp.max_retries,
+            retry_backoff=sftp.retry_backoff,
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @contextmanager
+    def session(self) -> Iterator[Sftp]:
+        """
+        Context manager lending an SFTP session of the pool. Idle sessions are reused, and new
+        sessions are only opened if all existing sessions are in use.
+
+        Yields:
+            Instance of the Sftp class, with an open session
+
+        Raises:
+            RuntimeError: Raises an error if the pool is closed
+        """
+        self._semaphore.acquire()
+        try:
+            with self._lock:
+                if self._closed:
+                    raise RuntimeError("Cannot lend a session from a closed SFTP pool.")
+                try:
+                    sftp = self._idle.get_nowait()
+                except queue.Empty:
+                    sftp = Sftp(**self.sftp_kwargs)
+                    self._sessions.append(sftp)
+            try:
+                if not sftp.is_active():
+                    sftp.reconnect()
+                yield sftp
+            finally:
+                # Sessions released after the pool was closed are closed instead of reused.
+                # Broken sessions are reconnected when they are lent again.
+                with self._lock:
+                    closed = self._closed
+                    if not closed:
+                        self._idle.put(sftp)
+                if closed:
+                    self._close_session(sftp)
+        finally:
+            self._semaphore.release()
+
+    def close(self):
+        """
+        Closes all SFTP sessions of the pool. Idle sessions are closed immediately, and sessions
+        currently in use are closed when they are released.
+        """
+        with self._lock:
+            self._closed = True
+            sessions = list()
+            while not self._idle.empty():
+                sessions.append(self._idle.get_nowait())
+        for sftp in sessions:
+            self._close_session(sftp)
+
+    def _close_session(self, sftp: Sftp):
+        sftp.close_session()
+        with self._lock:
+            self._sessions.remove(sftp)
@@ -1 +1,2 @@
 from .dates import *
+from .timezones import *
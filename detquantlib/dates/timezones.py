@@ -0,0 +1,159 @@
+# Python built-in packages
+from functools import lru_cache
+
+# Third-party packages
+import numpy as np
+import pandas as pd
+
+
+@lru_cache(maxsize=None)
+def get_utc_offsets(timezone: str) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the UTC offsets of a timezone, i.e. the UTC dates at which the offset changes (DST
+    transitions) and the offsets applying from each of these dates.
+
+    The transitions between 1900 and 2200 are located with a precision of one second. The result
+    is cached per timezone, such that timezone conversions (see convert_timezone()) only need a
+    binary search in small arrays.
+
+    Args:
+        timezone: Timezone (e.g. "Europe/Amsterdam")
+
+    Returns:
+        Transition dates (timezone-naive UTC dates, as datetime64[s] array), and UTC offsets
+        applying from each transition date (as timedelta64[s] array). The first transition date
+        is the start of the covered period, such that the first offset applies to all earlier
+        dates.
+    """
+
+    def calc_offsets(utc_dates: np.ndarray) -> np.ndarray:
+        local_dates = (
+            pd.DatetimeIndex(utc_dates).tz_localize("UTC").tz_convert(timezone).tz_localize(None)
+        )
+        return (local_dates.to_numpy() - utc_dates).astype("timedelta64[s]")
+
+    # Find the days during which the offset changes
+    days = pd.date_range("1900-01-01", "2200-01-01", freq="D").to_numpy().astype("datetime64[s]")
+    day_offsets = calc_offsets(days)
+    idx_changes = np.flatnonzero(day_offsets[1:] != day_offsets[:-1])
+
+    # Locate the transitions within these days, with a bisection
+    lower = days[idx_changes]
+    upper = days[idx_changes + 1]
+    lower_offsets = day_offsets[idx_changes]
+    while len(lower) > 0 and (upper - lower).max() > np.timedelta64(1, "s"):
+        middle = lower + (upper - lower) // 2
+        is_before = calc_offsets(middle) == lower_offsets
+        lower = np.where(is_before, middle, lower)
+        upper = np.where(is_before, upper, middle)
+
+    transitions = np.concatenate([days[:1], upper])
+    offsets = np.concatenate([day_offsets[:1], day_offsets[idx_changes + 1]])
+
+    return transitions, offsets
+
+
+def utc_to_local(dates: np.ndarray, timezone: str) -> np.ndarray:
+    """
+    Converts timezone-naive UTC dates to timezone-naive local dates, with a single vectorized
+    pass on the underlying datetime64 array.
+
+    Args:
+        dates: Timezone-naive UTC dates (datetime64 array, in any unit)
+        timezone: Local timezone
+
+    Returns:
+        Timezone-naive local dates (datetime64 array, in the same unit as the input dates)
+    """
+    if timezone == "UTC":
+        return dates
+
+    transitions, offsets = get_utc_offsets(timezone)
+    unit = np.datetime_data(dates.dtype)[0]
+    idx = np.searchsorted(transitions.astype(dates.dtype), dates, side="right") - 1
+    local_dates = dates + offsets.astype(f"timedelta64[{unit}]")[np.maximum(idx, 0)]
+
+    return local_dates
+
+
+def convert_timezone(
+    dates: pd.Series,
+    from_timezone: str,
+    to_timezone: str = None,
+    timezone_aware: bool = False,
+) -> pd.Series:
+    """
+    Converts timezone-naive dates from one timezone to another, using the minimal number of
+    passes on the data:
+        - Dates that are not stored as datetime64 (e.g. datetime.date objects) are converted
+            once.
+        - Timezone-naive output dates in the same timezone are returned as they are.
+        - Timezone-naive output dates converted from UTC are computed with one vectorized pass
+            on the underlying datetime64 array (see utc_to_local()).
+        - Timezone-aware output dates are only localized once (UTC dates are localized without
+            DST handling, and the conversion to another timezone only changes the dtype).
+
+    Args:
+        dates: Timezone-naive dates, expressed in 'from_timezone'
+        from_timezone: Timezone of the input dates
+        to_timezone: Timezone of the output dates. If None, the dates are kept in
+            'from_timezone'.
+        timezone_aware: If true, returns timezone-aware dates. Otherwise, returns timezone-naive
+            dates.
+
+    Returns:
+        Converted dates, with the same index as the input dates
+    """
+    if to_timezone is None:
+        to_timezone = from_timezone
+
+    # Convert dates to datetime64, if needed
+    if not pd.api.types.is_datetime64_dtype(dates.dtype):
+        dates = pd.Series(pd.DatetimeIndex(dates), index=dates.index, name=dates.name)
+
+    if not timezone_aware:
+        if from_timezone == to_timezone:
+            return dates
+        elif from_timezone == "UTC":
+            local_dates = utc_to_local(dates.to_numpy(), to_timezone)
+            return pd.Series(local_dates, index=dates.index, name=dates.name)
+        else:
+            dates = dates.dt.tz_localize(from_timezone).dt.tz_convert(to_timezone)
+            return dates.dt.tz_localize(None)
+
+    dates = dates.dt.tz_localize(from_timezone)
+    if from_timezone != to_timezone:
+        dates = dates.dt.tz_convert(to_timezone)
+
+    return dates
+
+
+def convert_timezones(
+    df: pd.DataFrame,
+    columns: list,
+    from_timezone: str,
+    to_timezone: str = None,
+    timezone_aware: bool = False,
+) -> pd.DataFrame:
+    """
+    Converts multiple date columns of a dataframe from one timezone to another (see
+    convert_timezone()). Columns that are not in the dataframe are skipped.
+
+    Args:
+        df: Input dataframe, modified in place
+        columns: Names of the date columns, with timezone-naive dates expressed in
+            'from_timezone'
+        from_timezone: Timezone of the input dates
+        to_timezone: Timezone of the output dates. If None, the dates are kept in
+            'from_timezone'.
+        timezone_aware: If true, returns timezone-aware dates. Otherwise, returns timezone-naive
+            dates.
+
+    Returns:
+        Dataframe with converted date columns
+    """
+    for c in columns:
+        if c in df.columns:
+            df[c] = convert_timezone(df[c], from_timezone, to_timezone, timezone_aware)
+
+    return df
@@ -19,9 +19,10 @@ from invoke.runners import Result
 ROOT_DIR = pathlib.Path(__file__).parent
 SOURCE_DIR = ROOT_DIR.joinpath("detquantlib")
 TEST_DIR = ROOT_DIR.joinpath("tests")
+BENCHMARK_DIR = ROOT_DIR.joinpath("benchmarks")
 TASKS_DIR = ROOT_DIR.joinpath("tasks.py")
 README_DIR = ROOT_DIR.joinpath("README.md")
-PYTHON_TARGETS = [SOURCE_DIR, TEST_DIR, TASKS_DIR]  # paths containing .py files
+PYTHON_TARGETS = [SOURCE_DIR, TEST_DIR, BENCHMARK_DIR, TASKS_DIR]  # paths containing .py files
 PYTHON_TARGETS_STR = " ".join([str(p) for p in PYTHON_TARGETS])
 
 
@@ -0,0 +1,81 @@
+# Python built-in packages
+import os
+import shutil
+from pathlib import Path
+
+# Third-party packages
+import paramiko
+import pytest
+
+
+class FakeSftpServer:
+    """In-memory stand-in for an SFTP server, serving the files of a local folder."""
+
+    def __init__(self, root_dir: Path):
+        self.root_dir = root_dir
+        self.connections = list()
+        self.downloads = list()
+        self.fail_next_transfer = False
+
+    def get_path(self, remote_dir: str) -> Path:
+        return self.root_dir.joinpath(remote_dir.lstrip("/"))
+
+
+class FakeTransport:
+    server: FakeSftpServer = None
+
+    def __init__(self, address: tuple):
+        self.address = address
+        self.active = False
+        self.credentials = None
+        self.keepalive = None
+
+    def connect(self, username: str, password: str = None, pkey: paramiko.PKey = None):
+        self.active = True
+        self.credentials = dict(username=username, password=password, pkey=pkey)
+        self.server.connections.append(self)
+
+    def set_keepalive(self, interval: int):
+        self.keepalive = interval
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def close(self):
+        self.active = False
+
+
+class FakeSftpClient:
+    def __init__(self, transport: FakeTransport):
+        self.transport = transport
+
+    @classmethod
+    def from_transport(cls, transport: FakeTransport):
+        return cls(transport)
+
+    def stat(self, remote_dir: str) -> os.stat_result:
+        return os.stat(self.transport.server.get_path(remote_dir))
+
+    def get(self, remote_dir: str, local_dir: str):
+        server = self.transport.server
+        if server.fail_next_transfer:
+            # Simulate a connection dropped by the server
+            server.fail_next_transfer = False
+            self.transport.active = False
+            raise EOFError()
+        shutil.copyfile(server.get_path(remote_dir), local_dir)
+        server.downloads.append(remote_dir)
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def sftp_server(tmp_path, monkeypatch) -> FakeSftpServer:
+    # Replace the paramiko transport and SFTP client by in-memory fakes
+    server = FakeSftpServer(tmp_path.joinpath("remote"))
+    server.root_dir.mkdir()
+    monkeypatch.setattr(FakeTransport, "server", server)
+    monkeypatch.setattr(paramiko, "Transport", FakeTransport)
+    monkeypatch.setattr(paramiko, "SFTPClient", FakeSftpClient)
+    return server
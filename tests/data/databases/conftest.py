@@ -0,0 +1,30 @@
+# Python built-in packages
+import sqlite3
+from datetime import datetime
+
+# Third-party packages
+import pytest
+from sqlalchemy import Engine, create_engine
+
+# Parse SQLite columns declared as DATETIME (as created by pandas) into datetime objects
+sqlite3.register_converter("DATETIME", lambda b: datetime.fromisoformat(b.decode()))
+
+
+@pytest.fixture
+def det_db_env(monkeypatch):
+    # Mock the environment variables required by the DetDatabase class
+    for name in ["DET_DB_NAME", "DET_DB_SERVER", "DET_DB_USERNAME", "DET_DB_PASSWORD"]:
+        monkeypatch.setenv(name, "test")
+
+
+@pytest.fixture
+def sqlite_engine(tmp_path, det_db_env) -> Engine:
+    # Local SQLite database, used as a stand-in for the DET database
+    # Note: Declared types are parsed such that dates are returned as datetime objects, like
+    # with the SQL Server ODBC driver.
+    engine = create_engine(
+        f"sqlite:///{tmp_path.joinpath('test.db')}",
+        connect_args=dict(detect_types=sqlite3.PARSE_DECLTYPES),
+    )
+    yield engine
+    engine.dispose()
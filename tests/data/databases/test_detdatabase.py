@@ -0,0 +1,564 @@
+"""
+Important notes:
+- Pytest requires test modules to follow the naming convention "test_*.py"
+- Pytest requires test functions to follow the naming convention "test_*()"
+"""
+
+# Python built-in packages
+import asyncio
+import time
+from datetime import date, datetime
+from types import SimpleNamespace
+
+# Third-party packages
+import pandas as pd
+import pyarrow as pa
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import DBAPIError
+
+# Internal modules
+from detquantlib.data import AsyncDetDatabase, DetDatabase
+
+
+def test_process_day_ahead_spot_prices():
+    timezone = "Europe/Amsterdam"
+    df_in = pd.DataFrame(
+        {
+            f"DateTime({timezone})": pd.to_datetime(
+                ["2025-03-30 01:45", "2025-03-30 03:00", "2025-03-30 04:00"]
+            ),
+            "ResolutionCode": ["PT15M", "PT60M", "PT30M"],
+            "Price(Currency/MWh)": [10.0, 20.0, 30.0],
+        }
+    )
+
+    res = DetDatabase.process_day_ahead_spot_prices(df_in, "DutchPower", timezone)
+
+    expected = pd.DataFrame(
+        {
+            "CommodityName": ["DutchPower"] * 3,
+            "TradingDate": pd.to_datetime(["2025-03-29"] * 3),
+            "DeliveryStart": df_in[f"DateTime({timezone})"],
+            "DeliveryEnd": pd.to_datetime(
+                ["2025-03-30 02:00", "2025-03-30 04:00", "2025-03-30 04:30"]
+            ),
+            "Tenor": ["Spot"] * 3,
+            "Price": [10.0, 20.0, 30.0],
+        }
+    )
+    pd.testing.assert_frame_equal(res, expected)
+
+
+def test_process_day_ahead_spot_prices_unsupported_resolution():
+    timezone = "Europe/Amsterdam"
+    df_in = pd.DataFrame(
+        {
+            f"DateTime({timezone})": pd.to_datetime(["2025-01-01 00:00", "2025-01-01 01:00"]),
+            "ResolutionCode": ["PT60M", "P1D"],
+            "Price(Currency/MWh)": [10.0, 20.0],
+        }
+    )
+    with pytest.raises(ValueError, match="Resolution not supported"):
+        DetDatabase.process_day_ahead_spot_prices(df_in, "DutchPower", timezone)
+
+
+def test_process_imbalance_prices_inferred_resolution():
+    timezone = "Europe/Amsterdam"
+    dates_utc = pd.date_range("2025-10-25 23:00", periods=8, freq="30min", tz="UTC")
+    df_in = pd.DataFrame(
+        {
+            "DateTime(UTC)": dates_utc.tz_localize(None),
+            f"DateTime({timezone})": dates_utc.tz_convert(timezone),
+            "PositiveImbalancePrice": range(8),
+            "NegativeImbalancePrice": range(8),
+        }
+    )
+
+    res = DetDatabase.process_imbalance_prices(df_in, "DutchPower", timezone)
+
+    # Delivery periods are 30 minutes long, including across the DST switch
+    expected_end = (dates_utc + pd.Timedelta(minutes=30)).tz_convert(timezone)
+    pd.testing.assert_series_equal(res["DeliveryEnd"], pd.Series(expected_end, name="DeliveryEnd"))
+    assert (res["TradingDate"] == pd.Timestamp("2025-10-26", tz=timezone)).all()
+
+
+def test_process_imbalance_prices_mixed_resolution():
+    timezone = "Europe/Amsterdam"
+    # Hourly periods until 02:00, then quarter-hourly periods, with a missing quarter-hour
+    dates = pd.DatetimeIndex(
+        ["2025-01-01 00:00", "2025-01-01 01:00"]
+        + ["2025-01-01 02:00", "2025-01-01 02:15", "2025-01-01 02:45", "2025-01-01 03:00"]
+    )
+    df_in = pd.DataFrame(
+        {
+            "DateTime(UTC)": dates,
+            f"DateTime({timezone})": dates + pd.Timedelta(hours=1),
+            "PositiveImbalancePrice": range(6),
+            "NegativeImbalancePrice": range(6),
+        }
+    )
+
+    res = DetDatabase.process_imbalance_prices(df_in, "DutchPower", timezone)
+    period_lengths = res["DeliveryEnd"] - res["DeliveryStart"]
+    assert (period_lengths.dt.total_seconds() / 60).tolist() == [60, 60, 15, 15, 15, 15]
+
+    # Resolution codes are used when available
+    df_in["ResolutionCode"] = ["PT60M", "PT60M", "PT15M", "PT30M", "PT15M", "PT15M"]
+    res = DetDatabase.process_imbalance_prices(df_in, "DutchPower", timezone)
+    period_lengths = res["DeliveryEnd"] - res["DeliveryStart"]
+    assert (period_lengths.dt.total_seconds() / 60).tolist() == [60, 60, 15, 30, 15, 15]
+
+
+def test_process_imbalance_prices_explicit_resolution():
+    timezone = "Europe/Amsterdam"
+    df_in = pd.DataFrame(
+        {
+            f"DateTime({timezone})": pd.to_datetime(["2025-01-01 00:00"]),
+            "PositiveImbalancePrice": [1.0],
+            "NegativeImbalancePrice": [2.0],
+        }
+    )
+
+    # The resolution of a single delivery period cannot be inferred
+    with pytest.raises(ValueError, match="cannot be inferred"):
+        DetDatabase.process_imbalance_prices(df_in, "DutchPower", timezone)
+
+    res = DetDatabase.process_imbalance_prices(df_in, "DutchPower", timezone, "PT60M")
+    assert res.loc[0, "DeliveryEnd"] == pd.Timestamp("2025-01-01 01:00")
+
+    with pytest.raises(ValueError, match="not supported"):
+        DetDatabase.process_imbalance_prices(df_in, "DutchPower", timezone, "P1D")
+
+
+def test_iterate_chunks(sqlite_engine):
+    df_all = pd.DataFrame({"Date": pd.date_range("2025-01-01", periods=25, freq="h")})
+    df_all["Value"] = range(25)
+    df_all.sample(frac=1, random_state=0).to_sql("data", sqlite_engine, index=False)
+    db = DetDatabase(engine=sqlite_engine)
+
+    chunks = db.iterate_chunks(
+        query="SELECT * FROM data WHERE Value>=5",
+        table="data",
+        chunksize=8,
+        order_by=["Date"],
+        format_chunk=lambda df: df.assign(Date=pd.to_datetime(df["Date"])),
+        empty_error_message="No data.",
+    )
+    chunks = list(chunks)
+
+    # Chunks are bounded in size and sorted with respect to each other
+    assert [c.shape[0] for c in chunks] == [8, 8, 4]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), df_all.iloc[5:].reset_index(drop=True)
+    )
+
+    chunks = db.iterate_chunks(
+        "SELECT * FROM data WHERE Value>100", "data", 8, ["Date"], lambda df: df, "No data."
+    )
+    with pytest.raises(ValueError, match="No data."):
+        list(chunks)
+
+
+def test_query_db_arrow_backend(sqlite_engine):
+    df_in = pd.DataFrame(
+        {"Tenor": ["Month", "Quarter", None], "Price": [1.5, 2.5, 3.5], "Id": [1, 2, 3]}
+    )
+    df_in.to_sql("data", sqlite_engine, index=False)
+    db = DetDatabase(engine=sqlite_engine, fetch_backend="arrow")
+
+    res = db.query_db("SELECT * FROM data")
+    assert res["Tenor"].dtype == pd.ArrowDtype(pa.string())
+    assert res["Tenor"].isna().tolist() == [False, False, True]
+    pd.testing.assert_frame_equal(res.drop(columns="Tenor"), df_in.drop(columns="Tenor"))
+
+    res = db.query_db("SELECT * FROM data WHERE Id>3")
+    assert res.empty
+    assert res.columns.tolist() == ["Tenor", "Price", "Id"]
+
+    with pytest.raises(ValueError, match="fetch_backend"):
+        DetDatabase(engine=sqlite_engine, fetch_backend="polars")
+
+
+def test_arrow_table_to_pandas():
+    table = pa.table(
+        {
+            "TradingDate": pa.array([date(2025, 1, 1)], type=pa.date32()),
+            "InsertionTimestamp": pa.array([datetime(2025, 1, 1, 18)], type=pa.timestamp("us")),
+        }
+    )
+    res = DetDatabase.arrow_table_to_pandas(table)
+    assert res["TradingDate"].dtype == "datetime64[ns]"
+    assert res["InsertionTimestamp"].dtype == "datetime64[ns]"
+
+
+def test_load_entsoe_day_ahead_spot_prices_multiple_commodities(sqlite_engine, monkeypatch):
+    monkeypatch.setenv("DET_DB_TABLE_COMMODITY", "commodity")
+    monkeypatch.setenv("DET_DB_TABLE_ENTSOE_DA", "entsoe_da")
+    commodities = pd.DataFrame(
+        {
+            "Name": ["DutchPower", "GreatBritainPower"],
+            "Timezone": ["Europe/Amsterdam", "Europe/London"],
+            "EntsoeMapCode": ["NL", "GB"],
+        }
+    )
+    commodities.to_sql("commodity", sqlite_engine, index=False)
+    dfs = list()
+    for map_code in ["NL", "GB", "BE"]:
+        dates = pd.date_range("2025-03-25", "2025-04-05", freq="h", inclusive="left")
+        df = pd.DataFrame({"DateTime(UTC)": dates, "ResolutionCode": "PT60M"})
+        df["MapCode"] = map_code
+        df["Price(Currency/MWh)"] = range(len(dates))
+        df["Currency"] = "EUR"
+        dfs.append(df)
+    pd.concat(dfs).to_sql("entsoe_da", sqlite_engine, index=False)
+
+    db = DetDatabase(engine=sqlite_engine)
+    names = ["DutchPower", "GreatBritainPower"]
+    kwargs = dict(start_trading_date=datetime(2025, 3, 28), end_trading_date=datetime(2025, 4, 1))
+
+    queries = list()
+    query_db = db.query_db
+    monkeypatch.setattr(
+        db, "query_db", lambda q, t=None, p=None: queries.append(q) or query_db(q, t, p)
+    )
+    res_dict = db.load_entsoe_day_ahead_spot_prices(names, output_format="dict", **kwargs)
+    res_frame = db.load_entsoe_day_ahead_spot_prices(names, **kwargs)
+
+    # One metadata query and one price query per call
+    assert len(queries) == 4
+
+    # Each commodity is processed in its own timezone, as with single-commodity loads
+    for name in names:
+        expected = db.load_entsoe_day_ahead_spot_prices(name, **kwargs)
+        pd.testing.assert_frame_equal(res_dict[name], expected)
+    pd.testing.assert_frame_equal(
+        res_frame, pd.concat([res_dict[n] for n in names], ignore_index=True)
+    )
+
+
+def test_get_commodity_info_cached_metadata(sqlite_engine, monkeypatch):
+    monkeypatch.setenv("DET_DB_TABLE_COMMODITY", "commodity")
+    commodities = pd.DataFrame(
+        {"Name": ["DutchPower", "GermanPower"], "Timezone": ["Europe/Amsterdam", "Europe/Berlin"]}
+    )
+    commodities.to_sql("commodity", sqlite_engine, index=False)
+
+    db = DetDatabase(engine=sqlite_engine, cache_metadata=True)
+    queries = list()
+    query_db = db.query_db
+    monkeypatch.setattr(
+        db, "query_db", lambda q, t=None, p=None: queries.append(q) or query_db(q, t, p)
+    )
+
+    for _ in range(3):
+        info = db.get_commodity_info("Name", "DutchPower", ["Timezone"])
+        assert info == dict(Timezone="Europe/Amsterdam")
+    info = db.get_commodities_info("Name", ["DutchPower", "germanpower"], ["Timezone"])
+    assert info["germanpower"]["Timezone"] == "Europe/Berlin"
+
+    # Not-found errors are raised from the cached table, without querying the database again
+    with pytest.raises(ValueError, match="Available values: 'DutchPower', 'GermanPower'"):
+        db.get_commodity_info("Name", "FrenchPower", ["Timezone"])
+    assert len(queries) == 1
+
+    # Explicit refresh reloads the table
+    pd.DataFrame({"Name": ["FrenchPower"], "Timezone": ["Europe/Paris"]}).to_sql(
+        "commodity", sqlite_engine, index=False, if_exists="append"
+    )
+    db.refresh_metadata()
+    assert db.get_commodity_info("Name", "FrenchPower", ["Timezone"])["Timezone"] == "Europe/Paris"
+
+
+def test_load_many(sqlite_engine, monkeypatch):
+    monkeypatch.setenv("DET_DB_TABLE_COMMODITY", "commodity")
+    monkeypatch.setenv("DET_DB_TABLE_INSTRUMENT", "missing_table")
+    commodities = pd.DataFrame({"Name": ["DutchPower", "GermanPower"], "Id": [1, 2]})
+    commodities.to_sql("commodity", sqlite_engine, index=False)
+
+    db = DetDatabase(engine=sqlite_engine)
+    results = db.load_many(
+        [
+            ("load_commodities", dict(columns=["Name"])),
+            ("load_instruments", dict(identifiers=[1])),
+            ("load_commodities", dict(columns=["Id"], conditions="WHERE Id=2")),
+        ],
+        max_workers=2,
+    )
+
+    # Results are returned in request order, and failed calls return their exception
+    assert results[0]["Name"].tolist() == ["DutchPower", "GermanPower"]
+    assert isinstance(results[1], Exception)
+    assert results[2]["Id"].tolist() == [2]
+
+    with pytest.raises(ValueError, match="Invalid input method name 'query_db'"):
+        db.load_many([("query_db", dict(query="SELECT 1"))])
+
+
+def test_load_many_timeout(sqlite_engine, monkeypatch):
+    db = DetDatabase(engine=sqlite_engine)
+    monkeypatch.setattr(db, "load_commodities", lambda delay: time.sleep(delay) or delay)
+
+    # The timeout is a single deadline for the whole batch, not a limit per call
+    calls = [("load_commodities", dict(delay=0.2))] * 3
+    start = time.perf_counter()
+    results = db.load_many(calls, max_workers=1, timeout=0.3)
+    assert time.perf_counter() - start < 0.4
+    assert results[0] == 0.2
+    assert isinstance(results[1], TimeoutError)
+    assert isinstance(results[2], TimeoutError)
+
+
+def test_query_db_retry_on_disconnect(sqlite_engine, monkeypatch):
+    db = DetDatabase(engine=sqlite_engine, retry_backoff=0)
+    read_sql_query = pd.read_sql_query
+    errors = [
+        DBAPIError(
+            "SELECT 1 AS x", None, Exception("Connection lost"), connection_invalidated=True
+        )
+    ]
+
+    def flaky_read_sql_query(*args, **kwargs):
+        if len(errors) > 0:
+            raise errors.pop()
+        return read_sql_query(*args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_sql_query", flaky_read_sql_query)
+
+    # Lost connections are retried
+    df = db.query_db("SELECT 1 AS x")
+    assert df["x"].tolist() == [1]
+    stats = db.get_connection_stats()
+    assert stats["retries"] == 1
+    assert stats["acquisitions"] == 2
+
+    # Other errors are raised immediately, and do not dispose of the connection pool
+    with pytest.raises(Exception, match="no such table"):
+        db.query_db("SELECT * FROM missing_table")
+    assert db.get_connection_stats()["retries"] == 1
+
+
+def test_add_table_bulk(sqlite_engine, capsys):
+    db = DetDatabase(engine=sqlite_engine)
+    df = pd.DataFrame({"Id": range(10), "Price": [float(x) for x in range(10)]})
+
+    n = db.add_table(df, "results", "main", chunksize=3, method="multi", verbose=True)
+    assert n == 10
+    assert capsys.readouterr().out.count("rows/s") == 4
+    pd.testing.assert_frame_equal(db.query_db("SELECT * FROM results"), df)
+
+    with pytest.raises(ValueError, match="already exists"):
+        db.add_table(df, "results", "main")
+
+    db.add_table(df, "results", "main", if_exists="append")
+    assert len(db.query_db("SELECT * FROM results")) == 20
+    db.add_table(df.iloc[:2], "results", "main", if_exists="replace")
+    assert len(db.query_db("SELECT * FROM results")) == 2
+
+    with pytest.raises(ValueError, match="Invalid input 'if_exists' value 'update'"):
+        db.add_table(df, "results", "main", if_exists="update")
+
+
+@pytest.mark.parametrize(
+    "db_fast_executemany, fast_executemany, expected",
+    [(False, None, False), (True, None, True), (True, False, False), (False, True, True)],
+)
+def test_add_table_fast_executemany(
+    sqlite_engine, monkeypatch, db_fast_executemany, fast_executemany, expected
+):
+    # Capture the listener setting the pyodbc 'fast_executemany' mode of the cursors
+    listeners = list()
+    monkeypatch.setattr(sqlite_engine.dialect, "driver", "pyodbc")
+    monkeypatch.setattr(event, "listen", lambda target, name, fn: listeners.append(fn))
+    monkeypatch.setattr(event, "remove", lambda target, name, fn: None)
+
+    # The class setting is used, unless explicitly overridden
+    db = DetDatabase(engine=sqlite_engine, fast_executemany=db_fast_executemany)
+    df = pd.DataFrame({"Id": range(3)})
+    db.add_table(df, "results", "main", fast_executemany=fast_executemany)
+    cursor = SimpleNamespace()
+    listeners[0](None, cursor, None, None, None, True)
+    assert cursor.fast_executemany == expected
+
+
+@pytest.mark.parametrize("fetch_backend", ["pandas", "arrow"])
+def test_load_instruments_batched_parameters(sqlite_engine, monkeypatch, fetch_backend):
+    monkeypatch.setenv("DET_DB_TABLE_INSTRUMENT", "instrument")
+    df = pd.DataFrame({"id": [str(i) for i in range(5000)], "Name": "Instrument"})
+    df.loc[0, "Name"] = "O'Brien"
+    df.to_sql("instrument", sqlite_engine, index=False)
+
+    db = DetDatabase(engine=sqlite_engine, fetch_backend=fetch_backend)
+    queries = list()
+    query_db = db.query_db
+    monkeypatch.setattr(
+        db, "query_db", lambda q, t=None, p=None: queries.append(q) or query_db(q, t, p)
+    )
+
+    # Long identifier lists are split into batches of bound parameters
+    res = db.load_instruments(list(range(4500)))
+    assert res["id"].tolist() == [str(i) for i in range(4500)]
+    assert len(queries) == 3
+    query = "SELECT [id], [Name] FROM instrument WHERE [id] IN :identifiers"
+    assert all(q == query for q in queries)
+
+    # Values are never pasted into the SQL text
+    res = query_db("SELECT * FROM instrument WHERE Name=:name", params=dict(name="O'Brien"))
+    assert res["id"].tolist() == ["0"]
+
+
+def test_apply_schema_integers():
+    df = pd.DataFrame(
+        {"ClientId": [1, 2], "Position": [1.0, None], "Price": [1.5, 2.5], "Name": ["a", "b"]}
+    )
+    res = DetDatabase.apply_schema(df, {"ClientId": "int32", "Position": "int32"})
+
+    # Integer columns with missing values are downcast to float32 instead of int32
+    assert res.dtypes.astype(str).to_dict() == dict(
+        ClientId="int32", Position="float32", Price="float32", Name="object"
+    )
+
+
+def test_load_entsoe_day_ahead_spot_prices_downcast(sqlite_engine, monkeypatch):
+    monkeypatch.setenv("DET_DB_TABLE_COMMODITY", "commodity")
+    monkeypatch.setenv("DET_DB_TABLE_ENTSOE_DA", "entsoe_da")
+    commodities = pd.DataFrame(
+        {"Name": ["DutchPower"], "Timezone": ["Europe/Amsterdam"], "EntsoeMapCode": ["NL"]}
+    )
+    commodities.to_sql("commodity", sqlite_engine, index=False)
+    dates = pd.date_range("2025-03-25", "2025-04-05", freq="h", inclusive="left")
+    df = pd.DataFrame({"DateTime(UTC)": dates, "ResolutionCode": "PT60M", "MapCode": "NL"})
+    df["Price(Currency/MWh)"] = [x / 4 for x in range(len(dates))]
+    df["Currency"] = "EUR"
+    df["Comment"] = "Not queried by default"
+    df.to_sql("entsoe_da", sqlite_engine, index=False)
+
+    kwargs = dict(
+        commodity_name="DutchPower",
+        start_trading_date=datetime(2025, 3, 28),
+        end_trading_date=datetime(2025, 4, 1),
+        process_data=False,
+    )
+    db = DetDatabase(engine=sqlite_engine)
+    db_downcast = DetDatabase(engine=sqlite_engine, downcast=True)
+    res = db.load_entsoe_day_ahead_spot_prices(**kwargs)
+    res_downcast = db_downcast.load_entsoe_day_ahead_spot_prices(**kwargs)
+
+    # Only the default columns are queried, and downcast to the table schema
+    assert "Comment" not in res_downcast.columns
+    assert res_downcast["Price(Currency/MWh)"].dtype == "float32"
+    assert res_downcast["MapCode"].dtype == "category"
+    pd.testing.assert_frame_equal(res_downcast, res, check_dtype=False, check_categorical=False)
+    stats = db_downcast.get_transfer_stats()
+    assert stats["bytes_stored"] < stats["bytes_fetched"]
+
+    # Processed data is the same with and without downcasting
+    kwargs["process_data"] = True
+    res = db.load_entsoe_day_ahead_spot_prices(**kwargs)
+    res_downcast = db_downcast.load_entsoe_day_ahead_spot_prices(**kwargs)
+    pd.testing.assert_frame_equal(res_downcast, res, check_dtype=False, check_categorical=False)
+
+    # Default columns can be overridden with environment variables
+    monkeypatch.setenv("DET_DB_COLUMNS_ENTSOE_DA", "DateTime(UTC), Comment")
+    assert DetDatabase.get_default_columns("entsoe_day_ahead_spot_price") == [
+        "DateTime(UTC)",
+        "Comment",
+    ]
+
+
+def test_async_detdatabase(sqlite_engine, monkeypatch):
+    monkeypatch.setenv("DET_DB_TABLE_COMMODITY", "commodity")
+    commodities = pd.DataFrame({"Name": ["DutchPower", "GermanPower"], "Id": [1, 2]})
+    commodities.to_sql("commodity", sqlite_engine, index=False)
+    db = DetDatabase(engine=sqlite_engine)
+
+    async def main():
+        async with AsyncDetDatabase(db=db, max_concurrency=2) as async_db:
+            res = await asyncio.gather(
+                async_db.load_commodities(columns=["Name"]),
+                async_db.get_commodity_info("Name", "GermanPower", ["Id"]),
+            )
+            res_gather = await async_db.gather(
+                [
+                    ("load_commodities", dict(columns=["Id"])),
+                    ("query_db", dict(query="bad")),
+                    ("close", dict()),
+                ]
+            )
+            with pytest.raises(ValueError, match="Invalid input 'method_name' value 'engine'"):
+                await async_db.run("engine")
+        return res, res_gather
+
+    (df, info), res_gather = asyncio.run(main())
+
+    # Results match the synchronous class
+    pd.testing.assert_frame_equal(df, db.load_commodities(columns=["Name"]))
+    assert info == dict(Id=2)
+    assert res_gather[0]["Id"].tolist() == [1, 2]
+    assert isinstance(res_gather[1], Exception)
+
+    # Only the loader methods (and AsyncDetDatabase.METHODS) can be run
+    assert isinstance(res_gather[2], ValueError)
+    assert "load_commodities" in AsyncDetDatabase.get_method_names()
+    assert "close" not in AsyncDetDatabase.get_method_names()
+
+
+def test_async_detdatabase_close(sqlite_engine, monkeypatch):
+    db = DetDatabase(engine=sqlite_engine)
+    monkeypatch.setattr(db, "load_commodities", lambda: time.sleep(0.3))
+
+    async def main():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        async with AsyncDetDatabase(db=db) as async_db:
+            call = asyncio.create_task(async_db.load_commodities())
+            await asyncio.sleep(0.05)
+            ticks = 0
+        ticker.cancel()
+        await call
+        return ticks
+
+    # The event loop keeps running while waiting for the running calls on exit
+    assert asyncio.run(main()) > 5
+
+
+@pytest.mark.parametrize("cache_metadata", [True, False])
+def test_get_commodity_info_case_insensitive(sqlite_engine, monkeypatch, cache_metadata):
+    monkeypatch.setenv("DET_DB_TABLE_COMMODITY", "commodity")
+    commodities = pd.DataFrame(
+        {"Name": ["DutchPower ", "GermanPower"], "Timezone": ["Europe/Amsterdam", "Europe/Berlin"]}
+    )
+    commodities.to_sql("commodity", sqlite_engine, index=False)
+
+    db = DetDatabase(engine=sqlite_engine, cache_metadata=cache_metadata)
+    queries = list()
+    query_db = db.query_db
+    monkeypatch.setattr(
+        db, "query_db", lambda q, t=None, p=None: queries.append((q, p)) or query_db(q, t, p)
+    )
+    if cache_metadata:
+        # Cached metadata is matched like with the (case-insensitive) database collation
+        info = db.get_commodity_info("Name", "dutchpower", ["Timezone"])
+        assert info == dict(Timezone="Europe/Amsterdam")
+        info = db.get_commodities_info("Name", ["DUTCHPOWER", "germanpower "], ["Timezone"])
+        assert info["DUTCHPOWER"] == dict(Timezone="Europe/Amsterdam")
+        assert info["germanpower "] == dict(Timezone="Europe/Berlin")
+    else:
+        # Queried metadata is filtered on the raw column (indexable), with the raw values
+        # Note: Unlike SQL Server, sqlite compares strings case-sensitively.
+        info = db.get_commodities_info("Name", ["GermanPower", "GermanPower"], ["Timezone"])
+        assert info["GermanPower"] == dict(Timezone="Europe/Berlin")
+        query, params = queries[-1]
+        assert query.endswith("WHERE [Name] IN :filter_values")
+        assert params == dict(filter_values=["GermanPower"])
+
+    # Cached and queried metadata report missing values in the same way
+    with pytest.raises(ValueError, match="Available values: 'DutchPower ', 'GermanPower'"):
+        db.get_commodity_info("Name", "FrenchPower", ["Timezone"])
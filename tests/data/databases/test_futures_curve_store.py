@@ -0,0 +1,88 @@
+"""
+Important notes:
+- Pytest requires test modules to follow the naming convention "test_*.py"
+- Pytest requires test functions to follow the naming convention "test_*()"
+"""
+
+# Python built-in packages
+from datetime import datetime
+
+# Third-party packages
+import pandas as pd
+import pytest
+
+# Internal modules
+from detquantlib.data import FuturesCurveStore, LocalDatabase
+
+
+def test_futures_curve_store():
+    df = pd.DataFrame(
+        {
+            "TradingDate": pd.to_datetime(
+                ["2024-01-03", "2024-01-02", "2024-01-03", "2024-01-02"]
+            ),
+            "DeliveryStart": pd.to_datetime(
+                ["2024-03-01", "2024-03-01", "2024-02-01", "2024-02-01"]
+            ),
+            "DeliveryEnd": pd.to_datetime(
+                ["2024-04-01", "2024-04-01", "2024-03-01", "2024-03-01"]
+            ),
+            "SettlementPrice": [4.0, 2.0, 3.0, 1.0],
+        }
+    )
+    store = FuturesCurveStore(df)
+    assert len(store) == 2
+    assert datetime(2024, 1, 2) in store
+
+    # Curves are sorted by delivery period
+    df_curve = store.get_curve(datetime(2024, 1, 3))
+    assert df_curve["SettlementPrice"].tolist() == [3.0, 4.0]
+    arrays = store.get_arrays(datetime(2024, 1, 2))
+    assert arrays["SettlementPrice"].tolist() == [1.0, 2.0]
+
+    # As-of lookup returns the last available curve
+    df_curve = store.get_curve(datetime(2024, 1, 6), as_of=True)
+    assert (df_curve["TradingDate"] == pd.Timestamp(2024, 1, 3)).all()
+    with pytest.raises(KeyError):
+        store.get_curve(datetime(2024, 1, 6))
+    with pytest.raises(KeyError):
+        store.get_curve(datetime(2024, 1, 1), as_of=True)
+
+    # Iteration returns the curves in chronological order
+    trading_dates = [d for d, _ in store]
+    assert trading_dates == [pd.Timestamp(2024, 1, 2), pd.Timestamp(2024, 1, 3)]
+    prices = [a["SettlementPrice"].tolist() for _, a in store.iterate_arrays()]
+    assert prices == [[1.0, 2.0], [3.0, 4.0]]
+
+
+def test_futures_curve_store_from_database(tmp_path):
+    local_db = LocalDatabase(tmp_path.joinpath("det.db"))
+    local_db.seed(nr_rows=5_000)
+    db = local_db.create_det_database()
+    start, end = datetime(2000, 1, 10), datetime(2000, 1, 20)
+
+    store = FuturesCurveStore.from_database(db, "DutchPower", start, end, ["Month"], "Base")
+    df = db.load_futures_eod_settlement_prices("DutchPower", start, end, ["Month"], "Base")
+    assert len(store) == 11
+    for trading_date, df_curve in store:
+        df_expected = df.loc[df["TradingDate"] == trading_date, :]
+        pd.testing.assert_frame_equal(df_curve, df_expected)
+    local_db.engine.dispose()
+
+
+def test_futures_curve_store_timezone_aware():
+    trading_dates = pd.to_datetime(["2024-03-29", "2024-04-01"]).tz_localize("Europe/Amsterdam")
+    df = pd.DataFrame({"TradingDate": trading_dates, "SettlementPrice": [1.0, 2.0]})
+    store = FuturesCurveStore(df)
+
+    # Timezone-naive dates are interpreted as local dates, and other timezones are converted
+    assert datetime(2024, 4, 1) in store
+    assert pd.Timestamp("2024-03-31 22:00", tz="UTC") in store
+    assert store.get_trading_date(datetime(2024, 3, 31), as_of=True) == trading_dates[0]
+    arrays = store.get_arrays(pd.Timestamp("2024-04-01", tz="UTC"), as_of=True)
+    assert arrays["SettlementPrice"].tolist() == [2.0]
+
+    # Timezone-aware dates are rejected by stores with timezone-naive dates
+    store_naive = FuturesCurveStore(df.assign(TradingDate=trading_dates.tz_localize(None)))
+    with pytest.raises(ValueError, match="should be timezone-naive"):
+        store_naive.get_curve(trading_dates[0])
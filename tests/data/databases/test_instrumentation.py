@@ -0,0 +1,76 @@
+"""
+Important notes:
+- Pytest requires test modules to follow the naming convention "test_*.py"
+- Pytest requires test functions to follow the naming convention "test_*()"
+"""
+
+# Python built-in packages
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-party packages
+import pandas as pd
+import pytest
+
+# Internal modules
+from detquantlib.data import DetDatabase, QueryRecorder
+
+
+@pytest.mark.parametrize("fetch_backend", ["pandas", "arrow"])
+def test_query_recorder(sqlite_engine, monkeypatch, caplog, fetch_backend):
+    monkeypatch.setenv("DET_DB_TABLE_COMMODITY", "commodity")
+    commodities = pd.DataFrame({"Name": ["DutchPower", "GermanPower"], "Id": [1, 2]})
+    commodities.to_sql("commodity", sqlite_engine, index=False)
+
+    callback_records = list()
+    recorder = QueryRecorder(callback=callback_records.append, slow_call_threshold=0)
+    db = DetDatabase(engine=sqlite_engine, fetch_backend=fetch_backend, recorder=recorder)
+    with caplog.at_level(logging.WARNING):
+        db.get_commodity_info("Name", "GermanPower", ["Id"])
+        db.load_commodities(columns=["Name"])
+        with pytest.raises(Exception):
+            db.query_db("SELECT * FROM missing_table")
+
+    # One record per top-level call (nested calls are included in the outer record)
+    records = recorder.get_records()
+    assert callback_records == records
+    assert [r["name"] for r in records] == ["get_commodity_info", "load_commodities", "query_db"]
+    assert records[0]["tables"] == ["commodity"]
+    assert len(records[0]["queries"]) == 1
+    assert records[1]["rows"] == 2
+    assert records[1]["bytes"] > 0
+    assert records[1]["execute"] > 0
+    for r in records:
+        assert r["execute"] + r["fetch"] + r["processing"] == pytest.approx(r["total"])
+    assert records[2]["error"] is not None
+
+    # Slow calls are logged
+    assert len(caplog.records) == 3
+    assert "Slow call load_commodities" in caplog.records[1].getMessage()
+
+    summary = recorder.get_summary()
+    assert summary.loc["load_commodities", "calls"] == 1
+    assert summary.loc["query_db", "errors"] == 1
+
+
+def test_query_recorder_worker_threads():
+    recorder = QueryRecorder()
+
+    def run_queries(record: dict):
+        execute_start = recorder.get_thread_execute_time()
+        with recorder.attach(record):
+            for _ in range(1000):
+                recorder.add_execute_time(0.001)
+                recorder.add_query("SELECT 1", "data", 0.002, 1, 8)
+        return recorder.get_thread_execute_time() - execute_start
+
+    # Worker threads attached to the same record update it without losing updates, and only
+    # measure their own execution time
+    with recorder.track("load_data") as record:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            thread_times = list(executor.map(run_queries, [record] * 8))
+    assert record["execute"] == pytest.approx(8.0)
+    assert record["fetch"] == pytest.approx(16.0)
+    assert (record["rows"], record["bytes"]) == (8000, 64000)
+    assert len(record["queries"]) == 8000
+    assert thread_times == pytest.approx([1.0] * 8)
@@ -0,0 +1,275 @@
+"""
+Important notes:
+- Pytest requires test modules to follow the naming convention "test_*.py"
+- Pytest requires test functions to follow the naming convention "test_*()"
+"""
+
+# Python built-in packages
+from datetime import datetime
+
+# Third-party packages
+import pandas as pd
+import pytest
+
+# Internal modules
+from detquantlib.data import DetDatabase, LocalDatabase, QueryRecorder
+
+
+@pytest.fixture(scope="module")
+def local_db(tmp_path_factory) -> LocalDatabase:
+    local_db = LocalDatabase(tmp_path_factory.mktemp("local").joinpath("det.db"))
+    local_db.seed(nr_rows=30_000)
+    yield local_db
+    local_db.engine.dispose()
+
+
+def test_local_database_loaders(local_db, monkeypatch):
+    # The local database does not need the DET_DB_* environment variables
+    for name in ["DET_DB_NAME", "DET_DB_SERVER", "DET_DB_USERNAME", "DET_DB_PASSWORD"]:
+        monkeypatch.delenv(name, raising=False)
+    db = local_db.create_det_database()
+    start, end = datetime(2000, 1, 10), datetime(2000, 1, 20)
+
+    df = db.load_entsoe_day_ahead_spot_prices("DutchPower", start, end)
+    assert df.shape[0] == 11 * 96
+    df = db.load_entsoe_imbalance_prices("GermanPower", start, end)
+    assert df.shape[0] == 11 * 96
+    df = db.load_futures_eod_settlement_prices("DutchPower", start, end, ["Month"], "Base")
+    assert df.shape[0] == 11 * 12
+    df = db.load_eex_eod_prices("Q0BM", start, end)
+    assert df.shape[0] == 11 * 12
+    df = db.load_account_positions(start, end)
+    assert df.shape[0] == 11 * 1000
+    df = db.load_instruments(list(range(10)))
+    assert df.shape[0] == 10
+    delivery_date = datetime(2000, 1, 12)
+    df = db.load_forecast_customer_volume(
+        "Portfolio", start, delivery_date, delivery_date, "Europe/Amsterdam"
+    )
+    assert df.shape[0] == 96
+    df = db.load_customer_day_ahead_auction_bids(1, start, end, "Europe/Amsterdam")
+    assert df.shape[0] == 11 * 96
+    assert db.get_client_info("Name", "ClientB", ["ClientId"]) == dict(ClientId=2)
+
+
+def test_sql_pushdown(local_db, monkeypatch):
+    start, end = datetime(2000, 1, 10), datetime(2000, 1, 20)
+    db = local_db.create_det_database()
+    recorder = QueryRecorder()
+    db_pushdown = local_db.create_det_database(sql_pushdown=True, recorder=recorder)
+
+    # Server-side sorting returns the same data as client-side sorting
+    # Note: Rows with equal sorting keys can be returned in any order.
+    calls = [
+        ("load_entsoe_day_ahead_spot_prices", ("DutchPower", start, end), "DeliveryStart"),
+        ("load_entsoe_imbalance_prices", ("GermanPower", start, end), "DeliveryStart"),
+        (
+            "load_futures_eod_settlement_prices",
+            ("DutchPower", start, end, ["Month"], "Base"),
+            "TradingDate",
+        ),
+        ("load_eex_eod_prices", ("Q0BM", start, end), "TradingDate"),
+        ("load_account_positions", (start, end), "InsertionTimestamp"),
+        (
+            "load_customer_day_ahead_auction_bids",
+            (1, start, end, "Europe/Amsterdam"),
+            "InsertionTimestamp",
+        ),
+    ]
+    for method_name, args, sort_column in calls:
+        df_expected = getattr(db, method_name)(*args)
+        df = getattr(db_pushdown, method_name)(*args)
+        assert df[sort_column].is_monotonic_increasing
+        pd.testing.assert_frame_equal(
+            df.sort_values(list(df.columns), ignore_index=True),
+            df_expected.sort_values(list(df.columns), ignore_index=True),
+        )
+    for record in recorder.get_records():
+        assert all(" ORDER BY " in q for q in record["queries"] if "FROM [META]" not in q)
+
+    # Local dates are only derived by SQL Server databases, for known timezones
+    assert db_pushdown.get_local_time_expression("DateTime(UTC)", "Europe/Amsterdam", "x") is None
+    monkeypatch.setattr(db_pushdown.engine.dialect, "name", "mssql")
+    assert db_pushdown.get_local_time_expression("DateTime(UTC)", "Asia/Tokyo", "x") is None
+    expression = db_pushdown.get_local_time_expression(
+        "DateTime(UTC)", "Europe/Amsterdam", "DateTime(Europe/Amsterdam)"
+    )
+    assert expression == (
+        "CAST(CAST([DateTime(UTC)] AS datetime2) AT TIME ZONE 'UTC' "
+        "AT TIME ZONE 'W. Europe Standard Time' AS datetime2) AS [DateTime(Europe/Amsterdam)]"
+    )
+
+    # Local dates derived by the server are kept as they are
+    df_raw = pd.DataFrame(
+        {
+            "Price(Currency/MWh)": [1.0, 2.0],
+            "DateTime(UTC)": pd.to_datetime(["2024-10-27 00:00", "2024-10-27 01:00"]),
+            "DateTime(Europe/Amsterdam)": pd.to_datetime(["2024-10-27 02:00", "2024-10-27 02:00"]),
+        }
+    )
+    df = DetDatabase._format_entsoe_day_ahead_spot_prices(
+        df_raw.copy(), "DutchPower", "Europe/Amsterdam", False, False, presorted=True
+    )
+    assert list(df.columns) == [
+        "Price(Currency/MWh)",
+        "DateTime(UTC)",
+        "DateTime(Europe/Amsterdam)",
+    ]
+    pd.testing.assert_series_equal(
+        df["DateTime(Europe/Amsterdam)"], df_raw["DateTime(Europe/Amsterdam)"]
+    )
+
+
+@pytest.mark.parametrize("sql_pushdown", [False, True])
+def test_partitioned_fetch(local_db, sql_pushdown):
+    start, end = datetime(2000, 1, 10), datetime(2000, 3, 20)
+    db = local_db.create_det_database(sql_pushdown=sql_pushdown)
+    recorder = QueryRecorder()
+    db_partitioned = local_db.create_det_database(
+        sql_pushdown=sql_pushdown,
+        partition_frequency="W-MON",
+        partition_workers=3,
+        recorder=recorder,
+    )
+
+    # Partitioned queries return the same data as a single query
+    calls = [
+        ("load_entsoe_imbalance_prices", ("GermanPower", start, end)),
+        ("load_futures_eod_settlement_prices", ("DutchPower", start, end, ["Month"], "Base")),
+        ("load_customer_day_ahead_auction_bids", (1, start, end, "Europe/Amsterdam")),
+    ]
+    for method_name, args in calls:
+        df_expected = getattr(db, method_name)(*args)
+        df = getattr(db_partitioned, method_name)(*args)
+        pd.testing.assert_frame_equal(df, df_expected)
+
+    # The queries of all partitions are recorded
+    records = recorder.get_records()
+    assert [len(r["queries"]) for r in records] == [12, 11, 11]
+    assert records[2]["rows"] == df.shape[0]
+
+
+def test_split_date_range():
+    partitions = DetDatabase.split_date_range(datetime(2024, 1, 15), datetime(2024, 3, 1), "MS")
+    assert partitions == [
+        (pd.Timestamp(2024, 1, 15), pd.Timestamp(2024, 2, 1)),
+        (pd.Timestamp(2024, 2, 1), pd.Timestamp(2024, 3, 1)),
+    ]
+    partitions = DetDatabase.split_date_range(datetime(2024, 1, 15), datetime(2024, 3, 1))
+    assert partitions == [(pd.Timestamp(2024, 1, 15), pd.Timestamp(2024, 3, 1))]
+
+
+def test_imbalance_prices_chunks(tmp_path):
+    local_db = LocalDatabase(tmp_path.joinpath("det.db"))
+    local_db.seed(nr_rows=100)
+    db = local_db.create_det_database()
+
+    # Replace imbalance prices by hourly prices, streamed in chunks ending with a single row
+    dates = pd.date_range("2000-01-01 00:00", periods=5, freq="h")
+    df_prices = pd.DataFrame(
+        {
+            "DateTime(UTC)": dates,
+            "MapCode": "DE_LU",
+            "PositiveImbalancePrice": range(5),
+            "NegativeImbalancePrice": range(5),
+            "Currency": "EUR",
+        }
+    )
+    with local_db.engine.begin() as conn:
+        df_prices.to_sql("ImbalancePrice", conn, schema="ENTSOE", if_exists="replace", index=False)
+
+    start, end = datetime(2000, 1, 1), datetime(2000, 1, 2)
+    chunks = list(
+        db.load_entsoe_imbalance_prices(
+            "GermanPower", start_delivery_date=start, end_delivery_date=end, chunksize=2
+        )
+    )
+    assert [c.shape[0] for c in chunks] == [2, 2, 1]
+    df = pd.concat(chunks, ignore_index=True)
+    pd.testing.assert_frame_equal(
+        df,
+        db.load_entsoe_imbalance_prices(
+            "GermanPower", start_delivery_date=start, end_delivery_date=end
+        ),
+    )
+    assert ((df["DeliveryEnd"] - df["DeliveryStart"]) == pd.Timedelta(hours=1)).all()
+
+
+@pytest.mark.parametrize(
+    "method_name, args, env_variable, dtypes",
+    [
+        (
+            "load_futures_eod_settlement_prices",
+            ("DutchPower", datetime(2000, 1, 10), datetime(2000, 1, 20), ["Month"], "Base"),
+            "DET_DB_COLUMNS_FUTURES_TT",
+            dict(TradingDate="datetime64[ns]", Tenor="category", SettlementPrice="float32"),
+        ),
+        (
+            "load_eex_eod_prices",
+            ("Q0BM", datetime(2000, 1, 10), datetime(2000, 1, 20)),
+            "DET_DB_COLUMNS_FUTURES_EEX",
+            {
+                "TradingDate": "datetime64[ns]",
+                "Product": "category",
+                "Settlement Price": "float32",
+            },
+        ),
+        (
+            "load_account_positions",
+            (datetime(2000, 1, 10), datetime(2000, 1, 20)),
+            "DET_DB_COLUMNS_ACCOUNT_POSITION",
+            dict(InsertionTimestamp="datetime64[ns]", InstrumentId="object", Position="int32"),
+        ),
+        (
+            "load_instruments",
+            (list(range(10)),),
+            "DET_DB_COLUMNS_INSTRUMENT",
+            dict(id="object"),
+        ),
+        (
+            "load_forecast_customer_volume",
+            (
+                "Portfolio",
+                datetime(2000, 1, 10),
+                datetime(2000, 1, 12),
+                datetime(2000, 1, 12),
+                "Europe/Amsterdam",
+            ),
+            "DET_DB_COLUMNS_CLIENT_VOLUME_FORECAST",
+            dict(Profile="category", Datetime="datetime64[ns]", kWh="float32"),
+        ),
+        (
+            "load_customer_day_ahead_auction_bids",
+            (1, datetime(2000, 1, 10), datetime(2000, 1, 20), "Europe/Amsterdam"),
+            "DET_DB_COLUMNS_CLIENT_DA_AUCTION_BIDS",
+            {
+                "ClientId": "int32",
+                "DeliveryStart": "datetime64[ns]",
+                "Volume(MWh)": "float32",
+                "Price(EUR/MWh)": "float32",
+            },
+        ),
+    ],
+)
+def test_loader_projection_and_downcast(
+    local_db, monkeypatch, method_name, args, env_variable, dtypes
+):
+    monkeypatch.setenv(env_variable, ",".join(dtypes.keys()))
+    db = local_db.create_det_database(downcast=True)
+    df = getattr(db, method_name)(*args)
+
+    # Only the projected columns are queried, and prices and volumes are downcast to float32
+    # Note: Volume forecast columns are renamed by the loader.
+    renamed = dict(kWh="Volume(MWh)", Datetime="DeliveryStart")
+    if method_name == "load_forecast_customer_volume":
+        dtypes = {renamed.get(c, c): t for c, t in dtypes.items()}
+    assert df.dtypes.astype(str).to_dict() == dtypes
+
+
+def test_local_database_dates(local_db):
+    # Dates are returned as datetime objects, like with the SQL Server ODBC driver
+    with local_db.engine.connect() as conn:
+        res = conn.exec_driver_sql("SELECT TradingDate, Tenor FROM [VW].[EODSettlementPrice]")
+        trading_date, tenor = res.fetchone()
+    assert isinstance(trading_date, datetime)
+    assert isinstance(tenor, str)
@@ -0,0 +1,123 @@
+"""
+Important notes:
+- Pytest requires test modules to follow the naming convention "test_*.py"
+- Pytest requires test functions to follow the naming convention "test_*()"
+"""
+
+# Python built-in packages
+import time
+
+# Third-party packages
+import pandas as pd
+
+# Internal modules
+from detquantlib.data import DetDatabase, QueryCache
+
+QUERY = "SELECT * FROM [ENTSOE].[DayAheadSpotPrice] WHERE MapCode='NL'"
+TABLE = "[ENTSOE].[DayAheadSpotPrice]"
+
+
+def make_df(nr_rows: int = 3) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "DateTime(UTC)": pd.date_range("2025-01-01", periods=nr_rows, freq="h"),
+            "Price(Currency/MWh)": [float(i) for i in range(nr_rows)],
+            "MapCode": ["NL"] * nr_rows,
+        }
+    )
+
+
+def test_query_cache_hit_and_miss(tmp_path):
+    cache = QueryCache(cache_dir=tmp_path)
+    df = make_df()
+
+    assert cache.get(QUERY, TABLE) is None
+    cache.put(QUERY, df, TABLE)
+
+    # Queries that only differ by whitespace share the same entry
+    res = cache.get(f"  {QUERY.replace(' ', '  ')}\n", TABLE)
+    pd.testing.assert_frame_equal(res, df)
+
+    # The table name is part of the key
+    assert cache.get(QUERY, "[ENTSOE].[ImbalancePrice]") is None
+
+    stats = cache.get_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 1)
+
+    # The cache index is persisted across instances
+    cache_reloaded = QueryCache(cache_dir=tmp_path)
+    pd.testing.assert_frame_equal(cache_reloaded.get(QUERY, TABLE), df)
+
+
+def test_query_cache_ttl(tmp_path):
+    cache = QueryCache(cache_dir=tmp_path, ttl=0.05)
+    cache.put(QUERY, make_df(), TABLE)
+    assert cache.get(QUERY, TABLE) is not None
+    time.sleep(0.1)
+    assert cache.get(QUERY, TABLE) is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_query_cache_lru_eviction(tmp_path):
+    cache = QueryCache(cache_dir=tmp_path)
+    for i in range(3):
+        cache.put(f"{QUERY} AND id={i}", make_df(), TABLE)
+    entry_size = cache.get_stats()["size"] // 3
+
+    # Access the first entry, such that the second entry becomes the least recently used
+    time.sleep(0.01)
+    cache.get(f"{QUERY} AND id=0", TABLE)
+
+    cache.max_size = 2 * entry_size
+    cache.put(f"{QUERY} AND id=3", make_df(), TABLE)
+
+    assert cache.get_stats()["entries"] == 2
+    assert cache.get(f"{QUERY} AND id=0", TABLE) is not None
+    assert cache.get(f"{QUERY} AND id=1", TABLE) is None
+    assert cache.get(f"{QUERY} AND id=3", TABLE) is not None
+
+
+def test_query_cache_invalidate(tmp_path):
+    cache = QueryCache(cache_dir=tmp_path)
+    cache.put(QUERY, make_df(), TABLE)
+    cache.put(QUERY, make_df(), "[ENTSOE].[ImbalancePrice]")
+
+    cache.invalidate(table=TABLE)
+    assert cache.get(QUERY, TABLE) is None
+    assert cache.get(QUERY, "[ENTSOE].[ImbalancePrice]") is not None
+
+    cache.clear()
+    assert cache.get_stats()["entries"] == 0
+    assert list(tmp_path.glob("*.parquet")) == []
+
+
+def test_query_db_with_cache(tmp_path, sqlite_engine):
+    pd.DataFrame({"x": [1, 2, 3]}).to_sql("data", sqlite_engine, index=False)
+
+    db = DetDatabase(
+        engine=sqlite_engine, query_cache=QueryCache(cache_dir=tmp_path.joinpath("cache"))
+    )
+    df_first = db.query_db("SELECT x FROM data", "data")
+    df_second = db.query_db("SELECT x FROM data", "data")
+
+    pd.testing.assert_frame_equal(df_first, df_second)
+    assert db.query_cache.get_stats()["hits"] == 1
+    assert db.query_cache.get_stats()["misses"] == 1
+
+
+def test_query_cache_hit_does_not_write_index(tmp_path):
+    cache = QueryCache(cache_dir=tmp_path)
+    cache.put(QUERY, make_df(), TABLE)
+    index_dir = tmp_path.joinpath("index.json")
+    mtime = index_dir.stat().st_mtime_ns
+
+    time.sleep(0.01)
+    for _ in range(3):
+        assert cache.get(QUERY, TABLE) is not None
+    assert index_dir.stat().st_mtime_ns == mtime
+
+    # Access times are persisted with the next change of the index
+    last_access = cache._index[QueryCache.make_key(QUERY, TABLE)]["last_access"]
+    cache.put(f"{QUERY} AND id=1", make_df(), TABLE)
+    cache_reloaded = QueryCache(cache_dir=tmp_path)
+    assert cache_reloaded._index[QueryCache.make_key(QUERY, TABLE)]["last_access"] == last_access
@@ -0,0 +1,170 @@
+"""
+Important notes:
+- Pytest requires test modules to follow the naming convention "test_*.py"
+- Pytest requires test functions to follow the naming convention "test_*()"
+"""
+
+# Python built-in packages
+from datetime import datetime
+
+# Third-party packages
+import pandas as pd
+
+# Internal modules
+from detquantlib.data import DetDatabase, RangeCache
+
+KEY = ("[ENTSOE].[ImbalancePrice]", "NL", "*")
+
+
+def make_df(start_date: str, end_date: str) -> pd.DataFrame:
+    dates = pd.date_range(start_date, end_date, freq="h", inclusive="left")
+    return pd.DataFrame({"DateTime(UTC)": dates, "Price": range(len(dates))})
+
+
+def test_range_cache_missing_intervals():
+    cache = RangeCache(settlement_lag=pd.Timedelta(0))
+    ts = pd.Timestamp
+
+    assert cache.get_missing_intervals(KEY, ts("2025-01-01"), ts("2025-01-10")) == [
+        (ts("2025-01-01"), ts("2025-01-10"))
+    ]
+
+    cache.add(
+        KEY,
+        ts("2025-01-03"),
+        ts("2025-01-05"),
+        make_df("2025-01-03", "2025-01-05"),
+        "DateTime(UTC)",
+    )
+    cache.add(
+        KEY,
+        ts("2025-01-07"),
+        ts("2025-01-08"),
+        make_df("2025-01-07", "2025-01-08"),
+        "DateTime(UTC)",
+    )
+
+    res = cache.get_missing_intervals(KEY, ts("2025-01-01"), ts("2025-01-10"))
+    expected = [
+        (ts("2025-01-01"), ts("2025-01-03")),
+        (ts("2025-01-05"), ts("2025-01-07")),
+        (ts("2025-01-08"), ts("2025-01-10")),
+    ]
+    assert res == expected
+
+    assert cache.get_missing_intervals(KEY, ts("2025-01-03"), ts("2025-01-05")) == []
+    assert cache.get(KEY, ts("2025-01-04"), ts("2025-01-08")).shape[0] == 48
+
+
+def test_range_cache_add_covered_interval():
+    cache = RangeCache(settlement_lag=pd.Timedelta(0))
+    ts = pd.Timestamp
+    df = make_df("2025-01-01", "2025-01-03")
+
+    # Adding an interval that is (partly) covered already only adds the missing rows
+    cache.add(KEY, ts("2025-01-01"), ts("2025-01-02"), df, "DateTime(UTC)")
+    cache.add(KEY, ts("2025-01-01"), ts("2025-01-02"), df, "DateTime(UTC)")
+    assert cache.get(KEY, ts("2025-01-01"), ts("2025-01-03")).shape[0] == 24
+    cache.add(KEY, ts("2025-01-01"), ts("2025-01-03"), df, "DateTime(UTC)")
+    res = cache.get(KEY, ts("2025-01-01"), ts("2025-01-03"))
+    assert res.shape[0] == 48
+    assert res["DateTime(UTC)"].is_unique
+
+
+def test_range_cache_max_size():
+    df = make_df("2025-01-01", "2025-01-02")
+    size = int(df.memory_usage(index=True).sum())
+    cache = RangeCache(settlement_lag=pd.Timedelta(0), max_size=2 * size)
+    keys = [(KEY[0], c) for c in ["NL", "BE", "FR"]]
+    for key in keys[:2]:
+        cache.add(key, pd.Timestamp("2025-01-01"), pd.Timestamp("2025-01-02"), df, "DateTime(UTC)")
+
+    # The least recently used entry is evicted when the maximum size is exceeded
+    assert cache.get(keys[0], "2025-01-01", "2025-01-02") is not None
+    cache.add(keys[2], pd.Timestamp("2025-01-01"), pd.Timestamp("2025-01-02"), df, "DateTime(UTC)")
+    assert cache.get(keys[1], "2025-01-01", "2025-01-02") is None
+    assert cache.get(keys[0], "2025-01-01", "2025-01-02").shape[0] == 24
+    assert cache.get(keys[2], "2025-01-01", "2025-01-02").shape[0] == 24
+
+
+def test_range_cache_settlement_lag():
+    cache = RangeCache(settlement_lag=pd.Timedelta(days=1))
+    today = pd.Timestamp.now(tz="UTC").tz_localize(None).floor("D")
+    start_date = today - pd.Timedelta(days=5)
+    end_date = today + pd.Timedelta(days=1)
+    cache.add(KEY, start_date, end_date, make_df(start_date, end_date), "DateTime(UTC)")
+
+    # Recent data is not considered settled, and is fetched again
+    missing = cache.get_missing_intervals(KEY, start_date, end_date)
+    assert len(missing) == 1
+    assert missing[0][1] == end_date
+    assert today - pd.Timedelta(days=2) < missing[0][0] <= today
+
+
+def test_query_db_date_range_with_range_cache(sqlite_engine, monkeypatch):
+    engine = sqlite_engine
+    df_all = make_df("2025-01-01", "2025-02-01")
+    df_all["MapCode"] = "NL"
+    df_all.to_sql("prices", engine, index=False)
+
+    db = DetDatabase(engine=engine, range_cache=RangeCache())
+    queries = list()
+    query_db = db.query_db
+    monkeypatch.setattr(
+        db, "query_db", lambda q, t=None, p=None: queries.append(p) or query_db(q, t, p)
+    )
+
+    def load(start_date: str, end_date: str) -> pd.DataFrame:
+        df = db.query_db_date_range(
+            query="SELECT * FROM prices WHERE MapCode='NL'",
+            table="prices",
+            date_column="DateTime(UTC)",
+            start_date=pd.Timestamp(start_date),
+            end_date=pd.Timestamp(end_date),
+            cache_key=("prices", "NL"),
+        )
+        df["DateTime(UTC)"] = pd.to_datetime(df["DateTime(UTC)"])
+        return df.sort_values("DateTime(UTC)", ignore_index=True)
+
+    load("2025-01-01", "2025-01-11")
+    res = load("2025-01-02", "2025-01-12")
+
+    # Second load only queries the missing day
+    assert len(queries) == 2
+    assert queries[1] == dict(start_date=datetime(2025, 1, 11), end_date=datetime(2025, 1, 12))
+    assert res.shape[0] == 10 * 24
+    assert res["DateTime(UTC)"].is_unique
+    assert res["DateTime(UTC)"].iloc[0] == pd.Timestamp("2025-01-02")
+
+
+def test_query_db_date_range_concurrent_add(sqlite_engine, monkeypatch):
+    engine = sqlite_engine
+    df_all = make_df("2025-01-01", "2025-01-03")
+    df_all["MapCode"] = "NL"
+    df_all.to_sql("prices", engine, index=False)
+
+    range_cache = RangeCache(settlement_lag=pd.Timedelta(0))
+    db = DetDatabase(engine=engine, range_cache=range_cache)
+    query_db = db.query_db
+
+    def query_db_concurrent_add(q, t=None, p=None):
+        # Another request caches the same interval while this request queries the database
+        df = query_db(q, t, p)
+        df["DateTime(UTC)"] = pd.to_datetime(df["DateTime(UTC)"])
+        range_cache.add(KEY, p["start_date"], p["end_date"], df, "DateTime(UTC)")
+        return df
+
+    monkeypatch.setattr(db, "query_db", query_db_concurrent_add)
+    kwargs = dict(
+        query="SELECT * FROM prices WHERE MapCode='NL'",
+        table="prices",
+        date_column="DateTime(UTC)",
+        start_date=pd.Timestamp("2025-01-01"),
+        end_date=pd.Timestamp("2025-01-03"),
+        cache_key=KEY,
+    )
+    res = db.query_db_date_range(**kwargs)
+    assert res.shape[0] == 48
+    res = db.query_db_date_range(**kwargs)
+    assert res.shape[0] == 48
+    assert pd.to_datetime(res["DateTime(UTC)"]).is_unique
@@ -0,0 +1,390 @@
+"""
+Important notes:
+- Pytest requires test modules to follow the naming convention "test_*.py"
+- Pytest requires test functions to follow the naming convention "test_*()"
+"""
+
+# Python built-in packages
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# Third-party packages
+import numpy as np
+import pandas as pd
+import pytest
+
+# Internal modules
+import detquantlib.data.entsoe.entsoe as entsoe_module
+from detquantlib.data import Entsoe, Sftp, SftpFileCache
+
+COUNTRIES = ["NL", "BE"]
+
+
+def make_sftp() -> Sftp:
+    return Sftp(hostname="sftp.test", port=22, username="user", password="pwd", retry_backoff=0)
+
+
+def add_entsoe_files(sftp_server, periods: list[tuple[int, int]], freq: str = "h"):
+    # Create hourly (or quarter-hourly) price data files, split by UTC month as on the ENTSOE
+    # SFTP server
+    folder_dir = sftp_server.get_path(Entsoe.get_sftp_folder_dir_day_ahead_spot_prices())
+    folder_dir.mkdir(parents=True, exist_ok=True)
+    for year, month in periods:
+        start = pd.Timestamp(year, month, 1)
+        dates = pd.date_range(start, start + pd.offsets.MonthBegin(1), freq=freq, inclusive="left")
+        df = pd.concat(
+            [
+                pd.DataFrame(
+                    {
+                        "DateTime(UTC)": dates.strftime("%Y-%m-%d %H:%M:%S"),
+                        "ResolutionCode": "PT15M" if freq == "15min" else "PT60M",
+                        "AreaCode": f"10Y{country}",
+                        "MapCode": country,
+                        "Price[Currency/MWh]": np.arange(len(dates)) * 1.5,
+                        "Currency": "EUR",
+                    }
+                )
+                for country in COUNTRIES
+            ]
+        )
+        filename = Entsoe.get_sftp_filename_day_ahead_spot_prices(year=year, month=month)
+        df.to_csv(folder_dir.joinpath(filename), sep="\t", index=False)
+
+
+def test_entsoe_session_reuse(sftp_server, tmp_path):
+    periods = [(2024, m) for m in range(1, 13)]
+    add_entsoe_files(sftp_server, periods)
+    entsoe = Entsoe(make_sftp())
+    entsoe.import_day_ahead_spot_prices_files_from_sftp(periods, str(tmp_path))
+    assert len(sftp_server.connections) == 1
+
+    with entsoe:
+        for year, month in periods:
+            entsoe.import_day_ahead_spot_prices_file_from_sftp(year, month, str(tmp_path))
+    assert len(sftp_server.connections) == 2
+
+
+def test_get_delivery_months():
+    # The first local hour of January is in the UTC file of December
+    res = Entsoe.get_delivery_months(
+        datetime(2024, 1, 1), datetime(2024, 3, 1), "Europe/Amsterdam"
+    )
+    assert res == [(2023, 12), (2024, 1), (2024, 2)]
+    res = Entsoe.get_delivery_months(datetime(2024, 1, 1), datetime(2024, 3, 1), "UTC")
+    assert res == [(2024, 1), (2024, 2)]
+    assert Entsoe.get_delivery_months(datetime(2024, 3, 1), datetime(2024, 3, 1), "UTC") == []
+
+
+@pytest.mark.parametrize("parse_workers", [1, 2])
+def test_get_day_ahead_spot_prices_range(sftp_server, tmp_path, monkeypatch, parse_workers):
+    monkeypatch.chdir(tmp_path)
+    timezone = "Europe/Amsterdam"
+    periods = [(2023, 12)] + [(2024, m) for m in range(1, 7)]
+    add_entsoe_files(sftp_server, periods)
+    entsoe = Entsoe(make_sftp())
+
+    df = entsoe.get_day_ahead_spot_prices_range_from_sftp(
+        "NL",
+        timezone,
+        datetime(2024, 1, 1),
+        datetime(2024, 7, 1),
+        download_workers=3,
+        parse_workers=parse_workers,
+    )
+    expected_dates = pd.date_range(
+        "2023-12-31 23:00", "2024-06-30 22:00", freq="h", inclusive="left", tz="UTC"
+    )
+    expected_dates = expected_dates.tz_convert(timezone).tz_localize(None)
+    assert df["DateTime(UTC)"].tolist() == expected_dates.tolist()
+    assert (df["MapCode"] == "NL").all()
+    assert df.columns.tolist() == Entsoe.get_day_ahead_spot_prices_columns()
+
+    # Downloads reuse at most 'download_workers' SFTP sessions
+    assert 1 <= len(sftp_server.connections) <= 3
+    assert not tmp_path.joinpath("Inputs").exists()
+
+    # Identical to the single-month method
+    df_month = entsoe.get_day_ahead_spot_prices_from_sftp("NL", timezone, 2024, 3)
+    df_range = entsoe.get_day_ahead_spot_prices_range_from_sftp(
+        "NL", timezone, df_month["DateTime(UTC)"].min(), datetime(2024, 4, 1, 2)
+    )
+    pd.testing.assert_frame_equal(df_range, df_month)
+
+
+def test_get_day_ahead_spot_prices_range_dst_fall_back(sftp_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    add_entsoe_files(sftp_server, [(2025, 9), (2025, 10)], freq="15min")
+    entsoe = Entsoe(make_sftp())
+
+    # The repeated local hour of the DST fall-back day keeps the delivery (UTC) order
+    df = entsoe.get_day_ahead_spot_prices_range_from_sftp(
+        "NL", "Europe/Amsterdam", datetime(2025, 10, 26), datetime(2025, 10, 27), parse_workers=1
+    )
+    expected_dates = pd.date_range(
+        "2025-10-25 22:00", "2025-10-26 23:00", freq="15min", inclusive="left", tz="UTC"
+    )
+    assert len(df) == 100
+    assert df["DateTime(UTC)"].tolist() == (
+        expected_dates.tz_convert("Europe/Amsterdam").tz_localize(None).tolist()
+    )
+    assert df["Price[Currency/MWh]"].is_monotonic_increasing
+    assert df["Price[Currency/MWh]"].diff().iloc[1:].eq(1.5).all()
+
+
+def test_get_day_ahead_spot_prices_range_timezone_aware_dates(sftp_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    add_entsoe_files(sftp_server, [(2023, 12), (2024, 1)])
+    entsoe = Entsoe(make_sftp())
+    timezones = ["Europe/Amsterdam", "UTC"]
+
+    # Timezone-aware dates are converted to the local time of each country
+    df = entsoe.get_day_ahead_spot_prices_range_from_sftp(
+        COUNTRIES,
+        timezones,
+        pd.Timestamp("2024-01-01", tz="UTC"),
+        pd.Timestamp("2024-01-02", tz="UTC"),
+        parse_workers=1,
+    )
+    for country, timezone in zip(COUNTRIES, timezones):
+        dates = df.loc[df["MapCode"] == country, "DateTime(UTC)"]
+        expected_dates = pd.date_range("2024-01-01", "2024-01-02", freq="h", inclusive="left")
+        expected_dates = expected_dates.tz_localize("UTC").tz_convert(timezone)
+        assert dates.tolist() == expected_dates.tz_localize(None).tolist()
+
+    # Timezone-naive and timezone-aware local dates are equivalent
+    df_naive = entsoe.get_day_ahead_spot_prices_range_from_sftp(
+        "NL", timezones[0], datetime(2024, 1, 1), datetime(2024, 1, 2), parse_workers=1
+    )
+    df_aware = entsoe.get_day_ahead_spot_prices_range_from_sftp(
+        "NL",
+        timezones[0],
+        pd.Timestamp("2024-01-01", tz=timezones[0]),
+        pd.Timestamp("2024-01-02", tz=timezones[0]),
+        parse_workers=1,
+    )
+    pd.testing.assert_frame_equal(df_aware, df_naive)
+
+
+def test_fetch_day_ahead_spot_prices_files_parse_pool(sftp_server, tmp_path, monkeypatch):
+    periods = [(2024, 1), (2024, 2)]
+    add_entsoe_files(sftp_server, periods)
+    monkeypatch.setattr(os, "cpu_count", lambda: 8)
+    executors = list()
+
+    class RecordedProcessPoolExecutor(ProcessPoolExecutor):
+        def __init__(self, max_workers: int, mp_context=None):
+            super().__init__(max_workers, mp_context=mp_context)
+            executors.append((max_workers, mp_context.get_start_method()))
+
+    monkeypatch.setattr(entsoe_module, "ProcessPoolExecutor", RecordedProcessPoolExecutor)
+    results, failures = Entsoe(make_sftp()).fetch_day_ahead_spot_prices_files(
+        "NL", "Europe/Amsterdam", periods, str(tmp_path)
+    )
+
+    # Parsing processes are spawned (not forked), and capped to the number of files
+    assert executors == [(2, "spawn")]
+    assert sorted(results.keys()) == periods
+    assert failures == dict()
+
+
+def test_get_day_ahead_spot_prices_range_failures(sftp_server, tmp_path, monkeypatch, caplog):
+    monkeypatch.chdir(tmp_path)
+    add_entsoe_files(sftp_server, [(2024, 1), (2024, 3)])
+    entsoe = Entsoe(make_sftp())
+    kwargs = dict(
+        country="BE",
+        timezone="UTC",
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 4, 1),
+        parse_workers=1,
+    )
+
+    filename = Entsoe.get_sftp_filename_day_ahead_spot_prices(year=2024, month=2)
+    with pytest.raises(RuntimeError, match=filename):
+        entsoe.get_day_ahead_spot_prices_range_from_sftp(**kwargs)
+
+    with caplog.at_level(logging.WARNING):
+        df = entsoe.get_day_ahead_spot_prices_range_from_sftp(**kwargs, errors="ignore")
+    assert filename in caplog.text
+    assert df["DateTime(UTC)"].dt.month.unique().tolist() == [1, 3]
+
+    with pytest.raises(ValueError):
+        entsoe.get_day_ahead_spot_prices_range_from_sftp(**kwargs, errors="skip")
+
+
+def test_read_day_ahead_spot_prices_multiple_countries(sftp_server, tmp_path):
+    add_entsoe_files(sftp_server, [(2024, 3)])
+    folder_dir = str(sftp_server.get_path(Entsoe.get_sftp_folder_dir_day_ahead_spot_prices()))
+    countries = ["BE", "NL", "XX"]
+    timezones = ["Europe/Brussels", "UTC", "UTC"]
+
+    df = Entsoe.read_day_ahead_spot_prices_from_file(countries, timezones, 2024, 3, folder_dir)
+    assert df["MapCode"].cat.categories.tolist() == countries
+    assert df["MapCode"].drop_duplicates().tolist() == ["BE", "NL"]
+
+    # Each country is identical to the single-country output, in its own timezone
+    dfs = Entsoe.read_day_ahead_spot_prices_from_file(
+        countries, timezones, 2024, 3, folder_dir, output_format="dict"
+    )
+    assert list(dfs.keys()) == countries
+    assert dfs["XX"].empty
+    for country, timezone in zip(countries[:2], timezones[:2]):
+        df_single = Entsoe.read_day_ahead_spot_prices_from_file(
+            country, timezone, 2024, 3, folder_dir
+        )
+        pd.testing.assert_frame_equal(dfs[country], df_single)
+
+    with pytest.raises(ValueError):
+        Entsoe.read_day_ahead_spot_prices_from_file(countries, timezones[:2], 2024, 3, folder_dir)
+
+
+def test_read_day_ahead_spot_prices_from_file_unsorted(sftp_server):
+    add_entsoe_files(sftp_server, [(2025, 10)], freq="15min")
+    folder_dir = sftp_server.get_path(Entsoe.get_sftp_folder_dir_day_ahead_spot_prices())
+    file_dir = folder_dir.joinpath(Entsoe.get_sftp_filename_day_ahead_spot_prices(2025, 10))
+    df_file = pd.read_csv(file_dir, sep="\t")
+    df_file.sample(frac=1, random_state=0).to_csv(file_dir, sep="\t", index=False)
+
+    # Rows are sorted by country and delivery (UTC) date, whatever the order in the file
+    df = Entsoe.read_day_ahead_spot_prices_from_file(
+        ["BE", "NL"], "Europe/Amsterdam", 2025, 10, str(folder_dir)
+    )
+    assert df["MapCode"].drop_duplicates().tolist() == ["BE", "NL"]
+    for _, df_country in df.groupby("MapCode", observed=True):
+        assert df_country["Price[Currency/MWh]"].diff().iloc[1:].eq(1.5).all()
+
+
+def test_get_day_ahead_spot_prices_range_multiple_countries(sftp_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    add_entsoe_files(sftp_server, [(2023, 12), (2024, 1), (2024, 2)])
+    entsoe = Entsoe(make_sftp())
+    kwargs = dict(start_date=datetime(2024, 1, 1), end_date=datetime(2024, 2, 1), parse_workers=1)
+
+    dfs = entsoe.get_day_ahead_spot_prices_range_from_sftp(
+        COUNTRIES, ["Europe/Amsterdam", "UTC"], output_format="dict", **kwargs
+    )
+    for country, timezone in zip(COUNTRIES, ["Europe/Amsterdam", "UTC"]):
+        df = entsoe.get_day_ahead_spot_prices_range_from_sftp(country, timezone, **kwargs)
+        pd.testing.assert_frame_equal(dfs[country], df)
+
+
+def test_get_day_ahead_spot_prices_file_cache(sftp_server, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    periods = [(2024, 1), (2024, 2), (2024, 3)]
+    add_entsoe_files(sftp_server, periods)
+    entsoe = Entsoe(make_sftp(), SftpFileCache(str(tmp_path.joinpath("cache"))))
+    kwargs = dict(
+        country="NL",
+        timezone="UTC",
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 4, 1),
+        parse_workers=1,
+    )
+
+    df = entsoe.get_day_ahead_spot_prices_range_from_sftp(**kwargs)
+    assert len(sftp_server.downloads) == 3
+
+    # Unchanged months are served from the cache
+    pd.testing.assert_frame_equal(entsoe.get_day_ahead_spot_prices_range_from_sftp(**kwargs), df)
+    entsoe.get_day_ahead_spot_prices_from_sftp("NL", "UTC", 2024, 2)
+    assert len(sftp_server.downloads) == 3
+
+    # Revised months are downloaded again
+    add_entsoe_files(sftp_server, [(2024, 3)])
+    folder_dir = sftp_server.get_path(Entsoe.get_sftp_folder_dir_day_ahead_spot_prices())
+    filename = Entsoe.get_sftp_filename_day_ahead_spot_prices(year=2024, month=3)
+    os.utime(folder_dir.joinpath(filename), (0, 0))
+    entsoe.get_day_ahead_spot_prices_range_from_sftp(**kwargs)
+    assert len(sftp_server.downloads) == 4
+    assert sftp_server.downloads[3].endswith(filename)
+
+
+@pytest.mark.parametrize("partition_by_map_code", [False, True])
+def test_day_ahead_spot_prices_dataset(sftp_server, tmp_path, monkeypatch, partition_by_map_code):
+    monkeypatch.chdir(tmp_path)
+    periods = [(2023, 12), (2024, 1), (2024, 2)]
+    add_entsoe_files(sftp_server, periods)
+    entsoe = Entsoe(make_sftp())
+    dataset_dir = str(tmp_path.joinpath("dataset"))
+    entsoe.ingest_day_ahead_spot_prices_from_sftp(periods, dataset_dir, partition_by_map_code)
+    assert tmp_path.joinpath("dataset", "year=2024", "month=1").exists()
+    assert tmp_path.joinpath("dataset", "year=2024", "month=1", "MapCode=NL").exists() == (
+        partition_by_map_code
+    )
+
+    # Reads from the dataset are identical to reads from the csv files
+    kwargs = dict(
+        country=COUNTRIES,
+        timezone=["Europe/Amsterdam", "UTC"],
+        start_date=datetime(2024, 1, 1),
+        end_date=datetime(2024, 2, 15),
+    )
+    df = Entsoe.read_day_ahead_spot_prices_from_dataset(**kwargs, dataset_dir=dataset_dir)
+    df_csv = entsoe.get_day_ahead_spot_prices_range_from_sftp(**kwargs, parse_workers=1)
+    pd.testing.assert_frame_equal(df, df_csv)
+
+    kwargs_aware = kwargs | dict(
+        start_date=pd.Timestamp("2024-01-01", tz="UTC"),
+        end_date=pd.Timestamp("2024-02-15", tz="UTC"),
+    )
+    df = Entsoe.read_day_ahead_spot_prices_from_dataset(**kwargs_aware, dataset_dir=dataset_dir)
+    df_csv_aware = entsoe.get_day_ahead_spot_prices_range_from_sftp(
+        **kwargs_aware, parse_workers=1
+    )
+    pd.testing.assert_frame_equal(df, df_csv_aware)
+    assert df.loc[df["MapCode"] == "NL", "DateTime(UTC)"].iloc[0] == pd.Timestamp(
+        "2024-01-01 01:00"
+    )
+
+    df = Entsoe.read_day_ahead_spot_prices_from_dataset(
+        "NL", "UTC", datetime(2030, 1, 1), datetime(2030, 2, 1), dataset_dir
+    )
+    assert df.empty
+    assert df.columns.tolist() == Entsoe.get_day_ahead_spot_prices_columns()
+
+    # Ingesting a month again replaces its data
+    entsoe.ingest_day_ahead_spot_prices_from_sftp([(2024, 1)], dataset_dir, partition_by_map_code)
+    df = Entsoe.read_day_ahead_spot_prices_from_dataset(**kwargs, dataset_dir=dataset_dir)
+    pd.testing.assert_frame_equal(df, df_csv)
+
+    # Map codes that are no longer in a re-ingested file are deleted from the dataset
+    folder_dir = sftp_server.get_path(Entsoe.get_sftp_folder_dir_day_ahead_spot_prices())
+    file_dir = folder_dir.joinpath(Entsoe.get_sftp_filename_day_ahead_spot_prices(2024, 1))
+    df_file = pd.read_csv(file_dir, sep="\t")
+    df_file.loc[df_file["MapCode"] == "NL"].to_csv(file_dir, sep="\t", index=False)
+    entsoe.ingest_day_ahead_spot_prices_from_sftp([(2024, 1)], dataset_dir, partition_by_map_code)
+    df = Entsoe.read_day_ahead_spot_prices_from_dataset(
+        "BE", "UTC", datetime(2024, 1, 1), datetime(2024, 2, 1), dataset_dir
+    )
+    assert df.empty
+
+    with pytest.raises(RuntimeError):
+        entsoe.ingest_day_ahead_spot_prices_from_sftp([(2025, 1)], dataset_dir)
+
+
+@pytest.mark.parametrize("partition_by_map_code", [False, True])
+def test_day_ahead_spot_prices_dataset_dst_fall_back(
+    sftp_server, tmp_path, monkeypatch, partition_by_map_code
+):
+    monkeypatch.chdir(tmp_path)
+    periods = [(2025, 9), (2025, 10)]
+    add_entsoe_files(sftp_server, periods, freq="15min")
+    dataset_dir = str(tmp_path.joinpath("dataset"))
+    Entsoe(make_sftp()).ingest_day_ahead_spot_prices_from_sftp(
+        periods, dataset_dir, partition_by_map_code
+    )
+
+    # The repeated local hour of the DST fall-back day keeps the delivery (UTC) order
+    df = Entsoe.read_day_ahead_spot_prices_from_dataset(
+        COUNTRIES, "Europe/Amsterdam", datetime(2025, 10, 26), datetime(2025, 10, 27), dataset_dir
+    )
+    expected_dates = pd.date_range(
+        "2025-10-25 22:00", "2025-10-26 23:00", freq="15min", inclusive="left", tz="UTC"
+    )
+    expected_dates = expected_dates.tz_convert("Europe/Amsterdam").tz_localize(None).tolist()
+    assert df["MapCode"].tolist() == ["NL"] * 100 + ["BE"] * 100
+    assert df["DateTime(UTC)"].tolist() == expected_dates * 2
+    for _, df_country in df.groupby("MapCode", observed=True):
+        assert df_country["Price[Currency/MWh]"].diff().iloc[1:].eq(1.5).all()
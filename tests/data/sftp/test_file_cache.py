@@ -0,0 +1,87 @@
+"""
+Important notes:
+- Pytest requires test modules to follow the naming convention "test_*.py"
+- Pytest requires test functions to follow the naming convention "test_*()"
+"""
+
+# Python built-in packages
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Internal modules
+from detquantlib.data import Sftp, SftpFileCache
+
+
+def make_sftp() -> Sftp:
+    return Sftp(hostname="sftp.test", port=22, username="user", password="pwd")
+
+
+def write_remote_file(sftp_server, name: str, content: str, mtime: int):
+    file_dir = sftp_server.get_path(name)
+    file_dir.write_text(content)
+    os.utime(file_dir, (mtime, mtime))
+
+
+def test_file_cache_revisions(sftp_server, tmp_path):
+    cache = SftpFileCache(str(tmp_path.joinpath("cache")))
+    sftp = make_sftp()
+    write_remote_file(sftp_server, "a.csv", "a1", 1_000)
+
+    # Unchanged files are only downloaded once
+    local_dir = tmp_path.joinpath("a.csv")
+    file_dir = cache.get_file(sftp, "/a.csv", str(local_dir))
+    assert cache.get_file(sftp, "//a.csv", str(local_dir)) == file_dir
+    assert sftp_server.downloads == ["/a.csv"]
+    assert local_dir.read_text() == "a1"
+    assert not sftp.is_active()
+
+    # Revised files are downloaded again, and replace the outdated version
+    write_remote_file(sftp_server, "a.csv", "a2", 2_000)
+    with sftp:
+        new_file_dir = cache.get_file(sftp, "/a.csv", str(local_dir))
+        assert sftp.is_active()
+    assert new_file_dir != file_dir
+    assert cache.get_files() == [new_file_dir]
+    assert local_dir.read_text() == "a2"
+    assert len(sftp_server.downloads) == 2
+
+
+def test_file_cache_eviction(sftp_server, tmp_path):
+    cache = SftpFileCache(str(tmp_path.joinpath("cache")), max_size=25)
+    sftp = make_sftp()
+    for name in ["a", "b", "c"]:
+        write_remote_file(sftp_server, f"{name}.csv", name * 10, 1_000)
+
+    file_dir_a = cache.get_file(sftp, "/a.csv")
+    os.utime(file_dir_a, (1, 1))
+    file_dir_b = cache.get_file(sftp, "/b.csv")
+    os.utime(file_dir_b, (2, 2))
+
+    # Using a file marks it as recently used
+    cache.get_file(sftp, "/a.csv")
+    file_dir_c = cache.get_file(sftp, "/c.csv")
+    assert sorted(cache.get_files()) == sorted([file_dir_a, file_dir_c])
+    assert cache.get_size() == 20
+
+    cache.clear()
+    assert cache.get_files() == []
+
+
+def test_file_cache_concurrent_eviction(sftp_server, tmp_path):
+    # The cache only fits one file, such that each download evicts the other file
+    cache = SftpFileCache(str(tmp_path.joinpath("cache")), max_size=15)
+    for name in ["a", "b"]:
+        write_remote_file(sftp_server, f"{name}.csv", name * 10, 1_000)
+
+    def get_files(thread_id: int):
+        with make_sftp() as sftp:
+            for i in range(50):
+                name = "ab"[(thread_id + i) % 2]
+                local_dir = tmp_path.joinpath(f"{name}_{thread_id}.csv")
+                cache.get_file(sftp, f"/{name}.csv", str(local_dir))
+                assert local_dir.read_text() == name * 10
+
+    # Cache hits never race with the eviction of the file by another thread
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(get_files, range(4)))
+    assert len(cache.get_files()) == 1
@@ -0,0 +1,95 @@
+"""
+Important notes:
+- Pytest requires test modules to follow the naming convention "test_*.py"
+- Pytest requires test functions to follow the naming convention "test_*()"
+"""
+
+# Python built-in packages
+from concurrent.futures import ThreadPoolExecutor
+
+# Third-party packages
+import paramiko
+import pytest
+
+# Internal modules
+from detquantlib.data import Sftp, SftpPool
+
+
+def make_sftp(**kwargs) -> Sftp:
+    return Sftp(hostname="sftp.test", port=22, username="user", password="pwd", **kwargs)
+
+
+def test_sftp_context_manager(sftp_server, tmp_path):
+    sftp_server.get_path("a.csv").write_text("a")
+    sftp = make_sftp()
+    with sftp:
+        with sftp:
+            sftp.get_file("/a.csv", str(tmp_path.joinpath("a1.csv")))
+        assert sftp.is_active()
+        sftp.get_file("/a.csv", str(tmp_path.joinpath("a2.csv")))
+    assert not sftp.is_active()
+    assert len(sftp_server.connections) == 1
+    assert sftp_server.connections[0].keepalive == 30
+    assert tmp_path.joinpath("a2.csv").read_text() == "a"
+
+
+def test_sftp_reconnect(sftp_server, tmp_path):
+    sftp_server.get_path("a.csv").write_text("a")
+    with make_sftp(retry_backoff=0) as sftp:
+        sftp_server.fail_next_transfer = True
+        sftp.get_file("/a.csv", str(tmp_path.joinpath("a.csv")))
+    assert len(sftp_server.connections) == 2
+    assert tmp_path.joinpath("a.csv").read_text() == "a"
+
+    # Errors that are not caused by a lost connection are not retried
+    with make_sftp(retry_backoff=0) as sftp:
+        with pytest.raises(FileNotFoundError):
+            sftp.get_file("/missing.csv", str(tmp_path.joinpath("missing.csv")))
+    assert len(sftp_server.connections) == 3
+
+
+def test_sftp_private_key(sftp_server, tmp_path, monkeypatch):
+    key = object()
+    monkeypatch.setattr(paramiko.PKey, "from_path", lambda path, passphrase=None: key)
+    sftp = make_sftp(
+        private_key_dir=str(tmp_path.joinpath("id")), authentication_type="private_key"
+    )
+    with sftp:
+        pass
+    assert sftp_server.connections[0].credentials["pkey"] is key
+
+
+def test_sftp_pool(sftp_server, tmp_path):
+    names = [f"{i}.csv" for i in range(8)]
+    for name in names:
+        sftp_server.get_path(name).write_text(name)
+
+    def download(pool: SftpPool, name: str):
+        with pool.session() as sftp:
+            sftp.get_file(f"/{name}", str(tmp_path.joinpath(name)))
+
+    with SftpPool(max_size=2, hostname="sftp.test", port=22, username="user") as pool:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda name: download(pool, name), names))
+    assert 1 <= len(sftp_server.connections) <= 2
+    assert not any(c.is_active() for c in sftp_server.connections)
+    assert all(tmp_path.joinpath(name).read_text() == name for name in names)
+
+
+def test_sftp_pool_close_with_loaned_session(sftp_server):
+    pool = SftpPool(max_size=2, hostname="sftp.test", port=22, username="user")
+    with pool.session() as sftp_loaned:
+        with pool.session():
+            pass
+        pool.close()
+
+        # Idle sessions are closed immediately, and loaned sessions once released
+        assert sum(c.is_active() for c in sftp_server.connections) == 1
+        assert sftp_loaned.is_active()
+    assert not sftp_loaned.is_active()
+    assert not any(c.is_active() for c in sftp_server.connections)
+
+    # Closed pools do not lend sessions
+    with pytest.raises(RuntimeError, match="closed SFTP pool"):
+        with pool.session():
+            pass
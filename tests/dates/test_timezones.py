@@ -0,0 +1,72 @@
+"""
+Important notes:
+- Pytest requires test modules to follow the naming convention "test_*.py"
+- Pytest requires test functions to follow the naming convention "test_*()"
+"""
+
+# Third-party packages
+import numpy as np
+import pandas as pd
+import pytest
+
+# Internal modules
+from detquantlib.dates import convert_timezone, convert_timezones, get_utc_offsets
+
+
+@pytest.mark.parametrize(
+    "timezone", ["Europe/Amsterdam", "Europe/London", "America/New_York", "Asia/Kolkata", "UTC"]
+)
+def test_convert_timezone_from_utc(timezone):
+    rng = np.random.default_rng(0)
+    values = rng.integers(
+        pd.Timestamp("1950-01-01").value, pd.Timestamp("2100-01-01").value, 10_000
+    )
+    dates = pd.Series(pd.to_datetime(values).floor("s"))
+    # Add DST transitions and missing values
+    dates = pd.concat(
+        [
+            dates,
+            pd.Series(pd.date_range("2024-10-27", periods=16, freq="15min")),
+            pd.Series([pd.NaT]),
+        ],
+        ignore_index=True,
+    )
+    dates_aware = dates.dt.tz_localize("UTC").dt.tz_convert(timezone)
+
+    res = convert_timezone(dates, "UTC", timezone)
+    pd.testing.assert_series_equal(res, dates_aware.dt.tz_localize(None))
+
+    res = convert_timezone(dates, "UTC", timezone, timezone_aware=True)
+    pd.testing.assert_series_equal(res, dates_aware)
+
+
+def test_get_utc_offsets():
+    transitions, offsets = get_utc_offsets("Europe/Amsterdam")
+    idx = np.flatnonzero(transitions == np.datetime64("2024-10-27T01:00:00"))
+    assert len(idx) == 1
+    assert offsets[idx[0] - 1] == np.timedelta64(2, "h")
+    assert offsets[idx[0]] == np.timedelta64(1, "h")
+
+
+def test_convert_timezones():
+    timezone = "Europe/Amsterdam"
+    df = pd.DataFrame(
+        {
+            "TradingDate": [pd.Timestamp(2024, 3, 30).date(), pd.Timestamp(2024, 3, 31).date()],
+            "DeliveryStart": pd.to_datetime(["2024-03-31 00:00", "2024-03-31 01:00"]),
+            "Price": [1.0, 2.0],
+        }
+    )
+
+    # Dates in local timezone are only converted from datetime.date to pd.Timestamp
+    df_res = convert_timezones(df.copy(), ["TradingDate", "Missing"], timezone)
+    assert df_res["TradingDate"].tolist() == [pd.Timestamp(2024, 3, 30), pd.Timestamp(2024, 3, 31)]
+
+    # UTC dates are converted to the local timezone
+    df_res = convert_timezones(df.copy(), ["DeliveryStart"], "UTC", timezone)
+    assert df_res["DeliveryStart"].tolist() == [
+        pd.Timestamp(2024, 3, 31, 1),
+        pd.Timestamp(2024, 3, 31, 3),
+    ]
+    df_res = convert_timezones(df.copy(), ["TradingDate"], timezone, timezone_aware=True)
+    assert str(df_res["TradingDate"].dt.tz) == timezone